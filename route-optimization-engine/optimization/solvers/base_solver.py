@@ -13,12 +13,32 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Sequence, Set
 
+import numpy as np
+
+from optimization.utils.constraints import (
+    build_feasibility_matrix,
+    check_skill_match,
+    to_epoch_seconds,
+)
 from optimization.utils.distance import estimate_travel_time, haversine_distance
+from optimization.utils.skills import build_skill_index, encode_skill_masks
 
 logger = logging.getLogger(__name__)
 
+# Stand-ins for a missing time bound: an open start or end never prunes a pair.
+_MIN_EPOCH = np.iinfo(np.int64).min
+_MAX_EPOCH = np.iinfo(np.int64).max
+
+
+def _epoch_array(values: List[Optional[datetime]], missing: int) -> np.ndarray:
+    """Convert optional datetimes to int64 epoch seconds, filling ``None``."""
+    return np.array(
+        [missing if v is None else to_epoch_seconds(v) for v in values],
+        dtype=np.int64,
+    )
+
 
 @dataclass
 class RouteStop:
@@ -108,8 +128,10 @@ class BaseSolver(ABC):
             ``id``, ``name``, ``skills`` (list[str]), ``home_lat``,
             ``home_lng``, ``max_hours`` (float), ``shift_start`` (datetime),
             ``shift_end`` (datetime).
-        distance_matrix: Pre-computed NxN distance matrix (miles). Index 0..T-1
-            are technician home bases; T..T+W-1 are work order locations.
+        distance_matrix: Pre-computed NxN distance matrix (miles), as an
+            ndarray or nested lists. Index 0..T-1 are technician home bases;
+            T..T+W-1 are work order locations. Stored as an ndarray and
+            indexed ``distance_matrix[i, j]``.
         config: Optional solver configuration overrides.
 
     Raises:
@@ -143,7 +165,7 @@ class BaseSolver(ABC):
         self,
         work_orders: List[Dict[str, Any]],
         technicians: List[Dict[str, Any]],
-        distance_matrix: List[List[float]],
+        distance_matrix: Sequence[Sequence[float]] | np.ndarray,
         config: Optional[Dict[str, Any]] = None,
     ) -> None:
         self.work_orders = work_orders
@@ -152,6 +174,59 @@ class BaseSolver(ABC):
         self.config = config or {}
         self._validate_inputs()
 
+        # Validation runs on the raw input so ragged nested lists are reported
+        # row by row; afterwards keep a contiguous float matrix.
+        matrix = np.asarray(distance_matrix)
+        if matrix.dtype.kind != "f":
+            matrix = matrix.astype(np.float64)
+        self.distance_matrix = matrix
+
+        # Skills are fixed for the lifetime of the solver; encode them once as
+        # bitmasks so a skill check in the search loops is ``req & ~tech``.
+        self._skill_index = build_skill_index(
+            [s for tech in technicians for s in tech.get("skills", ())]
+            + [s for wo in work_orders for s in wo.get("required_skills", ())]
+        )
+        tech_masks = encode_skill_masks(
+            [tech.get("skills", ()) for tech in technicians], self._skill_index
+        )
+        wo_masks = encode_skill_masks(
+            [wo.get("required_skills", ()) for wo in work_orders], self._skill_index
+        )
+        self._tech_skill_masks: List[int] = tech_masks.tolist()
+        self._wo_skill_masks: List[int] = wo_masks.tolist()
+
+        # Time bounds as epoch seconds, so the search loops compare and add
+        # plain numbers instead of doing datetime/timedelta arithmetic. A
+        # missing bound becomes an open sentinel.
+        wo_tw_start = _epoch_array(
+            [wo.get("time_window_start") for wo in work_orders], _MIN_EPOCH
+        )
+        wo_tw_end = _epoch_array(
+            [wo.get("time_window_end") for wo in work_orders], _MAX_EPOCH
+        )
+        tech_shift_start = _epoch_array(
+            [t.get("shift_start") for t in technicians], _MIN_EPOCH
+        )
+        tech_shift_end = _epoch_array(
+            [t.get("shift_end") for t in technicians], _MAX_EPOCH
+        )
+        self._wo_tw_start_s: List[int] = wo_tw_start.tolist()
+        self._wo_tw_end_s: List[int] = wo_tw_end.tolist()
+        self._tech_shift_start_s: List[int] = tech_shift_start.tolist()
+        self._tech_shift_end_s: List[int] = tech_shift_end.tolist()
+
+        # Prune pairs that can never work (missing skill, or a time window
+        # entirely outside the shift) before any per-stop check runs.
+        self._feasibility: np.ndarray = build_feasibility_matrix(
+            tech_masks,
+            wo_masks,
+            wo_tw_start,
+            wo_tw_end,
+            tech_shift_start,
+            tech_shift_end,
+        )
+
     @abstractmethod
     def solve(self) -> OptimizationResult:
         """Run the optimization algorithm and return routes.
@@ -230,9 +305,9 @@ class BaseSolver(ABC):
         Returns:
             True if the technician possesses all required skills.
         """
-        required = set(work_order.get("required_skills", []))
-        available = set(technician.get("skills", []))
-        return required.issubset(available)
+        return check_skill_match(
+            technician.get("skills", ()), work_order.get("required_skills", ())
+        )
 
     def _calculate_route_metrics(
         self, route_stops: List[RouteStop]
@@ -10,6 +10,7 @@ constraint violations while minimizing total travel distance.
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import random
 from copy import deepcopy
 from dataclasses import dataclass, field
@@ -22,7 +23,7 @@ from optimization.solvers.base_solver import (
     RouteStop,
     TechnicianRoute,
 )
-from optimization.utils.constraints import check_daily_limit, check_skill_match
+from optimization.utils.constraints import check_daily_limit
 from optimization.utils.distance import estimate_travel_time
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,13 @@ _SKILL_VIOLATION_PENALTY = 500.0
 _TIME_WINDOW_VIOLATION_PENALTY = 200.0
 _CAPACITY_VIOLATION_PENALTY = 300.0
 
+# Generations each island evolves independently between migrations.
+_DEFAULT_MIGRATION_INTERVAL = 10
+
+# Smallest sub-population worth its own process; smaller islands lose
+# diversity faster than parallelism pays back.
+_MIN_ISLAND_SIZE = 10
+
 
 @dataclass
 class Chromosome:
@@ -67,6 +75,16 @@ class GeneticSolver(BaseSolver):
         tournament_size (int): Tournament selection pool. Default 5.
         seed (int): Random seed for reproducibility. Default None.
         avg_speed_mph (float): Average travel speed. Default 30.
+        parallel_islands (int): Number of sub-populations evolved in
+            separate processes (island model). The population budget is
+            split across islands and the best individual of each island
+            migrates to its neighbour every ``migration_interval``
+            generations. Each island needs at least 10 individuals, so the
+            count is capped at ``population_size // 10`` (a warning is
+            logged when the cap applies). Default 1 (single population, no
+            processes).
+        migration_interval (int): Generations between migrations when
+            ``parallel_islands`` > 1. Default 10.
     """
 
     def solve(self) -> OptimizationResult:
@@ -86,42 +104,115 @@ class GeneticSolver(BaseSolver):
         tournament_size = self.config.get("tournament_size", 5)
         seed = self.config.get("seed", None)
         avg_speed = self.config.get("avg_speed_mph", 30.0)
-
-        if seed is not None:
-            random.seed(seed)
+        requested_islands = self.config.get("parallel_islands", 1)
+        islands = max(1, min(requested_islands, pop_size // _MIN_ISLAND_SIZE))
+        if islands < requested_islands:
+            logger.warning(
+                "parallel_islands=%d capped to %d: each island needs at least "
+                "%d of the population_size=%d individuals.",
+                requested_islands,
+                islands,
+                _MIN_ISLAND_SIZE,
+                pop_size,
+            )
 
         num_orders = len(self.work_orders)
         num_technicians = len(self.technicians)
 
         logger.info(
             "GeneticSolver starting: pop=%d, gens=%d, mutation=%.2f, "
-            "elite=%d, orders=%d, technicians=%d.",
+            "elite=%d, islands=%d, orders=%d, technicians=%d.",
             pop_size,
             generations,
             mutation_rate,
             elite_size,
+            islands,
             num_orders,
             num_technicians,
         )
 
-        # Build feasibility mask for skill checking
+        # Skill and time-window feasibility, precomputed by BaseSolver
         feasible = self._build_feasibility_mask()
 
-        # Initialize population
-        population = self._initialize_population(
-            pop_size, num_orders, num_technicians, feasible
-        )
+        if islands > 1:
+            best, convergence_history = self._solve_islands(
+                islands,
+                pop_size,
+                generations,
+                mutation_rate,
+                elite_size,
+                tournament_size,
+                seed,
+                avg_speed,
+                feasible,
+            )
+        else:
+            if seed is not None:
+                random.seed(seed)
 
-        # Evaluate initial fitness
-        for chromo in population:
-            chromo.fitness = self._evaluate_fitness(chromo, avg_speed)
+            # Initialize population
+            population = self._initialize_population(
+                pop_size, num_orders, num_technicians, feasible
+            )
 
-        population.sort(key=lambda c: c.fitness)
-        convergence_history: List[float] = [population[0].fitness]
+            # Evaluate initial fitness
+            for chromo in population:
+                chromo.fitness = self._evaluate_fitness(chromo, avg_speed)
 
-        logger.debug("Initial best fitness: %.2f", population[0].fitness)
+            population.sort(key=lambda c: c.fitness)
+            convergence_history = [population[0].fitness]
+
+            logger.debug("Initial best fitness: %.2f", population[0].fitness)
+
+            population, history = self._evolve(
+                population,
+                generations,
+                pop_size,
+                elite_size,
+                tournament_size,
+                mutation_rate,
+                feasible,
+                avg_speed,
+            )
+            convergence_history.extend(history)
+            best = population[0]
+
+        logger.info("GA converged. Best fitness: %.2f", best.fitness)
+
+        result = self._decode_solution(best, avg_speed, convergence_history)
+        result.metadata["parallel_islands"] = islands
+        return result
+
+    def _evolve(
+        self,
+        population: List[Chromosome],
+        generations: int,
+        pop_size: int,
+        elite_size: int,
+        tournament_size: int,
+        mutation_rate: float,
+        feasible: List[List[bool]],
+        avg_speed: float,
+    ) -> Tuple[List[Chromosome], List[float]]:
+        """Run the generational loop on a fitness-sorted population.
+
+        Args:
+            population: Initial population, evaluated and sorted by fitness.
+            generations: Number of generations to run.
+            pop_size: Target population size.
+            elite_size: Number of elites carried forward each generation.
+            tournament_size: Tournament selection pool.
+            mutation_rate: Per-gene mutation probability.
+            feasible: Technician x work order feasibility mask.
+            avg_speed: Average travel speed (mph).
+
+        Returns:
+            Tuple of the final sorted population and the best fitness
+            recorded after each generation.
+        """
+        num_technicians = len(self.technicians)
+        history: List[float] = []
 
-        # Evolution loop
         for gen in range(generations):
             new_population: List[Chromosome] = []
 
@@ -148,7 +239,7 @@ class GeneticSolver(BaseSolver):
 
             population = new_population
             population.sort(key=lambda c: c.fitness)
-            convergence_history.append(population[0].fitness)
+            history.append(population[0].fitness)
 
             if (gen + 1) % 100 == 0:
                 logger.debug(
@@ -158,10 +249,127 @@ class GeneticSolver(BaseSolver):
                     population[0].fitness,
                 )
 
-        best = population[0]
-        logger.info("GA converged. Best fitness: %.2f", best.fitness)
+        return population, history
 
-        return self._decode_solution(best, avg_speed, convergence_history)
+    # ------------------------------------------------------------------
+    # Island model
+    # ------------------------------------------------------------------
+
+    def _solve_islands(
+        self,
+        islands: int,
+        pop_size: int,
+        generations: int,
+        mutation_rate: float,
+        elite_size: int,
+        tournament_size: int,
+        seed: Optional[int],
+        avg_speed: float,
+        feasible: List[List[bool]],
+    ) -> Tuple[Chromosome, List[float]]:
+        """Evolve ``islands`` sub-populations in parallel worker processes.
+
+        The population and elite budgets are split across islands, with any
+        remainder going to the first islands. Each island lives in its own
+        long-lived worker process for the whole run, so the solver is
+        pickled once per worker and only migrants and per-generation best
+        fitness cross process boundaries. Islands evolve independently for
+        ``migration_interval`` generations, then each island's best
+        individual replaces the worst individual of the next island (ring
+        topology). Island ``i`` is seeded with ``seed + i`` and re-seeded
+        per epoch, so results depend only on the seed and the island count,
+        not on process scheduling.
+
+        Args:
+            islands: Number of islands (worker processes).
+            pop_size: Total population size across all islands.
+            generations: Number of generations to run.
+            mutation_rate: Per-gene mutation probability.
+            elite_size: Total number of elites across all islands.
+            tournament_size: Tournament selection pool.
+            seed: Base random seed, or None for non-deterministic runs.
+            avg_speed: Average travel speed (mph).
+            feasible: Technician x work order feasibility mask.
+
+        Returns:
+            Tuple of the best chromosome across all islands and the best
+            fitness per generation (initial population first).
+        """
+        interval = max(
+            1, self.config.get("migration_interval", _DEFAULT_MIGRATION_INTERVAL)
+        )
+
+        # Spawn rather than fork: forking after Numba/OpenMP worker threads
+        # have started (e.g. by build_distance_matrix) can deadlock.
+        ctx = multiprocessing.get_context("spawn")
+        conns = []
+        procs = []
+        try:
+            for i in range(islands):
+                island_pop = pop_size // islands + (i < pop_size % islands)
+                island_elite = elite_size // islands + (i < elite_size % islands)
+                parent_conn, child_conn = ctx.Pipe()
+                proc = ctx.Process(
+                    target=_island_worker,
+                    args=(
+                        child_conn,
+                        self,
+                        None if seed is None else seed + i,
+                        island_pop,
+                        max(1, min(island_elite, island_pop - 1)),
+                        tournament_size,
+                        mutation_rate,
+                        feasible,
+                        avg_speed,
+                    ),
+                    daemon=True,
+                )
+                proc.start()
+                child_conn.close()
+                conns.append(parent_conn)
+                procs.append(proc)
+
+            bests: List[Chromosome] = [conn.recv() for conn in conns]
+            convergence_history = [min(best.fitness for best in bests)]
+
+            done = 0
+            epoch = 0
+            while done < generations:
+                span = min(interval, generations - done)
+                epoch += 1
+                for i, conn in enumerate(conns):
+                    conn.send(
+                        (
+                            span,
+                            None if seed is None else seed + epoch * islands + i,
+                            # Ring migration: island i receives the best of
+                            # island i-1 from the previous epoch.
+                            bests[i - 1] if epoch > 1 else None,
+                        )
+                    )
+                outcomes = [conn.recv() for conn in conns]
+
+                bests = [best for best, _ in outcomes]
+                for gen in range(span):
+                    convergence_history.append(
+                        min(history[gen] for _, history in outcomes)
+                    )
+                done += span
+
+            for conn in conns:
+                conn.send(None)
+            for proc in procs:
+                proc.join()
+        finally:
+            for proc in procs:
+                if proc.is_alive():
+                    proc.terminate()
+                    proc.join()
+            for conn in conns:
+                conn.close()
+
+        best = min(bests, key=lambda c: c.fitness)
+        return best, convergence_history
 
     # ------------------------------------------------------------------
     # Population initialization
@@ -176,13 +384,13 @@ class GeneticSolver(BaseSolver):
     ) -> List[Chromosome]:
         """Create the initial random population.
 
-        Assignments prefer skill-feasible technicians when available.
+        Assignments prefer feasible technicians when available.
 
         Args:
             pop_size: Number of individuals.
             num_orders: Number of work orders.
             num_technicians: Number of technicians.
-            feasible: Skill-feasibility mask.
+            feasible: Technician x work order feasibility mask.
 
         Returns:
             List of randomly initialized Chromosomes.
@@ -225,6 +433,8 @@ class GeneticSolver(BaseSolver):
             Fitness score.
         """
         num_technicians = len(self.technicians)
+        tw_starts = self._wo_tw_start_s
+        tw_ends = self._wo_tw_end_s
         total_distance = 0.0
         penalty = 0.0
 
@@ -236,11 +446,16 @@ class GeneticSolver(BaseSolver):
 
         for v_idx, wo_indices in tech_orders.items():
             tech = self.technicians[v_idx]
+            tech_mask = self._tech_skill_masks[v_idx]
             max_hours = tech.get("max_hours", 8.0)
-            shift_start = tech.get("shift_start")
-            shift_end = tech.get("shift_end")
+            shift_end_s = self._tech_shift_end_s[v_idx]
             current_node = v_idx
-            current_time = shift_start
+            # Epoch seconds; None skips time checks when there is no shift start
+            current_s: Optional[float] = (
+                self._tech_shift_start_s[v_idx]
+                if tech.get("shift_start") is not None
+                else None
+            )
             used_hours = 0.0
 
             for wo_idx in wo_indices:
@@ -248,32 +463,32 @@ class GeneticSolver(BaseSolver):
                 wo_node = wo_idx + num_technicians
 
                 # Skill violation
-                if not self._check_skill_match(tech, wo):
+                if self._wo_skill_masks[wo_idx] & ~tech_mask:
                     penalty += _SKILL_VIOLATION_PENALTY
 
                 # Travel
-                dist = self.distance_matrix[current_node][wo_node]
+                dist = self.distance_matrix.item(current_node, wo_node)
                 travel_min = estimate_travel_time(dist, avg_speed)
                 service_min = wo.get("duration_minutes", 0)
                 total_distance += dist
 
                 # Time window violation
-                if current_time is not None:
-                    arrival = current_time + timedelta(minutes=travel_min)
-                    tw_start = wo.get("time_window_start")
-                    tw_end = wo.get("time_window_end")
+                if current_s is not None:
+                    arrival = current_s + travel_min * 60.0
+                    tw_start = tw_starts[wo_idx]
+                    tw_end = tw_ends[wo_idx]
 
-                    if tw_start and arrival < tw_start:
+                    if arrival < tw_start:
                         arrival = tw_start  # Wait
-                    if tw_end and arrival > tw_end:
-                        over_min = (arrival - tw_end).total_seconds() / 60.0
+                    if arrival > tw_end:
+                        over_min = (arrival - tw_end) / 60.0
                         penalty += _TIME_WINDOW_VIOLATION_PENALTY * (over_min / 60.0)
 
-                    current_time = arrival + timedelta(minutes=service_min)
+                    current_s = arrival + service_min * 60.0
 
                     # Shift end violation
-                    if shift_end and current_time > shift_end:
-                        over_min = (current_time - shift_end).total_seconds() / 60.0
+                    if current_s > shift_end_s:
+                        over_min = (current_s - shift_end_s) / 60.0
                         penalty += _CAPACITY_VIOLATION_PENALTY * (over_min / 60.0)
 
                 used_hours += (travel_min + service_min) / 60.0
@@ -399,7 +614,7 @@ class GeneticSolver(BaseSolver):
             chromo: Chromosome to mutate.
             mutation_rate: Per-gene mutation probability.
             num_technicians: Number of technicians.
-            feasible: Skill-feasibility mask.
+            feasible: Technician x work order feasibility mask.
         """
         n = len(chromo.assignments)
 
@@ -473,10 +688,10 @@ class GeneticSolver(BaseSolver):
                 wo_node = wo_idx + num_technicians
 
                 # Skip infeasible assignments in final decode
-                if not self._check_skill_match(tech, wo):
+                if self._wo_skill_masks[wo_idx] & ~self._tech_skill_masks[v_idx]:
                     continue
 
-                dist = self.distance_matrix[current_node][wo_node]
+                dist = self.distance_matrix.item(current_node, wo_node)
                 travel_min = estimate_travel_time(dist, avg_speed)
                 service_min = wo.get("duration_minutes", 0)
 
@@ -573,11 +788,63 @@ class GeneticSolver(BaseSolver):
     # ------------------------------------------------------------------
 
     def _build_feasibility_mask(self) -> List[List[bool]]:
-        """Build a technician x work_order feasibility matrix."""
-        return [
-            [
-                check_skill_match(tech.get("skills", []), wo.get("required_skills", []))
-                for wo in self.work_orders
-            ]
-            for tech in self.technicians
-        ]
+        """Build a technician x work_order feasibility matrix.
+
+        A pair is feasible when the technician has every required skill
+        and the order's time window overlaps the technician's shift.
+        """
+        return self._feasibility.tolist()
+
+
+def _island_worker(
+    conn: Any,
+    solver: GeneticSolver,
+    seed: Optional[int],
+    pop_size: int,
+    elite_size: int,
+    tournament_size: int,
+    mutation_rate: float,
+    feasible: List[List[bool]],
+    avg_speed: float,
+) -> None:
+    """Worker process owning one island for the whole run.
+
+    Module-level so it can be pickled by :mod:`multiprocessing`. Sends the
+    best chromosome of the initial population, then answers each
+    ``(generations, seed, migrant)`` message by inserting the migrant (if
+    any) in place of the worst individual, evolving for ``generations``
+    and replying with the island's best chromosome and its history.
+    ``None`` ends the worker.
+    """
+    if seed is not None:
+        random.seed(seed)
+    population = solver._initialize_population(
+        pop_size, len(solver.work_orders), len(solver.technicians), feasible
+    )
+    for chromo in population:
+        chromo.fitness = solver._evaluate_fitness(chromo, avg_speed)
+    population.sort(key=lambda c: c.fitness)
+    conn.send(population[0])
+
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        generations, epoch_seed, migrant = message
+        if migrant is not None:
+            population[-1] = migrant
+            population.sort(key=lambda c: c.fitness)
+        if epoch_seed is not None:
+            random.seed(epoch_seed)
+        population, history = solver._evolve(
+            population,
+            generations,
+            pop_size,
+            elite_size,
+            tournament_size,
+            mutation_rate,
+            feasible,
+            avg_speed,
+        )
+        conn.send((population[0], history))
+    conn.close()
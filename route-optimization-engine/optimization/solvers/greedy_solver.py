@@ -18,7 +18,10 @@ from optimization.solvers.base_solver import (
     RouteStop,
     TechnicianRoute,
 )
-from optimization.utils.constraints import check_daily_limit, check_skill_match
+from optimization.utils.constraints import (
+    check_daily_limit,
+    check_time_window_epoch,
+)
 from optimization.utils.distance import estimate_travel_time
 
 logger = logging.getLogger(__name__)
@@ -135,16 +138,20 @@ class GreedySolver(BaseSolver):
             Completed TechnicianRoute for this technician.
         """
         num_technicians = len(self.technicians)
+        feasible = self._feasibility[v_idx].tolist()
+        tw_starts = self._wo_tw_start_s
+        tw_ends = self._wo_tw_end_s
         max_hours = tech.get("max_hours", 8.0)
         shift_start: datetime = tech.get("shift_start")
-        shift_end: datetime = tech.get("shift_end")
+        shift_start_s = self._tech_shift_start_s[v_idx]
+        shift_end_s = self._tech_shift_end_s[v_idx]
 
         stops: List[RouteStop] = []
         route_distance = 0.0
         route_duration = 0.0
         route_work_time = 0.0
         current_node = v_idx  # Start at home depot
-        current_time = shift_start
+        current_s: float = shift_start_s  # Epoch seconds
         used_hours = 0.0
         seq = 0
 
@@ -159,15 +166,15 @@ class GreedySolver(BaseSolver):
                 if wo_idx in assigned:
                     continue
 
+                # --- Skill match & window/shift overlap (precomputed) ---
+                if not feasible[wo_idx]:
+                    continue
+
                 wo = self.work_orders[wo_idx]
                 wo_node = wo_idx + num_technicians
 
-                # --- Skill check ---
-                if not self._check_skill_match(tech, wo):
-                    continue
-
                 # --- Distance & travel time ---
-                dist = self.distance_matrix[current_node][wo_node]
+                dist = self.distance_matrix.item(current_node, wo_node)
                 travel_min = estimate_travel_time(dist, avg_speed)
                 service_min = wo.get("duration_minutes", 0)
                 additional_hours = (travel_min + service_min) / 60.0
@@ -177,24 +184,23 @@ class GreedySolver(BaseSolver):
                     continue
 
                 # --- Time window feasibility ---
-                proposed_arrival = current_time + timedelta(minutes=travel_min)
-                tw_start = wo.get("time_window_start")
-                tw_end = wo.get("time_window_end")
+                proposed_arrival = current_s + travel_min * 60.0
+                tw_start = tw_starts[wo_idx]
+                tw_end = tw_ends[wo_idx]
 
-                if tw_start and proposed_arrival < tw_start:
+                if proposed_arrival < tw_start:
                     # We can wait, but check if we can still fit
-                    wait_min = (tw_start - proposed_arrival).total_seconds() / 60.0
+                    wait_min = (tw_start - proposed_arrival) / 60.0
                     total_added = (travel_min + wait_min + service_min) / 60.0
                     if not check_daily_limit(used_hours, max_hours, total_added):
                         continue
                     proposed_arrival = tw_start
 
-                if tw_end and proposed_arrival > tw_end:
+                if not check_time_window_epoch(proposed_arrival, tw_start, tw_end):
                     continue  # Cannot arrive in time
 
                 # --- Shift end check ---
-                proposed_departure = proposed_arrival + timedelta(minutes=service_min)
-                if shift_end and proposed_departure > shift_end:
+                if proposed_arrival + service_min * 60.0 > shift_end_s:
                     continue
 
                 # --- Nearest neighbor selection ---
@@ -223,18 +229,13 @@ class GreedySolver(BaseSolver):
 
                 wo = self.work_orders[best_wo_idx]
                 wo_node = best_wo_idx + num_technicians
-                dist = self.distance_matrix[current_node][wo_node]
+                dist = self.distance_matrix.item(current_node, wo_node)
                 travel_min = estimate_travel_time(dist, avg_speed)
                 service_min = wo.get("duration_minutes", 0)
 
-                proposed_arrival = current_time + timedelta(minutes=travel_min)
-                tw_start = wo.get("time_window_start")
-
                 # Wait if arriving early
-                if tw_start and proposed_arrival < tw_start:
-                    proposed_arrival = tw_start
-
-                departure = proposed_arrival + timedelta(minutes=service_min)
+                arrival_s = max(current_s + travel_min * 60.0, tw_starts[best_wo_idx])
+                departure_s = arrival_s + service_min * 60.0
 
                 stop = RouteStop(
                     work_order_id=wo["id"],
@@ -242,8 +243,10 @@ class GreedySolver(BaseSolver):
                     lat=wo["lat"],
                     lng=wo["lng"],
                     sequence=seq,
-                    arrival_time=proposed_arrival,
-                    departure_time=departure,
+                    arrival_time=shift_start
+                    + timedelta(seconds=arrival_s - shift_start_s),
+                    departure_time=shift_start
+                    + timedelta(seconds=departure_s - shift_start_s),
                     travel_distance=round(dist, 2),
                     travel_duration=round(travel_min, 2),
                 )
@@ -254,7 +257,7 @@ class GreedySolver(BaseSolver):
                 route_work_time += service_min
                 used_hours = (route_duration + route_work_time) / 60.0
                 current_node = wo_node
-                current_time = departure
+                current_s = departure_s
                 seq += 1
 
         total_hours = (route_duration + route_work_time) / 60.0
@@ -19,7 +19,6 @@ from optimization.solvers.base_solver import (
     RouteStop,
     TechnicianRoute,
 )
-from optimization.utils.constraints import check_skill_match
 from optimization.utils.distance import estimate_travel_time
 
 logger = logging.getLogger(__name__)
@@ -95,7 +94,8 @@ class VRPSolver(BaseSolver):
         )
 
         # -----------------------------------------------------------------
-        # Build skill-feasibility mask: which technician can do which order
+        # Feasibility mask: which technician can do which order, by skill
+        # and by time window against the shift
         # -----------------------------------------------------------------
         feasible = self._build_feasibility_mask()
 
@@ -116,7 +116,7 @@ class VRPSolver(BaseSolver):
         def distance_callback(from_index: int, to_index: int) -> int:
             from_node = manager.IndexToNode(from_index)
             to_node = manager.IndexToNode(to_index)
-            return int(self.distance_matrix[from_node][to_node] * _DISTANCE_SCALE)
+            return int(self.distance_matrix.item(from_node, to_node) * _DISTANCE_SCALE)
 
         transit_cb_index = routing.RegisterTransitCallback(distance_callback)
         routing.SetArcCostEvaluatorOfAllVehicles(transit_cb_index)
@@ -127,7 +127,7 @@ class VRPSolver(BaseSolver):
         def time_callback(from_index: int, to_index: int) -> int:
             from_node = manager.IndexToNode(from_index)
             to_node = manager.IndexToNode(to_index)
-            dist = self.distance_matrix[from_node][to_node]
+            dist = self.distance_matrix.item(from_node, to_node)
             travel_min = estimate_travel_time(dist, avg_speed)
             # Add service time at the destination if it is a work order
             service_min = 0
@@ -267,18 +267,16 @@ class VRPSolver(BaseSolver):
     def _build_feasibility_mask(self) -> List[List[bool]]:
         """Build a technician x work_order feasibility matrix.
 
+        A pair is feasible when the technician has every required skill
+        and the order's time window overlaps the technician's shift, so
+        orders that could never be served in time are pruned from the
+        vehicle's allowed set as well as skill mismatches.
+
         Returns:
             2D list where ``mask[v][w]`` is True if technician v can
             perform work order w.
         """
-        mask: List[List[bool]] = []
-        for tech in self.technicians:
-            row = [
-                check_skill_match(tech.get("skills", []), wo.get("required_skills", []))
-                for wo in self.work_orders
-            ]
-            mask.append(row)
-        return mask
+        return self._feasibility.tolist()
 
     def _parse_solution(
         self,
@@ -330,7 +328,7 @@ class VRPSolver(BaseSolver):
 
                 if 0 <= wo_idx < len(self.work_orders):
                     wo = self.work_orders[wo_idx]
-                    dist = self.distance_matrix[prev_node][node]
+                    dist = self.distance_matrix.item(prev_node, node)
                     travel_min = estimate_travel_time(dist, avg_speed)
                     service_min = wo.get("duration_minutes", 0)
 
@@ -12,38 +12,56 @@ Run with::
 
 from __future__ import annotations
 
-import sys
-from datetime import datetime, timedelta
+from datetime import datetime
+from types import SimpleNamespace
 from typing import Any, Dict, List
 
+import numpy as np
 import pytest
 
-from optimization.solvers.base_solver import (
-    BaseSolver,
-    OptimizationResult,
-    RouteStop,
-    TechnicianRoute,
-)
+from optimization.solvers.base_solver import OptimizationResult
 from optimization.solvers.genetic_solver import GeneticSolver
 from optimization.solvers.greedy_solver import GreedySolver
+from optimization.solvers.vrp_solver import VRPSolver
+from optimization.utils import constraints as constraints_module
+from optimization.utils import distance as distance_module
 from optimization.utils.constraints import (
+    build_feasibility_matrix,
     check_daily_limit,
     check_skill_match,
     check_time_window,
+    check_time_window_epoch,
+    prepare_route,
+    prepare_technician,
+    prepare_work_orders,
+    to_epoch_seconds,
     validate_route,
 )
 from optimization.utils.distance import (
     build_distance_matrix,
+    build_distance_matrix_cached,
+    build_distance_matrix_condensed,
     build_duration_matrix,
+    condensed_get,
+    condensed_to_square,
     estimate_travel_time,
     haversine_distance,
+    location_key,
+    route_distance,
+)
+from optimization.utils.skills import (
+    build_skill_index,
+    encode_skill_masks,
+    encode_skills,
 )
 
 # ---------------------------------------------------------------------------
 # Constants for the test scenario
 # ---------------------------------------------------------------------------
-_SHIFT_START = datetime(2026, 2, 12, 8, 0, 0)
-_SHIFT_END = datetime(2026, 2, 12, 17, 0, 0)
+# On-the-hour timestamps for the scenario day, built once at import
+_HOURS = {h: datetime(2026, 2, 12, h, 0) for h in range(8, 18)}
+_SHIFT_START = _HOURS[8]
+_SHIFT_END = _HOURS[17]
 
 # Denver metro area coordinates for realistic distances
 _DENVER_LOCATIONS = {
@@ -135,7 +153,6 @@ def technicians() -> List[Dict[str, Any]]:
 @pytest.fixture
 def work_orders() -> List[Dict[str, Any]]:
     """Fifteen work orders spread across Denver metro with varied requirements."""
-    base_date = _SHIFT_START.date()
     orders = [
         {
             "id": "WO-001",
@@ -145,8 +162,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "emergency",
             "required_skills": ["electrical"],
             "duration_minutes": 60,
-            "time_window_start": datetime(2026, 2, 12, 8, 0),
-            "time_window_end": datetime(2026, 2, 12, 10, 0),
+            "time_window_start": _HOURS[8],
+            "time_window_end": _HOURS[10],
         },
         {
             "id": "WO-002",
@@ -156,8 +173,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "high",
             "required_skills": ["plumbing"],
             "duration_minutes": 45,
-            "time_window_start": datetime(2026, 2, 12, 8, 0),
-            "time_window_end": datetime(2026, 2, 12, 12, 0),
+            "time_window_start": _HOURS[8],
+            "time_window_end": _HOURS[12],
         },
         {
             "id": "WO-003",
@@ -167,8 +184,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "medium",
             "required_skills": ["general_maintenance"],
             "duration_minutes": 30,
-            "time_window_start": datetime(2026, 2, 12, 9, 0),
-            "time_window_end": datetime(2026, 2, 12, 15, 0),
+            "time_window_start": _HOURS[9],
+            "time_window_end": _HOURS[15],
         },
         {
             "id": "WO-004",
@@ -178,8 +195,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "low",
             "required_skills": ["inspection"],
             "duration_minutes": 30,
-            "time_window_start": datetime(2026, 2, 12, 8, 0),
-            "time_window_end": datetime(2026, 2, 12, 17, 0),
+            "time_window_start": _HOURS[8],
+            "time_window_end": _HOURS[17],
         },
         {
             "id": "WO-005",
@@ -189,8 +206,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "high",
             "required_skills": ["electrical", "plumbing"],
             "duration_minutes": 90,
-            "time_window_start": datetime(2026, 2, 12, 10, 0),
-            "time_window_end": datetime(2026, 2, 12, 14, 0),
+            "time_window_start": _HOURS[10],
+            "time_window_end": _HOURS[14],
         },
         {
             "id": "WO-006",
@@ -200,8 +217,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "medium",
             "required_skills": ["hvac"],
             "duration_minutes": 60,
-            "time_window_start": datetime(2026, 2, 12, 8, 0),
-            "time_window_end": datetime(2026, 2, 12, 16, 0),
+            "time_window_start": _HOURS[8],
+            "time_window_end": _HOURS[16],
         },
         {
             "id": "WO-007",
@@ -211,8 +228,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "low",
             "required_skills": ["general_maintenance"],
             "duration_minutes": 45,
-            "time_window_start": datetime(2026, 2, 12, 9, 0),
-            "time_window_end": datetime(2026, 2, 12, 17, 0),
+            "time_window_start": _HOURS[9],
+            "time_window_end": _HOURS[17],
         },
         {
             "id": "WO-008",
@@ -222,8 +239,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "high",
             "required_skills": ["plumbing"],
             "duration_minutes": 60,
-            "time_window_start": datetime(2026, 2, 12, 8, 0),
-            "time_window_end": datetime(2026, 2, 12, 13, 0),
+            "time_window_start": _HOURS[8],
+            "time_window_end": _HOURS[13],
         },
         {
             "id": "WO-009",
@@ -233,8 +250,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "emergency",
             "required_skills": ["electrical"],
             "duration_minutes": 45,
-            "time_window_start": datetime(2026, 2, 12, 8, 0),
-            "time_window_end": datetime(2026, 2, 12, 10, 0),
+            "time_window_start": _HOURS[8],
+            "time_window_end": _HOURS[10],
         },
         {
             "id": "WO-010",
@@ -244,8 +261,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "medium",
             "required_skills": ["inspection"],
             "duration_minutes": 30,
-            "time_window_start": datetime(2026, 2, 12, 10, 0),
-            "time_window_end": datetime(2026, 2, 12, 16, 0),
+            "time_window_start": _HOURS[10],
+            "time_window_end": _HOURS[16],
         },
         {
             "id": "WO-011",
@@ -255,8 +272,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "low",
             "required_skills": ["general_maintenance"],
             "duration_minutes": 30,
-            "time_window_start": datetime(2026, 2, 12, 8, 0),
-            "time_window_end": datetime(2026, 2, 12, 17, 0),
+            "time_window_start": _HOURS[8],
+            "time_window_end": _HOURS[17],
         },
         {
             "id": "WO-012",
@@ -266,8 +283,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "medium",
             "required_skills": ["hvac"],
             "duration_minutes": 60,
-            "time_window_start": datetime(2026, 2, 12, 11, 0),
-            "time_window_end": datetime(2026, 2, 12, 16, 0),
+            "time_window_start": _HOURS[11],
+            "time_window_end": _HOURS[16],
         },
         {
             "id": "WO-013",
@@ -277,8 +294,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "high",
             "required_skills": ["plumbing", "general_maintenance"],
             "duration_minutes": 75,
-            "time_window_start": datetime(2026, 2, 12, 9, 0),
-            "time_window_end": datetime(2026, 2, 12, 14, 0),
+            "time_window_start": _HOURS[9],
+            "time_window_end": _HOURS[14],
         },
         {
             "id": "WO-014",
@@ -288,8 +305,8 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "low",
             "required_skills": ["inspection"],
             "duration_minutes": 30,
-            "time_window_start": datetime(2026, 2, 12, 8, 0),
-            "time_window_end": datetime(2026, 2, 12, 17, 0),
+            "time_window_start": _HOURS[8],
+            "time_window_end": _HOURS[17],
         },
         {
             "id": "WO-015",
@@ -299,15 +316,15 @@ def work_orders() -> List[Dict[str, Any]]:
             "priority": "medium",
             "required_skills": ["general_maintenance"],
             "duration_minutes": 45,
-            "time_window_start": datetime(2026, 2, 12, 8, 0),
-            "time_window_end": datetime(2026, 2, 12, 17, 0),
+            "time_window_start": _HOURS[8],
+            "time_window_end": _HOURS[17],
         },
     ]
     return orders
 
 
 @pytest.fixture
-def distance_matrix(technicians, work_orders) -> List[List[float]]:
+def distance_matrix(technicians, work_orders) -> np.ndarray:
     """Build a distance matrix from technician homes + work order locations."""
     locations: List[Dict[str, float]] = []
 
@@ -319,7 +336,71 @@ def distance_matrix(technicians, work_orders) -> List[List[float]]:
     for wo in work_orders:
         locations.append({"lat": wo["lat"], "lng": wo["lng"]})
 
-    return build_distance_matrix(locations)
+    return build_distance_matrix_cached(location_key(locations))
+
+
+def _epoch_seconds(values: List[datetime]) -> np.ndarray:
+    """Convert naive datetimes to int64 seconds since the Unix epoch."""
+    return np.array(values, dtype="datetime64[s]").astype(np.int64)
+
+
+@pytest.fixture
+def work_orders_soa(work_orders, technicians) -> SimpleNamespace:
+    """Parallel NumPy arrays mirroring the ``work_orders``/``technicians`` dicts.
+
+    Timestamps are int64 epoch seconds (minutes would hide sub-minute
+    arrival overruns) and skills are bitmasks over the sorted union of all
+    skill names, so route checks can run as vectorized comparisons.
+    """
+    index = build_skill_index(
+        [s for t in technicians for s in t["skills"]]
+        + [s for wo in work_orders for s in wo["required_skills"]]
+    )
+
+    return SimpleNamespace(
+        wo_index={wo["id"]: i for i, wo in enumerate(work_orders)},
+        wo_lat=np.array([wo["lat"] for wo in work_orders]),
+        wo_lng=np.array([wo["lng"] for wo in work_orders]),
+        wo_duration=np.array([wo["duration_minutes"] for wo in work_orders]),
+        wo_tw_start_epoch=_epoch_seconds(
+            [wo["time_window_start"] for wo in work_orders]
+        ),
+        wo_tw_end_epoch=_epoch_seconds([wo["time_window_end"] for wo in work_orders]),
+        wo_skill_mask=encode_skill_masks(
+            [wo["required_skills"] for wo in work_orders], index
+        ),
+        tech_index={t["id"]: i for i, t in enumerate(technicians)},
+        tech_max_hours=np.array([t["max_hours"] for t in technicians]),
+        tech_skill_mask=encode_skill_masks([t["skills"] for t in technicians], index),
+    )
+
+
+def _ortools_available() -> bool:
+    """Check if ortools is installed."""
+    try:
+        from ortools.constraint_solver import pywrapcp
+
+        return True
+    except ImportError:
+        return False
+
+
+@pytest.fixture
+def ga_config() -> Dict[str, Any]:
+    """Reduced GA parameters for faster test execution."""
+    return {
+        "population_size": 30,
+        "generations": 50,
+        "mutation_rate": 0.15,
+        "elite_size": 5,
+        "seed": 42,
+        "parallel_islands": 1,
+    }
+
+
+@pytest.fixture
+def vrp_config() -> Dict[str, Any]:
+    return {"time_limit_seconds": 10}
 
 
 # ---------------------------------------------------------------------------
@@ -339,6 +420,26 @@ class TestDistanceUtils:
         dist = haversine_distance(39.7392, -104.9903, 39.7294, -104.8319)
         assert 8.0 < dist < 12.0
 
+    def test_haversine_antipodal(self):
+        """Antipodal points give half the circumference, not a domain error."""
+        dist = haversine_distance(0.0, 0.0, 0.0, 180.0)
+        assert dist == pytest.approx(3958.8 * np.pi, rel=1e-3)
+        matrix = build_distance_matrix(
+            [{"lat": 0.0, "lng": 0.0}, {"lat": 0.0, "lng": 180.0}]
+        )
+        assert matrix[0, 1] == pytest.approx(dist)
+
+    def test_compiled_haversine_matches_python(self):
+        """The optional Cython haversine agrees with the Python version."""
+        if haversine_distance is distance_module._haversine_distance_py:
+            pytest.skip("_haversine extension not built")
+        points = list(_DENVER_LOCATIONS.values())
+        for a, b in zip(points, points[1:] + points[:1]):
+            args = (a["lat"], a["lng"], b["lat"], b["lng"])
+            assert haversine_distance(*args) == pytest.approx(
+                distance_module._haversine_distance_py(*args), rel=1e-12
+            )
+
     def test_build_distance_matrix_symmetric(self):
         """Distance matrix should be symmetric."""
         locs = [
@@ -346,10 +447,8 @@ class TestDistanceUtils:
             {"lat": 39.80, "lng": -105.09},
             {"lat": 39.58, "lng": -104.88},
         ]
-        matrix = build_distance_matrix(locs)
-        for i in range(3):
-            for j in range(3):
-                assert matrix[i][j] == pytest.approx(matrix[j][i], abs=1e-6)
+        arr = np.asarray(build_distance_matrix(locs))
+        np.testing.assert_allclose(arr, arr.T, atol=1e-6)
 
     def test_build_distance_matrix_diagonal_zero(self):
         """Diagonal entries should be zero."""
@@ -358,6 +457,75 @@ class TestDistanceUtils:
         assert matrix[0][0] == 0.0
         assert matrix[1][1] == 0.0
 
+    def test_build_distance_matrix_float32(self):
+        """The dtype kwarg trades precision for a smaller matrix."""
+        locs = [{"lat": 39.74, "lng": -104.99}, {"lat": 39.80, "lng": -105.09}]
+        matrix64 = build_distance_matrix(locs)
+        matrix32 = build_distance_matrix(locs, dtype=np.float32)
+        assert matrix64.dtype == np.float64
+        assert matrix32.dtype == np.float32
+        np.testing.assert_allclose(matrix32, matrix64, rtol=1e-6)
+
+    def test_numba_kernel_matches_numpy(self, monkeypatch):
+        """The optional Numba kernel agrees with the NumPy fallback."""
+        if distance_module._haversine_matrix_numba is None:
+            pytest.skip("numba not installed")
+        locs = [{"lat": v["lat"], "lng": v["lng"]} for v in _DENVER_LOCATIONS.values()]
+        compiled = build_distance_matrix(locs)
+
+        monkeypatch.setattr(distance_module, "_haversine_matrix_numba", None)
+        np.testing.assert_allclose(compiled, build_distance_matrix(locs), atol=1e-4)
+
+    def test_tiled_fallback_matches_scalar(self, monkeypatch):
+        """Blocks mirrored across tile boundaries match the scalar formula."""
+        monkeypatch.setattr(distance_module, "_haversine_matrix_numba", None)
+        monkeypatch.setattr(distance_module, "_TILE", 3)
+        locs = list(_DENVER_LOCATIONS.values()) * 2
+        matrix = build_distance_matrix(locs)
+        expected = [
+            [haversine_distance(a["lat"], a["lng"], b["lat"], b["lng"]) for b in locs]
+            for a in locs
+        ]
+        np.testing.assert_allclose(matrix, expected, atol=1e-9)
+
+    def test_route_distance(self):
+        locs = list(_DENVER_LOCATIONS.values())[:4]
+        matrix = build_distance_matrix(locs)
+        legs = [matrix[0, 2], matrix[2, 1], matrix[1, 3]]
+        assert route_distance(matrix, [0, 2, 1, 3]) == pytest.approx(sum(legs))
+        assert route_distance(matrix, [1]) == 0.0
+        assert route_distance(matrix, []) == 0.0
+
+    def test_build_distance_matrix_cached(self):
+        locs = list(_DENVER_LOCATIONS.values())[:5]
+        build_distance_matrix_cached.cache_clear()
+        first = build_distance_matrix_cached(location_key(locs))
+        noisy = [{"lat": v["lat"] + 1e-9, "lng": v["lng"]} for v in locs]
+        assert build_distance_matrix_cached(location_key(noisy)) is first
+        assert build_distance_matrix_cached.cache_info().hits == 1
+        assert not first.flags.writeable
+        np.testing.assert_allclose(first, build_distance_matrix(locs), atol=1e-9)
+
+    def test_condensed_matrix_matches_square(self):
+        locs = list(_DENVER_LOCATIONS.values())
+        n = len(locs)
+        square = build_distance_matrix(locs)
+        condensed = build_distance_matrix_condensed(locs)
+        assert condensed.shape == (n * (n - 1) // 2,)
+        np.testing.assert_allclose(condensed_to_square(condensed), square, atol=1e-9)
+        for i, j in [(0, 1), (3, 0), (n - 2, n - 1), (5, 5)]:
+            assert condensed_get(condensed, i, j, n) == pytest.approx(square[i, j])
+
+    def test_condensed_matrix_small_inputs(self):
+        assert build_distance_matrix_condensed([]).shape == (0,)
+        one = build_distance_matrix_condensed([{"lat": 39.7, "lng": -105.0}])
+        assert condensed_to_square(one).shape == (1, 1)
+        with pytest.raises(ValueError, match="not n\\*"):
+            condensed_to_square(np.zeros(4))
+
+    def test_build_distance_matrix_empty(self):
+        assert build_distance_matrix([]).shape == (0, 0)
+
     def test_build_distance_matrix_missing_key(self):
         """Should raise ValueError for missing lat/lng."""
         with pytest.raises(ValueError, match="missing 'lat' or 'lng'"):
@@ -371,6 +539,13 @@ class TestDistanceUtils:
         assert dur_matrix[1][0] == 60.0
         assert dur_matrix[0][0] == 0.0
 
+    def test_build_duration_matrix_leaves_input_untouched(self):
+        dist = np.array([[0.0, 1.234567], [1.234567, 0.0]])
+        dur = build_duration_matrix(dist, avg_speed_mph=45.0)
+        assert dur is not dist
+        assert dist[0, 1] == 1.234567
+        assert dur[0, 1] == round(1.234567 * 60.0 / 45.0, 2)
+
     def test_build_duration_invalid_speed(self):
         """Should raise ValueError for non-positive speed."""
         with pytest.raises(ValueError):
@@ -401,30 +576,121 @@ class TestConstraintUtils:
         """No required skills means any technician qualifies."""
         assert check_skill_match(["plumbing"], [])
 
+    def test_skill_match_prepared_technician(self, technicians):
+        """A prepared technician's frozenset gives the same answer as its list."""
+        tech = technicians[0]
+        prepared = prepare_technician(tech)
+        assert prepared["skills_set"] == frozenset(tech["skills"])
+        assert "skills_set" not in tech
+        for required in (["electrical"], ["plumbing"], frozenset(tech["skills"])):
+            assert check_skill_match(
+                prepared["skills_set"], required
+            ) == check_skill_match(tech["skills"], required)
+
+    def test_encode_skills_bits(self):
+        index = build_skill_index(["plumbing", "electrical", "hvac", "plumbing"])
+        assert index == {"electrical": 0, "hvac": 1, "plumbing": 2}
+        assert encode_skills([], index) == 0
+        assert encode_skills(["plumbing", "electrical"], index) == 0b101
+        with pytest.raises(ValueError, match="roofing"):
+            encode_skills(["roofing"], index)
+
+    def test_encode_skill_masks_wide_index(self):
+        """More than 64 skills falls back to Python-int masks."""
+        names = [f"skill_{i:03d}" for i in range(70)]
+        index = build_skill_index(names)
+        masks = encode_skill_masks([names[:2], names[-1:]], index)
+        assert masks.dtype == object
+        assert masks[1] == 1 << 69
+        covered = (masks[:, None] & ~masks[None, :]) == 0
+        np.testing.assert_array_equal(covered, [[True, False], [False, True]])
+
+    def test_skill_masks_agree_with_skill_match(
+        self, technicians, work_orders, work_orders_soa
+    ):
+        """Bitmask coverage matches check_skill_match for every pair."""
+        soa = work_orders_soa
+        covered = (soa.wo_skill_mask[None, :] & ~soa.tech_skill_mask[:, None]) == 0
+        expected = [
+            [
+                check_skill_match(t["skills"], wo["required_skills"])
+                for wo in work_orders
+            ]
+            for t in technicians
+        ]
+        np.testing.assert_array_equal(covered, expected)
+
+    def test_to_epoch_seconds_matches_numpy(self, work_orders):
+        starts = [wo["time_window_start"] for wo in work_orders]
+        assert [to_epoch_seconds(t) for t in starts] == _epoch_seconds(starts).tolist()
+
+    def test_feasibility_matrix(self, technicians, work_orders, work_orders_soa):
+        """Skill pruning agrees with check_skill_match; windows prune by overlap."""
+        soa = work_orders_soa
+        shift_starts = _epoch_seconds([t["shift_start"] for t in technicians])
+        shift_ends = _epoch_seconds([t["shift_end"] for t in technicians])
+        feasible = build_feasibility_matrix(
+            soa.tech_skill_mask,
+            soa.wo_skill_mask,
+            soa.wo_tw_start_epoch,
+            soa.wo_tw_end_epoch,
+            shift_starts,
+            shift_ends,
+        )
+        assert feasible.shape == (len(technicians), len(work_orders))
+        expected = [
+            [
+                check_skill_match(t["skills"], wo["required_skills"])
+                for wo in work_orders
+            ]
+            for t in technicians
+        ]
+        np.testing.assert_array_equal(feasible, expected)
+
+        # Move every shift to the previous day: no window overlaps any more.
+        day = 24 * 3600
+        none = build_feasibility_matrix(
+            soa.tech_skill_mask,
+            soa.wo_skill_mask,
+            soa.wo_tw_start_epoch,
+            soa.wo_tw_end_epoch,
+            shift_starts - day,
+            shift_ends - day,
+        )
+        assert not none.any()
+
+    def test_time_window_epoch_matches_datetime(self):
+        start, end = _HOURS[9], _HOURS[12]
+        bounds = (to_epoch_seconds(start), to_epoch_seconds(end))
+        for arrival in (_HOURS[8], start, _HOURS[10], end, _HOURS[13]):
+            assert check_time_window_epoch(
+                to_epoch_seconds(arrival), *bounds
+            ) == check_time_window(arrival, start, end)
+
     def test_time_window_inside(self):
-        start = datetime(2026, 2, 12, 9, 0)
-        end = datetime(2026, 2, 12, 12, 0)
-        arrival = datetime(2026, 2, 12, 10, 0)
+        start = _HOURS[9]
+        end = _HOURS[12]
+        arrival = _HOURS[10]
         assert check_time_window(arrival, start, end)
 
     def test_time_window_boundary(self):
-        start = datetime(2026, 2, 12, 9, 0)
-        end = datetime(2026, 2, 12, 12, 0)
+        start = _HOURS[9]
+        end = _HOURS[12]
         assert check_time_window(start, start, end)
         assert check_time_window(end, start, end)
 
     def test_time_window_outside(self):
-        start = datetime(2026, 2, 12, 9, 0)
-        end = datetime(2026, 2, 12, 12, 0)
-        late = datetime(2026, 2, 12, 13, 0)
+        start = _HOURS[9]
+        end = _HOURS[12]
+        late = _HOURS[13]
         assert not check_time_window(late, start, end)
 
     def test_time_window_invalid(self):
         with pytest.raises(ValueError, match="after"):
             check_time_window(
-                datetime(2026, 2, 12, 10, 0),
-                datetime(2026, 2, 12, 12, 0),
-                datetime(2026, 2, 12, 9, 0),
+                _HOURS[10],
+                _HOURS[12],
+                _HOURS[9],
             )
 
     def test_daily_limit_within(self):
@@ -470,50 +736,133 @@ class TestConstraintUtils:
         violations = validate_route(route, tech, wo_map)
         assert any("missing skills" in v for v in violations)
 
+    def test_validate_route_prepared_inputs(self, technicians, work_orders):
+        """Prepared technician/work orders report the same violations."""
+        tech = technicians[1]
+        wo_map = {wo["id"]: wo for wo in work_orders}
+        route = [
+            {
+                "work_order_id": wo["id"],
+                "arrival_time": _HOURS[8 + i] if i else datetime(2026, 2, 12, 7, 30),
+                "departure_time": _HOURS[17],
+                "travel_duration": 30.0,
+            }
+            for i, wo in enumerate(work_orders[:6])
+        ]
+        expected = validate_route(route, tech, wo_map)
+        assert expected
+        prepared = validate_route(
+            route, prepare_technician(tech), prepare_work_orders(work_orders)
+        )
+        assert prepared == expected
+
+        minutes = prepare_route(route, wo_map)
+        assert validate_route(route, tech, wo_map, prepared=minutes) == expected
+        with pytest.raises(ValueError, match="for 5 stops"):
+            validate_route(route[:5], tech, wo_map, prepared=minutes)
+
+        numeric = prepare_route(route, wo_map, tech)
+        assert numeric.req_masks is not None
+        assert validate_route(route, tech, wo_map, prepared=numeric) == expected
+
+    def test_validate_route_fast_path(self, technicians, work_orders):
+        """The compiled check clears valid routes and counts every violation."""
+        if constraints_module._count_violations_fast is None:
+            pytest.skip("numba not installed")
+        tech = technicians[0]
+        wo_map = {wo["id"]: wo for wo in work_orders}
+        valid = [
+            {
+                "work_order_id": "WO-001",
+                "arrival_time": datetime(2026, 2, 12, 8, 30),
+                "departure_time": datetime(2026, 2, 12, 9, 30),
+                "travel_duration": 15.0,
+            },
+        ]
+        prepared = prepare_route(valid, wo_map, tech)
+        assert validate_route(valid, tech, wo_map, prepared=prepared) == []
+
+        invalid = [
+            dict(stop, work_order_id=wo["id"], travel_duration=60.0)
+            for stop in valid
+            for wo in work_orders[:9]
+        ]
+        prepared = prepare_route(invalid, wo_map, tech)
+        count = constraints_module._count_violations_fast(
+            *prepared[2:],
+            float(prepared.durations.sum() + prepared.travel.sum()),
+            tech["max_hours"],
+        )
+        assert count == len(validate_route(invalid, tech, wo_map))
+
 
 # ---------------------------------------------------------------------------
-# Greedy solver tests
+# Invariants shared by every solver
 # ---------------------------------------------------------------------------
 
 
-class TestGreedySolver:
-    """Tests for the greedy nearest-neighbor solver."""
+@pytest.fixture(
+    params=[
+        pytest.param((GreedySolver, None), id="greedy"),
+        pytest.param((GeneticSolver, "ga_config"), id="genetic"),
+        pytest.param(
+            (VRPSolver, "vrp_config"),
+            id="vrp",
+            marks=pytest.mark.skipif(
+                not _ortools_available(), reason="ortools not installed"
+            ),
+        ),
+    ]
+)
+def any_result(request, work_orders, technicians, distance_matrix):
+    """Solve the shared scenario with each solver class in turn."""
+    solver_cls, config_fixture = request.param
+    config = request.getfixturevalue(config_fixture) if config_fixture else None
+    return solver_cls(work_orders, technicians, distance_matrix, config).solve()
 
-    def test_produces_valid_result(self, work_orders, technicians, distance_matrix):
-        """Solver returns an OptimizationResult with correct structure."""
-        solver = GreedySolver(work_orders, technicians, distance_matrix)
-        result = solver.solve()
 
-        assert isinstance(result, OptimizationResult)
-        assert result.algorithm == "GreedySolver"
-        assert result.solve_time_seconds >= 0
-        assert len(result.routes) == len(technicians)
+class TestSolverInvariants:
+    """Checks every solver must satisfy on the shared scenario."""
 
-    def test_all_orders_accounted_for(self, work_orders, technicians, distance_matrix):
-        """Every work order is either assigned or in unassigned list."""
-        solver = GreedySolver(work_orders, technicians, distance_matrix)
-        result = solver.solve()
+    def test_produces_valid_result(self, request, any_result, technicians):
+        """Solver returns an OptimizationResult with correct structure."""
+        solver_cls, _ = request.node.callspec.params["any_result"]
 
-        assigned_ids = set()
-        for route in result.routes:
-            for stop in route.stops:
-                assigned_ids.add(stop.work_order_id)
+        assert isinstance(any_result, OptimizationResult)
+        assert any_result.algorithm == solver_cls.__name__
+        assert any_result.solve_time_seconds >= 0
+        assert len(any_result.routes) == len(technicians)
 
+    def test_all_orders_accounted_for(self, any_result, work_orders):
+        """Every work order is either assigned or in unassigned list."""
+        assigned_ids = {s.work_order_id for r in any_result.routes for s in r.stops}
         all_ids = {wo["id"] for wo in work_orders}
-        unassigned_set = set(result.unassigned_orders)
+        unassigned_set = set(any_result.unassigned_orders)
 
         assert assigned_ids | unassigned_set == all_ids
         assert assigned_ids & unassigned_set == set()
 
-    def test_skill_matching_respected(self, work_orders, technicians, distance_matrix):
-        """No route stop should violate skill requirements."""
-        solver = GreedySolver(work_orders, technicians, distance_matrix)
-        result = solver.solve()
+    def test_route_distance_matches_matrix(
+        self, any_result, work_orders, technicians, distance_matrix
+    ):
+        """Reported route length equals the matrix path through its stops."""
+        num_techs = len(technicians)
+        wo_node = {wo["id"]: num_techs + i for i, wo in enumerate(work_orders)}
+        tech_node = {t["id"]: i for i, t in enumerate(technicians)}
+
+        for route in any_result.routes:
+            nodes = [tech_node[route.technician_id]]
+            nodes += [wo_node[s.work_order_id] for s in route.stops]
+            assert route.total_distance == pytest.approx(
+                route_distance(distance_matrix, nodes), abs=0.01
+            )
 
+    def test_skill_matching_respected(self, any_result, work_orders, technicians):
+        """No route stop should violate skill requirements."""
         wo_map = {wo["id"]: wo for wo in work_orders}
         tech_map = {t["id"]: t for t in technicians}
 
-        for route in result.routes:
+        for route in any_result.routes:
             tech = tech_map[route.technician_id]
             for stop in route.stops:
                 wo = wo_map[stop.work_order_id]
@@ -522,36 +871,51 @@ class TestGreedySolver:
                     f"{stop.work_order_id} requiring {wo['required_skills']}"
                 )
 
-    def test_time_windows_respected(self, work_orders, technicians, distance_matrix):
+    def test_time_windows_respected(self, any_result, work_orders_soa):
         """No route stop should arrive after the time window closes."""
-        solver = GreedySolver(work_orders, technicians, distance_matrix)
-        result = solver.solve()
+        stops = [s for r in any_result.routes for s in r.stops if s.arrival_time]
+        wo_idx = np.array(
+            [work_orders_soa.wo_index[s.work_order_id] for s in stops], dtype=np.intp
+        )
+        arrival = _epoch_seconds([s.arrival_time for s in stops])
+        tw_end = work_orders_soa.wo_tw_end_epoch[wo_idx]
 
-        wo_map = {wo["id"]: wo for wo in work_orders}
+        late = np.flatnonzero(arrival > tw_end)
+        assert late.size == 0, (
+            f"Time window violations: {[stops[i].work_order_id for i in late]}"
+        )
 
-        for route in result.routes:
-            for stop in route.stops:
-                wo = wo_map[stop.work_order_id]
-                if stop.arrival_time and wo.get("time_window_end"):
-                    assert stop.arrival_time <= wo["time_window_end"], (
-                        f"Time window violation: {stop.work_order_id} arrived at "
-                        f"{stop.arrival_time}, window ends {wo['time_window_end']}"
-                    )
 
-    def test_daily_hours_respected(self, work_orders, technicians, distance_matrix):
+# ---------------------------------------------------------------------------
+# Greedy solver tests
+# ---------------------------------------------------------------------------
+
+
+class TestGreedySolver:
+    """Tests for the greedy nearest-neighbor solver."""
+
+    def test_daily_hours_respected(
+        self, work_orders, technicians, distance_matrix, work_orders_soa
+    ):
         """No technician should exceed their max daily hours."""
         solver = GreedySolver(work_orders, technicians, distance_matrix)
         result = solver.solve()
 
-        tech_map = {t["id"]: t for t in technicians}
+        tech_idx = np.array(
+            [work_orders_soa.tech_index[r.technician_id] for r in result.routes],
+            dtype=np.intp,
+        )
+        total_hours = (
+            np.array([r.total_duration + r.total_work_time for r in result.routes])
+            / 60.0
+        )
+        max_hours = work_orders_soa.tech_max_hours[tech_idx]
 
-        for route in result.routes:
-            tech = tech_map[route.technician_id]
-            total_hours = (route.total_duration + route.total_work_time) / 60.0
-            assert total_hours <= tech["max_hours"] + 0.01, (
-                f"Daily limit exceeded for {route.technician_name}: "
-                f"{total_hours:.2f}h > {tech['max_hours']}h"
-            )
+        over = np.flatnonzero(total_hours > max_hours + 0.01)
+        assert over.size == 0, (
+            "Daily limit exceeded for: "
+            f"{[result.routes[i].technician_name for i in over]}"
+        )
 
     def test_routes_have_positive_distance(
         self, work_orders, technicians, distance_matrix
@@ -592,59 +956,6 @@ class TestGreedySolver:
 class TestGeneticSolver:
     """Tests for the genetic algorithm solver."""
 
-    @pytest.fixture
-    def ga_config(self) -> Dict[str, Any]:
-        """Reduced parameters for faster test execution."""
-        return {
-            "population_size": 30,
-            "generations": 50,
-            "mutation_rate": 0.15,
-            "elite_size": 5,
-            "seed": 42,
-        }
-
-    def test_produces_valid_result(
-        self, work_orders, technicians, distance_matrix, ga_config
-    ):
-        solver = GeneticSolver(work_orders, technicians, distance_matrix, ga_config)
-        result = solver.solve()
-
-        assert isinstance(result, OptimizationResult)
-        assert result.algorithm == "GeneticSolver"
-        assert result.solve_time_seconds >= 0
-
-    def test_all_orders_accounted_for(
-        self, work_orders, technicians, distance_matrix, ga_config
-    ):
-        solver = GeneticSolver(work_orders, technicians, distance_matrix, ga_config)
-        result = solver.solve()
-
-        assigned_ids = set()
-        for route in result.routes:
-            for stop in route.stops:
-                assigned_ids.add(stop.work_order_id)
-
-        all_ids = {wo["id"] for wo in work_orders}
-        unassigned_set = set(result.unassigned_orders)
-
-        assert assigned_ids | unassigned_set == all_ids
-        assert assigned_ids & unassigned_set == set()
-
-    def test_skill_matching_respected(
-        self, work_orders, technicians, distance_matrix, ga_config
-    ):
-        solver = GeneticSolver(work_orders, technicians, distance_matrix, ga_config)
-        result = solver.solve()
-
-        wo_map = {wo["id"]: wo for wo in work_orders}
-        tech_map = {t["id"]: t for t in technicians}
-
-        for route in result.routes:
-            tech = tech_map[route.technician_id]
-            for stop in route.stops:
-                wo = wo_map[stop.work_order_id]
-                assert check_skill_match(tech["skills"], wo["required_skills"])
-
     def test_convergence_metadata(
         self, work_orders, technicians, distance_matrix, ga_config
     ):
@@ -683,83 +994,61 @@ class TestGeneticSolver:
         assert result1.total_distance == result2.total_distance
         assert len(result1.unassigned_orders) == len(result2.unassigned_orders)
 
+    def test_deterministic_with_seed_islands(
+        self, work_orders, technicians, distance_matrix
+    ):
+        """A fixed seed and island count should produce identical results."""
+        config = {
+            "population_size": 20,
+            "generations": 20,
+            "seed": 123,
+            "parallel_islands": 2,
+            "migration_interval": 5,
+        }
+        result1 = GeneticSolver(
+            work_orders, technicians, distance_matrix, config
+        ).solve()
+        result2 = GeneticSolver(
+            work_orders, technicians, distance_matrix, config
+        ).solve()
+
+        assert result1.metadata["parallel_islands"] == 2
+        assert result1.metadata["convergence_history_length"] == 21
+        assert result1.total_distance == result2.total_distance
+        assert result1.unassigned_orders == result2.unassigned_orders
 
-# ---------------------------------------------------------------------------
-# VRP solver tests (conditional on ortools availability)
-# ---------------------------------------------------------------------------
+    def test_islands_capped_by_population(
+        self, work_orders, technicians, distance_matrix, caplog
+    ):
+        """Islands smaller than the minimum size are not created."""
+        config = {
+            "population_size": 15,
+            "generations": 2,
+            "seed": 1,
+            "parallel_islands": 4,
+        }
+        with caplog.at_level("WARNING", logger="optimization.solvers.genetic_solver"):
+            result = GeneticSolver(
+                work_orders, technicians, distance_matrix, config
+            ).solve()
 
+        assert result.metadata["parallel_islands"] == 1
+        assert "parallel_islands=4 capped to 1" in caplog.text
 
-def _ortools_available() -> bool:
-    """Check if ortools is installed."""
-    try:
-        from ortools.constraint_solver import pywrapcp
 
-        return True
-    except ImportError:
-        return False
+# ---------------------------------------------------------------------------
+# VRP solver tests (conditional on ortools availability)
+# ---------------------------------------------------------------------------
 
 
 @pytest.mark.skipif(not _ortools_available(), reason="ortools not installed")
 class TestVRPSolver:
     """Tests for the Google OR-Tools VRP solver."""
 
-    @pytest.fixture
-    def vrp_config(self) -> Dict[str, Any]:
-        return {"time_limit_seconds": 10}
-
-    def test_produces_valid_result(
-        self, work_orders, technicians, distance_matrix, vrp_config
-    ):
-        from optimization.solvers.vrp_solver import VRPSolver
-
-        solver = VRPSolver(work_orders, technicians, distance_matrix, vrp_config)
-        result = solver.solve()
-
-        assert isinstance(result, OptimizationResult)
-        assert result.algorithm == "VRPSolver"
-
-    def test_all_orders_accounted_for(
-        self, work_orders, technicians, distance_matrix, vrp_config
-    ):
-        from optimization.solvers.vrp_solver import VRPSolver
-
-        solver = VRPSolver(work_orders, technicians, distance_matrix, vrp_config)
-        result = solver.solve()
-
-        assigned_ids = set()
-        for route in result.routes:
-            for stop in route.stops:
-                assigned_ids.add(stop.work_order_id)
-
-        all_ids = {wo["id"] for wo in work_orders}
-        unassigned_set = set(result.unassigned_orders)
-
-        assert assigned_ids | unassigned_set == all_ids
-        assert assigned_ids & unassigned_set == set()
-
-    def test_skill_matching_respected(
-        self, work_orders, technicians, distance_matrix, vrp_config
-    ):
-        from optimization.solvers.vrp_solver import VRPSolver
-
-        solver = VRPSolver(work_orders, technicians, distance_matrix, vrp_config)
-        result = solver.solve()
-
-        wo_map = {wo["id"]: wo for wo in work_orders}
-        tech_map = {t["id"]: t for t in technicians}
-
-        for route in result.routes:
-            tech = tech_map[route.technician_id]
-            for stop in route.stops:
-                wo = wo_map[stop.work_order_id]
-                assert check_skill_match(tech["skills"], wo["required_skills"])
-
     def test_vrp_outperforms_greedy(
         self, work_orders, technicians, distance_matrix, vrp_config
     ):
         """VRP solver should produce equal or shorter total distance than greedy."""
-        from optimization.solvers.vrp_solver import VRPSolver
-
         greedy = GreedySolver(work_orders, technicians, distance_matrix)
         greedy_result = greedy.solve()
 
@@ -902,6 +1191,18 @@ class TestEdgeCases:
         with pytest.raises(ValueError, match="Distance matrix"):
             GreedySolver(work_orders, technicians, bad_matrix)
 
+    def test_matrix_size_mismatch_ndarray(self, work_orders, technicians):
+        """ndarray matrices go through the same size validation."""
+        with pytest.raises(ValueError, match="Distance matrix"):
+            GreedySolver(work_orders, technicians, np.zeros((3, 3)))
+
+    def test_nested_list_matrix_accepted(self, work_orders, technicians):
+        """Nested-list matrices are still accepted and stored as ndarrays."""
+        n = len(technicians) + len(work_orders)
+        solver = GreedySolver(work_orders, technicians, [[0.0] * n for _ in range(n)])
+        assert isinstance(solver.distance_matrix, np.ndarray)
+        assert solver.distance_matrix.shape == (n, n)
+
     def test_missing_work_order_keys(self, technicians):
         """Work order missing required keys should raise ValueError."""
         bad_wo = [{"id": "WO-BAD"}]  # Missing most required keys
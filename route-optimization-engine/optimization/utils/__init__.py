@@ -6,25 +6,65 @@ used across all solver implementations.
 """
 
 from optimization.utils.constraints import (
+    PreparedWorkOrder,
+    RoutePrepared,
+    build_feasibility_matrix,
     check_daily_limit,
     check_skill_match,
     check_time_window,
+    check_time_window_epoch,
+    prepare_route,
+    prepare_technician,
+    prepare_work_order,
+    prepare_work_orders,
+    to_epoch_seconds,
     validate_route,
 )
 from optimization.utils.distance import (
     build_distance_matrix,
+    build_distance_matrix_cached,
+    build_distance_matrix_condensed,
     build_duration_matrix,
+    condensed_get,
+    condensed_index,
+    condensed_to_square,
     estimate_travel_time,
     haversine_distance,
+    location_key,
+    route_distance,
+)
+from optimization.utils.skills import (
+    build_skill_index,
+    encode_skill_masks,
+    encode_skills,
 )
 
 __all__ = [
     "haversine_distance",
     "build_distance_matrix",
+    "build_distance_matrix_cached",
+    "build_distance_matrix_condensed",
+    "condensed_index",
+    "condensed_get",
+    "condensed_to_square",
+    "location_key",
     "build_duration_matrix",
     "estimate_travel_time",
+    "route_distance",
     "check_skill_match",
     "check_time_window",
+    "check_time_window_epoch",
     "check_daily_limit",
     "validate_route",
+    "prepare_technician",
+    "prepare_work_order",
+    "prepare_work_orders",
+    "PreparedWorkOrder",
+    "prepare_route",
+    "RoutePrepared",
+    "to_epoch_seconds",
+    "build_feasibility_matrix",
+    "build_skill_index",
+    "encode_skills",
+    "encode_skill_masks",
 ]
@@ -0,0 +1,58 @@
+"""
+Numba-compiled kernels for distance computations.
+
+Numba is an optional dependency: importing this module raises
+``ImportError`` when it is not installed, and
+:mod:`optimization.utils.distance` falls back to its NumPy implementation.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def haversine_matrix(
+    lats: np.ndarray, lngs: np.ndarray, out: np.ndarray, radius: float
+) -> None:
+    """Fill ``out`` with pairwise haversine distances (in-place).
+
+    Rows are distributed across threads; each row computes its upper
+    triangle and mirrors it, so every cell is written by exactly one thread.
+
+    Args:
+        lats: Latitudes in radians, shape ``(n,)``.
+        lngs: Longitudes in radians, shape ``(n,)``.
+        out: Output matrix, shape ``(n, n)``.
+        radius: Sphere radius; distances are returned in the same unit.
+    """
+    n = lats.shape[0]
+    # Equal extents let LLVM drop per-access bounds bookkeeping and vectorize.
+    assert lngs.shape[0] == n
+    two_r = 2.0 * radius
+
+    # Half-angle terms per point make the pair loop trig-free apart from asin:
+    # sin((a - b) / 2) = sin(a/2)cos(b/2) - cos(a/2)sin(b/2).
+    sin_lat = np.sin(lats * 0.5)
+    cos_half_lat = np.cos(lats * 0.5)
+    sin_lng = np.sin(lngs * 0.5)
+    cos_half_lng = np.cos(lngs * 0.5)
+    cos_lat = np.cos(lats)
+
+    for i in prange(n):
+        s_lat_i = sin_lat[i]
+        c_lat_i = cos_half_lat[i]
+        s_lng_i = sin_lng[i]
+        c_lng_i = cos_half_lng[i]
+        cos_i = cos_lat[i]
+        out[i, i] = 0.0
+        for j in range(i + 1, n):
+            sin_dlat = s_lat_i * cos_half_lat[j] - c_lat_i * sin_lat[j]
+            sin_dlng = s_lng_i * cos_half_lng[j] - c_lng_i * sin_lng[j]
+            a = sin_dlat * sin_dlat + cos_i * cos_lat[j] * sin_dlng * sin_dlng
+            d = two_r * math.asin(math.sqrt(min(a, 1.0)))
+            out[i, j] = d
+            out[j, i] = d
@@ -0,0 +1,40 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled scalar haversine for per-call distance lookups.
+
+Optional: build in place with ``cythonize -i optimization/utils/_haversine.pyx``.
+When the extension is not built, :mod:`optimization.utils.distance` keeps its
+pure-Python ``haversine_distance``.
+"""
+
+from libc.math cimport asin, cos, sin, sqrt
+
+cdef double _EARTH_RADIUS_MILES = 3958.8
+cdef double _DEG_TO_RAD = 0.017453292519943295
+
+
+cpdef double haversine_distance(
+    double lat1, double lng1, double lat2, double lng2
+) noexcept nogil:
+    """Compute the great-circle distance between two points on Earth.
+
+    Same contract as the pure-Python version in
+    :mod:`optimization.utils.distance`, evaluated with ``libm`` directly.
+
+    Args:
+        lat1: Latitude of the first point in decimal degrees.
+        lng1: Longitude of the first point in decimal degrees.
+        lat2: Latitude of the second point in decimal degrees.
+        lng2: Longitude of the second point in decimal degrees.
+
+    Returns:
+        Distance in miles.
+    """
+    cdef double lat1_r = lat1 * _DEG_TO_RAD
+    cdef double lat2_r = lat2 * _DEG_TO_RAD
+    cdef double sin_dlat = sin((lat2_r - lat1_r) * 0.5)
+    cdef double sin_dlng = sin((lng2 - lng1) * _DEG_TO_RAD * 0.5)
+    cdef double a = sin_dlat * sin_dlat + cos(lat1_r) * cos(lat2_r) * sin_dlng * sin_dlng
+    if a > 1.0:
+        a = 1.0
+    return 2.0 * _EARTH_RADIUS_MILES * asin(sqrt(a))
@@ -0,0 +1,75 @@
+"""
+Numba-compiled happy path for route validation.
+
+Numba is an optional dependency: importing this module raises
+``ImportError`` when it is not installed, and
+:func:`optimization.utils.constraints.validate_route` uses its Python loop
+for every route.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+#: Marks a stop with no arrival/departure time in the epoch arrays.
+MISSING = np.iinfo(np.int64).min
+
+
+@njit(cache=True)
+def count_violations(
+    req_masks: np.ndarray,
+    tech_mask: np.uint64,
+    arrivals: np.ndarray,
+    departures: np.ndarray,
+    tw_starts: np.ndarray,
+    tw_ends: np.ndarray,
+    shift_start: np.int64,
+    shift_end: np.int64,
+    total_minutes: float,
+    max_hours: float,
+) -> int:
+    """Count constraint violations on a numerically encoded route.
+
+    Mirrors the checks in ``validate_route`` (skills, time window, shift
+    bounds, daily hours). Times are int64 epoch microseconds; open bounds
+    (including a window with either end unset) use the int64 extremes and
+    missing stop times use :data:`MISSING`. An inverted window counts as a
+    violation so the caller's Python path can report it.
+
+    Args:
+        req_masks: Required-skill bitmask per stop, uint64.
+        tech_mask: Technician skill bitmask.
+        arrivals: Arrival per stop.
+        departures: Departure per stop.
+        tw_starts: Window start per stop.
+        tw_ends: Window end per stop.
+        shift_start: Technician shift start.
+        shift_end: Technician shift end.
+        total_minutes: Route service plus travel minutes.
+        max_hours: Daily hour limit.
+
+    Returns:
+        Number of violations; 0 means the route is valid.
+    """
+    violations = 0
+    for k in range(req_masks.shape[0]):
+        if req_masks[k] & ~tech_mask:
+            violations += 1
+
+        arrival = arrivals[k]
+        if arrival != MISSING:
+            if tw_starts[k] > tw_ends[k]:
+                violations += 1
+            elif arrival < tw_starts[k] or arrival > tw_ends[k]:
+                violations += 1
+            if arrival < shift_start:
+                violations += 1
+
+        departure = departures[k]
+        if departure != MISSING and departure > shift_end:
+            violations += 1
+
+    if total_minutes / 60.0 > max_hours:
+        violations += 1
+    return violations
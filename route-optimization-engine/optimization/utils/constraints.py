@@ -8,19 +8,226 @@ and comprehensive route-level validation.
 
 from __future__ import annotations
 
+import calendar
 import logging
+from collections.abc import Set as AbstractSet
 from datetime import datetime
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+from optimization.utils.skills import (
+    MAX_UINT64_SKILLS,
+    build_skill_index,
+    encode_skill_masks,
+    encode_skills,
+)
+
+try:
+    from optimization.utils._validate_fast import (
+        count_violations as _count_violations_fast,
+    )
+except ImportError:  # Numba is optional; validate_route stays pure Python.
+    _count_violations_fast = None
 
 logger = logging.getLogger(__name__)
 
+_INT64_MIN = int(np.iinfo(np.int64).min)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+class PreparedWorkOrder(NamedTuple):
+    """Work order fields read by :func:`validate_route`, resolved once.
+
+    Attributes:
+        id: Work order identifier.
+        required_skills: Skills the work order requires.
+        time_window_start: Earliest acceptable arrival, if any.
+        time_window_end: Latest acceptable arrival, if any.
+        duration_minutes: On-site service time.
+    """
+
+    id: str
+    required_skills: FrozenSet[str]
+    time_window_start: Optional[datetime]
+    time_window_end: Optional[datetime]
+    duration_minutes: float
+
+
+def prepare_work_order(work_order: Dict[str, Any]) -> PreparedWorkOrder:
+    """Resolve the fields :func:`validate_route` needs from a work order dict.
+
+    Args:
+        work_order: Work order dict with ``id`` and optional
+            ``required_skills``, ``time_window_start``, ``time_window_end``
+            and ``duration_minutes``.
+
+    Returns:
+        The corresponding :class:`PreparedWorkOrder`.
+    """
+    get = work_order.get
+    return PreparedWorkOrder(
+        id=get("id", "UNKNOWN"),
+        required_skills=frozenset(get("required_skills", ())),
+        time_window_start=get("time_window_start"),
+        time_window_end=get("time_window_end"),
+        duration_minutes=get("duration_minutes", 0),
+    )
+
+
+def prepare_work_orders(
+    work_orders: Iterable[Dict[str, Any]],
+) -> Dict[str, PreparedWorkOrder]:
+    """Build an ID-keyed map of prepared work orders for route validation.
+
+    Args:
+        work_orders: Work order dicts, each with an ``id``.
+
+    Returns:
+        Mapping from work order ID to :class:`PreparedWorkOrder`.
+    """
+    return {wo["id"]: prepare_work_order(wo) for wo in work_orders}
+
+
+class RoutePrepared(NamedTuple):
+    """Per-stop arrays for a route, in stop order, for :func:`validate_route`.
+
+    ``durations`` and ``travel`` are always set. The remaining fields are
+    filled by :func:`prepare_route` when it is given the technician; they
+    encode skills as uint64 bitmasks and times as int64 epoch microseconds
+    so a compiled check can clear valid routes without touching dicts.
+
+    Attributes:
+        durations: Service minutes of each stop's work order.
+        travel: Travel minutes into each stop.
+        req_masks: Required-skill bitmask per stop.
+        tech_mask: Technician skill bitmask.
+        arrivals: Arrival per stop (``MISSING`` when unset).
+        departures: Departure per stop (``MISSING`` when unset).
+        tw_starts: Window start per stop (open when either bound is unset).
+        tw_ends: Window end per stop (open when either bound is unset).
+        shift_start: Technician shift start (open when unset).
+        shift_end: Technician shift end (open when unset).
+    """
+
+    durations: np.ndarray
+    travel: np.ndarray
+    req_masks: Optional[np.ndarray] = None
+    tech_mask: Optional[np.uint64] = None
+    arrivals: Optional[np.ndarray] = None
+    departures: Optional[np.ndarray] = None
+    tw_starts: Optional[np.ndarray] = None
+    tw_ends: Optional[np.ndarray] = None
+    shift_start: Optional[np.int64] = None
+    shift_end: Optional[np.int64] = None
+
+
+def _epoch_us(value: Optional[datetime], missing: int) -> int:
+    """Epoch microseconds for ``value``, or ``missing`` when it is None."""
+    if value is None:
+        return missing
+    return to_epoch_seconds(value) * 1_000_000 + value.microsecond
+
+
+def prepare_route(
+    route: List[Dict[str, Any]],
+    work_orders: Dict[str, Union[Dict[str, Any], PreparedWorkOrder]],
+    technician: Optional[Dict[str, Any]] = None,
+) -> RoutePrepared:
+    """Collect a route's per-stop values into arrays.
+
+    Stops whose work order is not in ``work_orders`` contribute zero
+    minutes, matching how :func:`validate_route` skips them.
+
+    Args:
+        route: Ordered list of route stop dicts.
+        work_orders: Mapping from work order ID to work order dict or
+            :class:`PreparedWorkOrder`.
+        technician: Technician the route belongs to. When given, and every
+            stop's work order is known and the skills fit a uint64 mask,
+            the numeric fields used by the compiled validator are filled.
+
+    Returns:
+        :class:`RoutePrepared` with one entry per stop.
+    """
+    n = len(route)
+    durations = np.zeros(n, dtype=np.float64)
+    travel = np.zeros(n, dtype=np.float64)
+    resolved: List[Optional[PreparedWorkOrder]] = []
+    for idx, stop in enumerate(route):
+        wo = work_orders.get(stop.get("work_order_id", "UNKNOWN"))
+        if wo is not None and not isinstance(wo, PreparedWorkOrder):
+            wo = prepare_work_order(wo)
+        resolved.append(wo)
+        if wo is None:
+            continue
+        durations[idx] = wo.duration_minutes
+        travel[idx] = stop.get("travel_duration", 0.0)
+
+    if technician is None or any(wo is None for wo in resolved):
+        return RoutePrepared(durations=durations, travel=travel)
+
+    tech_skills = technician.get("skills", ())
+    index = build_skill_index(
+        list(tech_skills) + [s for wo in resolved for s in wo.required_skills]
+    )
+    if len(index) > MAX_UINT64_SKILLS:
+        return RoutePrepared(durations=durations, travel=travel)
+
+    lo, hi = _INT64_MIN, _INT64_MAX
+    tw_starts = np.empty(n, dtype=np.int64)
+    tw_ends = np.empty(n, dtype=np.int64)
+    for idx, wo in enumerate(resolved):
+        if wo.time_window_start is None or wo.time_window_end is None:
+            tw_starts[idx], tw_ends[idx] = lo, hi
+        else:
+            tw_starts[idx] = _epoch_us(wo.time_window_start, lo)
+            tw_ends[idx] = _epoch_us(wo.time_window_end, hi)
+
+    return RoutePrepared(
+        durations=durations,
+        travel=travel,
+        req_masks=encode_skill_masks([wo.required_skills for wo in resolved], index),
+        tech_mask=np.uint64(encode_skills(tech_skills, index)),
+        arrivals=np.array(
+            [_epoch_us(stop.get("arrival_time"), lo) for stop in route], np.int64
+        ),
+        departures=np.array(
+            [_epoch_us(stop.get("departure_time"), lo) for stop in route], np.int64
+        ),
+        tw_starts=tw_starts,
+        tw_ends=tw_ends,
+        shift_start=np.int64(_epoch_us(technician.get("shift_start"), lo)),
+        shift_end=np.int64(_epoch_us(technician.get("shift_end"), hi)),
+    )
+
+
+def prepare_technician(technician: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a technician dict with a precomputed skill set.
+
+    The copy carries ``skills_set``, a ``frozenset`` of the technician's
+    skills, so repeated skill checks against it do not rebuild a set.
+
+    Args:
+        technician: Technician dict with an optional ``skills`` list.
+
+    Returns:
+        Shallow copy of ``technician`` with a ``skills_set`` key added.
+    """
+    prepared = dict(technician)
+    prepared["skills_set"] = frozenset(technician.get("skills", ()))
+    return prepared
+
 
 def check_skill_match(
-    technician_skills: List[str] | Set[str],
-    required_skills: List[str] | Set[str],
+    technician_skills: Iterable[str],
+    required_skills: Iterable[str],
 ) -> bool:
     """Check whether a technician possesses all required skills.
 
+    Set and frozenset arguments are used as-is; other iterables are
+    converted once.
+
     Args:
         technician_skills: Skills the technician has.
         required_skills: Skills the work order requires.
@@ -34,7 +241,11 @@ def check_skill_match(
         >>> check_skill_match(["plumbing"], ["electrical", "plumbing"])
         False
     """
-    return set(required_skills).issubset(set(technician_skills))
+    if not isinstance(technician_skills, AbstractSet):
+        technician_skills = frozenset(technician_skills)
+    if not isinstance(required_skills, AbstractSet):
+        required_skills = frozenset(required_skills)
+    return required_skills <= technician_skills
 
 
 def check_time_window(
@@ -65,6 +276,27 @@ def check_time_window(
     return window_start <= arrival_time <= window_end
 
 
+def check_time_window_epoch(
+    arrival: float,
+    window_start: float,
+    window_end: float,
+) -> bool:
+    """Epoch-seconds counterpart of :func:`check_time_window` for hot loops.
+
+    Takes numeric timestamps (see :func:`to_epoch_seconds`) and skips the
+    ordering check on the window, which callers validate once up front.
+
+    Args:
+        arrival: Proposed arrival, epoch seconds.
+        window_start: Earliest acceptable arrival, epoch seconds.
+        window_end: Latest acceptable arrival, epoch seconds.
+
+    Returns:
+        True if the arrival is within the time window (inclusive).
+    """
+    return window_start <= arrival <= window_end
+
+
 def check_daily_limit(
     current_hours: float,
     max_hours: float,
@@ -93,10 +325,69 @@ def check_daily_limit(
     return (current_hours + additional_hours) <= max_hours
 
 
+def to_epoch_seconds(value: datetime) -> int:
+    """Convert a datetime to integer seconds since the Unix epoch.
+
+    Naive datetimes are interpreted as UTC, matching NumPy's
+    ``datetime64`` conversion; aware datetimes are converted to UTC first.
+
+    Args:
+        value: Datetime to convert.
+
+    Returns:
+        Whole seconds since 1970-01-01T00:00:00Z (sub-second part dropped).
+
+    Examples:
+        >>> to_epoch_seconds(datetime(1970, 1, 2))
+        86400
+    """
+    return calendar.timegm(value.utctimetuple())
+
+
+def build_feasibility_matrix(
+    tech_masks: np.ndarray,
+    req_masks: np.ndarray,
+    tw_starts: np.ndarray,
+    tw_ends: np.ndarray,
+    shift_starts: np.ndarray,
+    shift_ends: np.ndarray,
+) -> np.ndarray:
+    """Compute technician x work order compatibility in one broadcast.
+
+    A pair is compatible when the technician has every required skill and
+    the work order's time window overlaps the technician's shift. This is a
+    necessary condition only; travel time and daily limits still need the
+    per-stop checks.
+
+    Args:
+        tech_masks: Technician skill bitmasks, shape ``(T,)``.
+        req_masks: Work order required-skill bitmasks, shape ``(W,)``.
+        tw_starts: Window start per work order, int64 epoch seconds.
+        tw_ends: Window end per work order, int64 epoch seconds.
+        shift_starts: Shift start per technician, int64 epoch seconds.
+        shift_ends: Shift end per technician, int64 epoch seconds.
+
+    Returns:
+        Boolean array of shape ``(T, W)`` where ``[v, w]`` is True if
+        technician v may be assigned work order w.
+    """
+    tech_masks = np.asarray(tech_masks)[:, None]
+    shift_starts = np.asarray(shift_starts)[:, None]
+    shift_ends = np.asarray(shift_ends)[:, None]
+    req_masks = np.asarray(req_masks)[None, :]
+    tw_starts = np.asarray(tw_starts)[None, :]
+    tw_ends = np.asarray(tw_ends)[None, :]
+
+    skills_ok = (req_masks & ~tech_masks) == 0
+    window_ok = (tw_ends >= shift_starts) & (tw_starts <= shift_ends)
+    return skills_ok & window_ok
+
+
 def validate_route(
     route: List[Dict[str, Any]],
     technician: Dict[str, Any],
-    work_orders: Dict[str, Dict[str, Any]],
+    work_orders: Dict[str, Union[Dict[str, Any], PreparedWorkOrder]],
+    prepared: Optional[RoutePrepared] = None,
 ) -> List[str]:
     """Perform comprehensive validation of a complete technician route.
 
@@ -109,80 +400,140 @@ def validate_route(
             minimum ``work_order_id``, ``arrival_time``, and
             ``departure_time``.
         technician: Technician dict with ``id``, ``name``, ``skills``,
-            ``max_hours``, ``shift_start``, ``shift_end``.
+            ``max_hours``, ``shift_start``, ``shift_end``. A
+            ``skills_set`` from :func:`prepare_technician` is used when
+            present.
         work_orders: Mapping from work order ID to work order dict. Each
             work order must include ``required_skills``,
             ``time_window_start``, ``time_window_end``,
-            ``duration_minutes``.
+            ``duration_minutes``. Values may instead be
+            :class:`PreparedWorkOrder` tuples from
+            :func:`prepare_work_orders`, which skips per-stop dict lookups
+            when the same orders are validated repeatedly.
+        prepared: Optional per-stop arrays from :func:`prepare_route`.
+            When given, the daily-limit total is summed from its arrays
+            instead of reading ``duration_minutes``/``travel_duration``
+            per stop. If it was prepared with this technician and Numba is
+            installed, a compiled check returns early for valid routes.
 
     Returns:
         List of violation description strings. Empty if valid.
+
+    Raises:
+        ValueError: If ``prepared`` arrays do not have one entry per stop.
     """
+    if prepared is not None and not (
+        len(prepared.durations) == len(prepared.travel) == len(route)
+    ):
+        raise ValueError(
+            f"prepared arrays have {len(prepared.durations)} durations and "
+            f"{len(prepared.travel)} travel entries for {len(route)} stops."
+        )
+    if (
+        prepared is not None
+        and prepared.req_masks is not None
+        and _count_violations_fast is not None
+    ):
+        # Compiled happy path: a valid route needs no messages, so only
+        # routes with violations go through the loop below to describe them.
+        total_minutes = float(prepared.durations.sum() + prepared.travel.sum())
+        if not _count_violations_fast(
+            prepared.req_masks,
+            prepared.tech_mask,
+            prepared.arrivals,
+            prepared.departures,
+            prepared.tw_starts,
+            prepared.tw_ends,
+            prepared.shift_start,
+            prepared.shift_end,
+            total_minutes,
+            float(technician.get("max_hours", 8.0)),
+        ):
+            logger.debug(
+                "Route validation for technician '%s' passed.",
+                technician.get("id", "UNKNOWN"),
+            )
+            return []
+
     violations: List[str] = []
+    add_violation = violations.append
     tech_id = technician.get("id", "UNKNOWN")
-    tech_skills = set(technician.get("skills", []))
+    tech_skills = technician.get("skills_set")
+    if tech_skills is None:
+        tech_skills = frozenset(technician.get("skills", ()))
     max_hours = technician.get("max_hours", 8.0)
     shift_start = technician.get("shift_start")
     shift_end = technician.get("shift_end")
+    lookup = work_orders.get
 
     cumulative_minutes = 0.0
 
     for stop_idx, stop in enumerate(route):
-        wo_id = stop.get("work_order_id", "UNKNOWN")
-        wo = work_orders.get(wo_id)
+        stop_get = stop.get
+        wo_id = stop_get("work_order_id", "UNKNOWN")
+        wo = lookup(wo_id)
 
         if wo is None:
-            violations.append(
+            add_violation(
                 f"Stop {stop_idx}: work order '{wo_id}' not found in work_orders map."
             )
             continue
+        if isinstance(wo, PreparedWorkOrder):
+            required_skills = wo.required_skills
+            tw_start = wo.time_window_start
+            tw_end = wo.time_window_end
+            duration_min = wo.duration_minutes
+        else:
+            # Read dicts directly; converting each one would cost more than
+            # the lookups it saves
+            wo_get = wo.get
+            required_skills = wo_get("required_skills", ())
+            tw_start = wo_get("time_window_start")
+            tw_end = wo_get("time_window_end")
+            duration_min = wo_get("duration_minutes", 0)
 
         # --- Skill match ---
-        required_skills = set(wo.get("required_skills", []))
-        if not required_skills.issubset(tech_skills):
-            missing = required_skills - tech_skills
-            violations.append(
+        if not tech_skills.issuperset(required_skills):
+            missing = set(required_skills).difference(tech_skills)
+            add_violation(
                 f"Stop {stop_idx} (WO {wo_id}): technician '{tech_id}' "
                 f"missing skills {missing}."
             )
 
-        # --- Time window ---
-        arrival = stop.get("arrival_time")
-        tw_start = wo.get("time_window_start")
-        tw_end = wo.get("time_window_end")
-
-        if arrival is not None and tw_start is not None and tw_end is not None:
-            if not check_time_window(arrival, tw_start, tw_end):
-                violations.append(
-                    f"Stop {stop_idx} (WO {wo_id}): arrival {arrival} "
-                    f"outside window [{tw_start}, {tw_end}]."
-                )
-
-        # --- Shift boundary ---
-        if arrival is not None and shift_start is not None:
-            if arrival < shift_start:
-                violations.append(
+        # --- Time window & shift start ---
+        arrival = stop_get("arrival_time")
+        if arrival is not None:
+            if tw_start is not None and tw_end is not None:
+                if not check_time_window(arrival, tw_start, tw_end):
+                    add_violation(
+                        f"Stop {stop_idx} (WO {wo_id}): arrival {arrival} "
+                        f"outside window [{tw_start}, {tw_end}]."
+                    )
+            if shift_start is not None and arrival < shift_start:
+                add_violation(
                     f"Stop {stop_idx} (WO {wo_id}): arrival {arrival} is "
                     f"before shift start {shift_start}."
                 )
 
-        departure = stop.get("departure_time")
+        # --- Shift end ---
+        departure = stop_get("departure_time")
         if departure is not None and shift_end is not None:
             if departure > shift_end:
-                violations.append(
+                add_violation(
                     f"Stop {stop_idx} (WO {wo_id}): departure {departure} is "
                     f"after shift end {shift_end}."
                 )
 
         # --- Accumulate work time ---
-        duration_min = wo.get("duration_minutes", 0)
-        travel_min = stop.get("travel_duration", 0.0)
-        cumulative_minutes += duration_min + travel_min
+        if prepared is None:
+            cumulative_minutes += duration_min + stop_get("travel_duration", 0.0)
 
     # --- Daily hour limit ---
+    if prepared is not None:
+        cumulative_minutes = float(prepared.durations.sum() + prepared.travel.sum())
     cumulative_hours = cumulative_minutes / 60.0
     if cumulative_hours > max_hours:
-        violations.append(
+        add_violation(
             f"Technician '{tech_id}' total route time {cumulative_hours:.2f}h "
             f"exceeds max_hours {max_hours}h."
         )
@@ -8,15 +8,32 @@ durations are in minutes unless otherwise noted.
 
 from __future__ import annotations
 
+import functools
 import logging
 import math
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from optimization.utils._distance_numba import (
+        haversine_matrix as _haversine_matrix_numba,
+    )
+except ImportError:  # Numba is optional; fall back to the NumPy kernel.
+    _haversine_matrix_numba = None
 
 logger = logging.getLogger(__name__)
 
 # Earth radius in miles (mean radius)
 _EARTH_RADIUS_MILES = 3958.8
 
+# Degrees-to-radians factor; a multiply is cheaper than a math.radians() call.
+_DEG_TO_RAD = math.pi / 180.0
+
+# Block edge for the tiled NumPy matrix kernel: a 256x256 float64 block is
+# 512 KiB, so a block and its temporaries stay resident in L2.
+_TILE = 256
+
 
 def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
     """Compute the great-circle distance between two points on Earth.
@@ -35,26 +52,35 @@ def haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> fl
 
     Examples:
         >>> round(haversine_distance(39.7392, -104.9903, 39.7506, -104.9998), 2)
-        0.92
+        0.94
     """
-    lat1_r, lng1_r = math.radians(lat1), math.radians(lng1)
-    lat2_r, lng2_r = math.radians(lat2), math.radians(lng2)
+    lat1_r = lat1 * _DEG_TO_RAD
+    lat2_r = lat2 * _DEG_TO_RAD
 
-    dlat = lat2_r - lat1_r
-    dlng = lng2_r - lng1_r
+    sin_dlat = math.sin((lat2_r - lat1_r) * 0.5)
+    sin_dlng = math.sin((lng2 - lng1) * _DEG_TO_RAD * 0.5)
 
-    a = (
-        math.sin(dlat / 2.0) ** 2
-        + math.cos(lat1_r) * math.cos(lat2_r) * math.sin(dlng / 2.0) ** 2
-    )
-    c = 2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+    a = sin_dlat * sin_dlat + math.cos(lat1_r) * math.cos(lat2_r) * sin_dlng * sin_dlng
+    # 2*asin(sqrt(a)) equals 2*atan2(sqrt(a), sqrt(1-a)) on [0, 1] with one
+    # fewer sqrt; clamp so rounding near antipodal points stays in domain.
+    c = 2.0 * math.asin(math.sqrt(min(a, 1.0)))
 
     return _EARTH_RADIUS_MILES * c
 
 
+_haversine_distance_py = haversine_distance
+
+try:
+    # Optional Cython build of the same function (see DEVELOPMENT.md).
+    from optimization.utils._haversine import haversine_distance  # noqa: F811
+except ImportError:  # Extension not built; keep the pure-Python version.
+    pass
+
+
 def build_distance_matrix(
     locations: List[Dict[str, float]],
-) -> List[List[float]]:
+    dtype: np.dtype = np.float64,
+) -> np.ndarray:
     """Build a symmetric NxN distance matrix from a list of locations.
 
     Each location must be a dict with ``lat`` and ``lng`` keys. The
@@ -63,10 +89,13 @@ def build_distance_matrix(
     Args:
         locations: List of location dicts, e.g.
             ``[{"lat": 39.74, "lng": -104.99}, ...]``.
+        dtype: Floating dtype of the result. ``np.float32`` halves the
+            memory footprint of large matrices at ~7 significant digits,
+            which is ample for routing distances.
 
     Returns:
-        NxN list-of-lists with pairwise haversine distances in miles.
-        Diagonal entries are 0.0.
+        NxN ndarray with pairwise haversine distances in miles, indexed
+        as ``matrix[i, j]``. Diagonal entries are 0.0.
 
     Raises:
         ValueError: If any location is missing ``lat`` or ``lng``.
@@ -74,36 +103,279 @@ def build_distance_matrix(
     n = len(locations)
     if n == 0:
         logger.warning("build_distance_matrix called with empty locations list.")
-        return []
-
-    for idx, loc in enumerate(locations):
-        if "lat" not in loc or "lng" not in loc:
-            raise ValueError(
-                f"Location at index {idx} is missing 'lat' or 'lng': {loc}"
-            )
-
-    matrix: List[List[float]] = [[0.0] * n for _ in range(n)]
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            dist = haversine_distance(
-                locations[i]["lat"],
-                locations[i]["lng"],
-                locations[j]["lat"],
-                locations[j]["lng"],
-            )
-            dist = round(dist, 4)
-            matrix[i][j] = dist
-            matrix[j][i] = dist
+        return np.zeros((0, 0), dtype=dtype)
+
+    lats, lngs = _radians_coords(locations)
+
+    if _haversine_matrix_numba is not None:
+        dist = np.empty((n, n), dtype=np.float64)
+        _haversine_matrix_numba(lats, lngs, dist, _EARTH_RADIUS_MILES)
+    else:
+        dist = _haversine_matrix_tiled(lats, lngs)
+    matrix = dist.astype(dtype, copy=False)
 
     logger.info("Built %dx%d distance matrix for %d locations.", n, n, n)
     return matrix
 
 
+def build_distance_matrix_condensed(
+    locations: List[Dict[str, float]],
+    dtype: np.dtype = np.float64,
+) -> np.ndarray:
+    """Build the condensed (upper-triangle) form of the distance matrix.
+
+    Stores each unordered pair once, in the row-major order used by
+    ``scipy.spatial.distance.pdist``: half the memory of the square
+    matrix. Read single cells with :func:`condensed_get`, or expand with
+    :func:`condensed_to_square` where a full matrix is required.
+
+    Args:
+        locations: List of location dicts with ``lat`` and ``lng`` keys.
+        dtype: Floating dtype of the result.
+
+    Returns:
+        1-D ndarray of length ``n * (n - 1) // 2`` with distances in miles.
+
+    Raises:
+        ValueError: If any location is missing ``lat`` or ``lng``.
+    """
+    n = len(locations)
+    out = np.empty(n * (n - 1) // 2, dtype=dtype)
+    if n < 2:
+        return out
+
+    terms = _half_angle_terms(*_radians_coords(locations))
+    start = 0
+    for i in range(n - 1):
+        end = start + n - 1 - i
+        out[start:end] = _haversine_broadcast(terms[:, i], terms[:, i + 1 :])
+        start = end
+
+    logger.info("Built condensed distance matrix for %d locations.", n)
+    return out
+
+
+def condensed_index(i: int, j: int, n: int) -> int:
+    """Position of pair ``(i, j)`` in a condensed matrix of ``n`` points.
+
+    Args:
+        i: Row index.
+        j: Column index; must differ from ``i``.
+        n: Number of points.
+
+    Returns:
+        Offset into the condensed array.
+
+    Raises:
+        ValueError: If ``i == j`` (the diagonal is not stored).
+
+    Examples:
+        >>> condensed_index(0, 1, 4), condensed_index(2, 1, 4), condensed_index(2, 3, 4)
+        (0, 3, 5)
+    """
+    if i == j:
+        raise ValueError("Diagonal entries are not stored in condensed form.")
+    if i > j:
+        i, j = j, i
+    return i * (2 * n - i - 1) // 2 + j - i - 1
+
+
+def condensed_get(condensed: np.ndarray, i: int, j: int, n: int) -> float:
+    """Read distance ``(i, j)`` from a condensed matrix; 0.0 on the diagonal.
+
+    Args:
+        condensed: Array from :func:`build_distance_matrix_condensed`.
+        i: Row index.
+        j: Column index.
+        n: Number of points.
+
+    Returns:
+        Distance between points ``i`` and ``j``.
+    """
+    if i == j:
+        return 0.0
+    return condensed.item(condensed_index(i, j, n))
+
+
+def condensed_to_square(condensed: np.ndarray) -> np.ndarray:
+    """Expand a condensed matrix to the full symmetric NxN form.
+
+    Equivalent to ``scipy.spatial.distance.squareform`` for this layout,
+    including returning a 1x1 matrix for an empty input (zero and one
+    point both have no pairs).
+
+    Args:
+        condensed: 1-D array of length ``n * (n - 1) // 2``.
+
+    Returns:
+        NxN ndarray with a zero diagonal, same dtype as ``condensed``.
+
+    Raises:
+        ValueError: If the length is not a triangular number.
+    """
+    m = len(condensed)
+    n = int(round((1 + math.sqrt(1 + 8 * m)) / 2))
+    if n * (n - 1) // 2 != m:
+        raise ValueError(f"Condensed length {m} is not n*(n-1)/2 for any n.")
+    square = np.zeros((n, n), dtype=condensed.dtype)
+    square[np.triu_indices(n, k=1)] = condensed
+    square += square.T
+    return square
+
+
+def _radians_coords(locations: List[Dict[str, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract latitudes and longitudes in radians as float64 arrays.
+
+    Each coordinate is read once, straight into a preallocated array; the
+    list is only rescanned to name the offending index when a key is
+    missing.
+
+    Raises:
+        ValueError: If any location is missing ``lat`` or ``lng``.
+    """
+    n = len(locations)
+    try:
+        lats = np.fromiter((loc["lat"] for loc in locations), np.float64, count=n)
+        lngs = np.fromiter((loc["lng"] for loc in locations), np.float64, count=n)
+    except KeyError as exc:
+        idx, loc = next(
+            (i, loc)
+            for i, loc in enumerate(locations)
+            if "lat" not in loc or "lng" not in loc
+        )
+        raise ValueError(
+            f"Location at index {idx} is missing 'lat' or 'lng': {loc}"
+        ) from exc
+
+    lats *= _DEG_TO_RAD
+    lngs *= _DEG_TO_RAD
+    return lats, lngs
+
+
+def _half_angle_terms(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """Per-point terms that make the pairwise haversine trig-free.
+
+    Returns a ``(5, n)`` array of ``sin(lat/2)``, ``cos(lat/2)``,
+    ``sin(lng/2)``, ``cos(lng/2)`` and ``cos(lat)``. With these,
+    ``sin((a - b) / 2) = sin(a/2)cos(b/2) - cos(a/2)sin(b/2)``, so each pair
+    costs a few multiplies plus one ``arcsin``/``sqrt`` instead of two
+    ``sin`` calls. Evaluating ``sin**2`` directly (the scalar form) and the
+    ``(1 - cos) / 2`` form were both measured slower in NumPy, and the
+    latter also loses precision for nearby points.
+
+    Args:
+        lats: Latitudes in radians.
+        lngs: Longitudes in radians.
+    """
+    half_lat = lats * 0.5
+    half_lng = lngs * 0.5
+    return np.stack(
+        [
+            np.sin(half_lat),
+            np.cos(half_lat),
+            np.sin(half_lng),
+            np.cos(half_lng),
+            np.cos(lats),
+        ]
+    )
+
+
+def _haversine_broadcast(terms_a: np.ndarray, terms_b: np.ndarray) -> np.ndarray:
+    """Haversine distance in miles between broadcastable point sets.
+
+    Args:
+        terms_a: Leading-axis-5 slice of :func:`_half_angle_terms`.
+        terms_b: Same for the other points; the two must broadcast.
+    """
+    sin_lat_a, cos_lat_a, sin_lng_a, cos_lng_a, cos_a = terms_a
+    sin_lat_b, cos_lat_b, sin_lng_b, cos_lng_b, cos_b = terms_b
+    sin_dlat = sin_lat_a * cos_lat_b - cos_lat_a * sin_lat_b
+    sin_dlng = sin_lng_a * cos_lng_b - cos_lng_a * sin_lng_b
+    a = sin_dlat * sin_dlat + cos_a * cos_b * sin_dlng * sin_dlng
+    return (2.0 * _EARTH_RADIUS_MILES) * np.arcsin(np.sqrt(np.minimum(a, 1.0, out=a)))
+
+
+def location_key(locations: List[Dict[str, float]]) -> Tuple[Tuple[float, float], ...]:
+    """Normalize locations into a hashable key for the matrix cache.
+
+    Coordinates are rounded to 6 decimal places (about 0.1 m), so values
+    that differ only by float noise share a cache entry. Order is kept,
+    because matrix rows follow input order.
+
+    Args:
+        locations: List of dicts with ``lat`` and ``lng`` keys.
+
+    Returns:
+        Tuple of ``(lat, lng)`` pairs suitable for
+        :func:`build_distance_matrix_cached`.
+    """
+    return tuple((round(loc["lat"], 6), round(loc["lng"], 6)) for loc in locations)
+
+
+@functools.lru_cache(maxsize=8)
+def build_distance_matrix_cached(
+    coords: Tuple[Tuple[float, float], ...],
+) -> np.ndarray:
+    """Memoized :func:`build_distance_matrix` keyed on coordinate pairs.
+
+    Technician homes and property locations change rarely, so repeated
+    solves over the same sites can reuse one matrix. Build the key with
+    :func:`location_key`; call ``build_distance_matrix_cached.cache_clear()``
+    to drop cached matrices.
+
+    Args:
+        coords: Tuple of ``(lat, lng)`` pairs in decimal degrees.
+
+    Returns:
+        NxN float64 distance matrix in miles. The array is shared between
+        callers and marked read-only; copy it before modifying.
+    """
+    matrix = build_distance_matrix([{"lat": lat, "lng": lng} for lat, lng in coords])
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _haversine_matrix_tiled(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """NumPy haversine matrix computed in ``_TILE``-sized blocks.
+
+    Only blocks on or above the diagonal are evaluated; each is mirrored
+    into its transpose position. Broadcasting block-by-block bounds the
+    temporaries to ``_TILE**2`` cells instead of ``n**2``.
+
+    Diagonal blocks are computed whole. Restricting them to their strict
+    upper triangle (``triu_indices`` gather, then ``m + m.T``) halves the
+    per-pair work but was measured slower: the gather/scatter costs more
+    than the vectorized arithmetic it saves.
+
+    Args:
+        lats: Latitudes in radians.
+        lngs: Longitudes in radians.
+
+    Returns:
+        NxN float64 distance matrix in miles.
+    """
+    n = lats.shape[0]
+    out = np.empty((n, n), dtype=np.float64)
+    terms = _half_angle_terms(lats, lngs)
+
+    for ii in range(0, n, _TILE):
+        i_end = min(ii + _TILE, n)
+        terms_i = terms[:, ii:i_end, None]
+        for jj in range(ii, n, _TILE):
+            j_end = min(jj + _TILE, n)
+            block = _haversine_broadcast(terms_i, terms[:, None, jj:j_end])
+            out[ii:i_end, jj:j_end] = block
+            if jj != ii:
+                out[jj:j_end, ii:i_end] = block.T
+
+    np.fill_diagonal(out, 0.0)
+    return out
+
+
 def build_duration_matrix(
-    distance_matrix: List[List[float]],
+    distance_matrix: Sequence[Sequence[float]] | np.ndarray,
     avg_speed_mph: float = 30.0,
-) -> List[List[float]]:
+) -> np.ndarray:
     """Convert a distance matrix (miles) to a duration matrix (minutes).
 
     Assumes a constant average travel speed. For urban field-service
@@ -111,11 +383,13 @@ def build_duration_matrix(
     parking, and walking to the property.
 
     Args:
-        distance_matrix: NxN matrix of distances in miles.
+        distance_matrix: NxN matrix of distances in miles (nested lists or
+            an ndarray).
         avg_speed_mph: Average travel speed in miles per hour. Must be > 0.
 
     Returns:
-        NxN matrix of travel durations in minutes.
+        NxN float64 ndarray of travel durations in minutes, rounded to two
+        decimals.
 
     Raises:
         ValueError: If ``avg_speed_mph`` is not positive.
@@ -123,10 +397,13 @@ def build_duration_matrix(
     if avg_speed_mph <= 0:
         raise ValueError(f"avg_speed_mph must be positive, got {avg_speed_mph}.")
 
-    duration_matrix: List[List[float]] = []
-    for row in distance_matrix:
-        duration_row = [round((d / avg_speed_mph) * 60.0, 2) for d in row]
-        duration_matrix.append(duration_row)
+    minutes_per_mile = 60.0 / avg_speed_mph
+    # One multiply into a fresh array, then round it in place: a single
+    # NxN allocation, and the caller's distance matrix is never modified.
+    duration_matrix = np.multiply(
+        np.asarray(distance_matrix, dtype=np.float64), minutes_per_mile
+    )
+    np.round(duration_matrix, 2, out=duration_matrix)
 
     logger.debug("Built duration matrix with avg_speed_mph=%.1f.", avg_speed_mph)
     return duration_matrix
@@ -152,3 +429,30 @@ def estimate_travel_time(distance_miles: float, speed_mph: float = 30.0) -> floa
         raise ValueError(f"speed_mph must be positive, got {speed_mph}.")
 
     return round((distance_miles / speed_mph) * 60.0, 2)
+
+
+def route_distance(
+    distance_matrix: np.ndarray,
+    sequence: Sequence[int] | np.ndarray,
+) -> float:
+    """Total length of a path through a distance matrix.
+
+    Sums ``distance_matrix[a, b]`` over consecutive node pairs with a single
+    fancy-indexed gather rather than a Python loop over legs.
+
+    Args:
+        distance_matrix: Square distance matrix.
+        sequence: Node indices in visiting order, e.g. a technician's depot
+            index followed by ``num_technicians + wo_idx`` for each stop.
+
+    Returns:
+        Sum of leg distances; 0.0 for sequences shorter than two nodes.
+
+    Examples:
+        >>> route_distance(np.array([[0.0, 1.0], [1.0, 0.0]]), [0, 1, 0])
+        2.0
+    """
+    seq = np.asarray(sequence, dtype=np.intp)
+    if seq.size < 2:
+        return 0.0
+    return float(np.asarray(distance_matrix)[seq[:-1], seq[1:]].sum())
@@ -0,0 +1,96 @@
+"""
+Skill bitmask encoding for route optimization.
+
+Each distinct skill name is assigned one bit, so a set of skills becomes a
+single integer and "technician covers every required skill" reduces to
+``required & ~available == 0``. Masks are plain Python ints, which keeps
+the scalar checks allocation-free and places no limit on the number of
+skills; :func:`encode_skill_masks` packs them into a NumPy array for
+vectorized checks.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+#: Largest number of distinct skills that fits a ``uint64`` mask array.
+MAX_UINT64_SKILLS = 64
+
+
+def build_skill_index(all_skills: Iterable[str]) -> Dict[str, int]:
+    """Assign a bit position to every distinct skill name.
+
+    Skills are sorted before numbering so the same skill set always
+    produces the same index regardless of input order.
+
+    Args:
+        all_skills: Skill names; duplicates are ignored.
+
+    Returns:
+        Mapping from skill name to bit position (0-based).
+
+    Examples:
+        >>> build_skill_index(["plumbing", "electrical", "plumbing"])
+        {'electrical': 0, 'plumbing': 1}
+    """
+    return {name: bit for bit, name in enumerate(sorted(set(all_skills)))}
+
+
+def encode_skills(skills: Iterable[str], index: Dict[str, int]) -> int:
+    """Encode a collection of skill names as a bitmask.
+
+    Args:
+        skills: Skill names to encode.
+        index: Bit positions from :func:`build_skill_index`.
+
+    Returns:
+        Integer with the bit for each skill set.
+
+    Raises:
+        ValueError: If a skill is missing from ``index``.
+
+    Examples:
+        >>> index = build_skill_index(["electrical", "hvac", "plumbing"])
+        >>> encode_skills(["plumbing", "electrical"], index)
+        5
+    """
+    mask = 0
+    for name in skills:
+        try:
+            mask |= 1 << index[name]
+        except KeyError:
+            raise ValueError(f"Skill '{name}' is not in the skill index.") from None
+    return mask
+
+
+def encode_skill_masks(
+    skill_lists: Iterable[Iterable[str]], index: Dict[str, int]
+) -> np.ndarray:
+    """Encode several skill collections into a 1-D mask array.
+
+    The result is ``uint64`` when the index has at most
+    :data:`MAX_UINT64_SKILLS` entries. Larger indexes fall back to an
+    ``object`` array of Python ints, on which the same ``&``/``~``
+    broadcasts still work, only without native integer speed.
+
+    Args:
+        skill_lists: One collection of skill names per row.
+        index: Bit positions from :func:`build_skill_index`.
+
+    Returns:
+        Array with one mask per input collection.
+    """
+    masks: List[int] = [encode_skills(skills, index) for skills in skill_lists]
+    if len(index) <= MAX_UINT64_SKILLS:
+        return np.array(masks, dtype=np.uint64)
+
+    logger.warning(
+        "%d distinct skills exceed a uint64 mask; using Python-int masks.",
+        len(index),
+    )
+    return np.array(masks, dtype=object)
@@ -0,0 +1,21 @@
+"""
+Numba-compiled aggregation for evaluate.py
+
+Numba is optional: importing this module raises ImportError when it is not
+installed, and evaluate.py aggregates with np.bincount instead.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def route_totals(durations, idx, n_routes):
+    """Return per-route (minutes, stops) from flat stop arrays in one loop"""
+    minutes = np.zeros(n_routes, dtype=np.float64)
+    stops = np.zeros(n_routes, dtype=np.int64)
+    for k in range(durations.shape[0]):
+        r = idx[k]
+        minutes[r] += durations[k]
+        stops[r] += 1
+    return minutes, stops
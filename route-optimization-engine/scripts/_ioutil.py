@@ -0,0 +1,61 @@
+"""
+Shared JSON input helpers for the loader scripts
+
+ijson and orjson are optional: without ijson files are parsed whole, and
+without orjson the stdlib parser is used.
+"""
+
+import json
+import mmap
+import os
+
+try:
+    import ijson
+
+    JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:  # optional; files are parsed whole when absent
+    ijson = None
+    JSON_ERRORS = (json.JSONDecodeError,)
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib parser is used when absent
+    orjson = None
+
+
+def iter_items(file_path, item_path="item"):
+    """Yield the items of a top-level JSON array one at a time
+
+    Streams with ijson (which picks its C backend when available) so only
+    the current item is held in memory. Without ijson, orjson parses the
+    file through a read-only memory map, avoiding a copy into a bytes
+    object; json reads it whole as a last resort. file_path may also be an
+    open binary file, which is read in place of opening a path.
+    """
+    if hasattr(file_path, "read"):
+        yield from _iter_file_items(file_path, item_path)
+        return
+
+    with open(file_path, "rb") as f:
+        if ijson is not None:
+            # Floats, not Decimals: BSON cannot encode Decimal
+            yield from ijson.items(f, item_path, use_float=True)
+        elif orjson is not None and os.fstat(f.fileno()).st_size:
+            # Empty files cannot be mapped; they fall through to the parser
+            # error below
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    items = orjson.loads(view)
+            yield from items
+        else:
+            yield from json.loads(f.read())
+
+
+def _iter_file_items(f, item_path):
+    """iter_items for an already open file, which may not support mmap"""
+    if ijson is not None:
+        yield from ijson.items(f, item_path, use_float=True)
+    elif orjson is not None:
+        yield from orjson.loads(f.read())
+    else:
+        yield from json.loads(f.read())
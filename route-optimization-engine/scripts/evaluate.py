@@ -6,18 +6,33 @@ Analyzes optimization results and generates comparison metrics
 
 import argparse
 import json
+import math
 import sys
 from datetime import datetime
 from pathlib import Path
-from statistics import mean, stdev
 from typing import Any, Dict, List
 
+import numpy as np
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # optional; the stdlib parser is used when absent
+    _json_loads = json.loads
+
+try:
+    from _evaluate_numba import route_totals as _route_totals
+except ImportError:  # Numba is optional; fall back to np.bincount
+    _route_totals = None
+
 
 def load_json_file(file_path):
     """Load data from JSON file"""
     try:
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        # Read whole file, then parse: faster than streaming json.load(f)
+        with open(file_path, "rb") as f:
+            data = _json_loads(f.read())
         return data
     except FileNotFoundError:
         print(f"ERROR: File not found: {file_path}")
@@ -34,8 +49,54 @@ def calculate_improvement(baseline, optimized):
     return ((baseline - optimized) / baseline) * 100
 
 
-def calculate_workload_balance(routes, technicians):
-    """Calculate workload balance metrics"""
+def _mean_stdev(values):
+    """Return (mean, sample stdev) using math.fsum for both passes"""
+    values = list(values)
+    n = len(values)
+    if n == 0:
+        return 0.0, 0.0
+    mean = math.fsum(values) / n
+    if n == 1:
+        return mean, 0.0
+    m2 = math.fsum([(x - mean) * (x - mean) for x in values])
+    return mean, math.sqrt(m2 / (n - 1))
+
+
+def summarize_routes(routes):
+    """Return {tech_id: (stops, hours)} for every route in one pass"""
+    tech_ids = list(routes)
+    tech_index = {tech_id: i for i, tech_id in enumerate(tech_ids)}
+
+    # One flat array per quantity; bincount aggregates per technician
+    n_stops = sum(len(route) for route in routes.values())
+    # Every generated/optimized work order carries its duration
+    durations = np.fromiter(
+        (wo["estimated_duration_minutes"] for route in routes.values() for wo in route),
+        dtype=np.float64,
+        count=n_stops,
+    )
+    idx = np.fromiter(
+        (tech_index[tech_id] for tech_id, route in routes.items() for _ in route),
+        dtype=np.int32,
+        count=n_stops,
+    )
+    if _route_totals is not None:
+        minutes, stops = _route_totals(durations, idx, len(tech_ids))
+    else:
+        minutes = np.bincount(idx, weights=durations, minlength=len(tech_ids))
+        stops = np.bincount(idx, minlength=len(tech_ids))
+    hours = minutes / 60.0
+    return dict(zip(tech_ids, zip(stops.tolist(), hours.tolist())))
+
+
+def calculate_workload_balance(routes, technicians, route_stats=None):
+    """Calculate workload balance metrics
+
+    route_stats: optional summarize_routes(routes) result to reuse.
+    """
+    if route_stats is None:
+        route_stats = summarize_routes(routes)
+
     tech_hours = {}
     tech_stops = {}
 
@@ -44,22 +105,15 @@ def calculate_workload_balance(routes, technicians):
         tech_hours[tech_id] = 0.0
         tech_stops[tech_id] = 0
 
-    for tech_id, route in routes.items():
-        if route:
-            total_hours = (
-                sum(wo.get("estimated_duration_minutes", 0) for wo in route) / 60.0
-            )
-            tech_hours[tech_id] = total_hours
-            tech_stops[tech_id] = len(route)
+    for tech_id, (stops, hours) in route_stats.items():
+        if stops:
+            tech_hours[tech_id] = hours
+            tech_stops[tech_id] = stops
 
     # Calculate standard deviation (lower is better - more balanced)
-    hours_list = [h for h in tech_hours.values() if h > 0]
-    stops_list = [s for s in tech_stops.values() if s > 0]
-
-    hours_stdev = stdev(hours_list) if len(hours_list) > 1 else 0
-    stops_stdev = stdev(stops_list) if len(stops_list) > 1 else 0
-    hours_mean = mean(hours_list) if hours_list else 0
-    stops_mean = mean(stops_list) if stops_list else 0
+    # (fleet-sized lists: a Python pass beats NumPy's per-call overhead)
+    hours_mean, hours_stdev = _mean_stdev(h for h in tech_hours.values() if h > 0)
+    stops_mean, stops_stdev = _mean_stdev(s for s in tech_stops.values() if s > 0)
 
     return {
         "hours_mean": hours_mean,
@@ -71,8 +125,31 @@ def calculate_workload_balance(routes, technicians):
     }
 
 
-def generate_per_technician_report(routes, technicians, algorithm_name):
-    """Generate per-technician breakdown"""
+def build_tech_meta(technicians):
+    """Return (tech_id, row prefix, max hours) per technician for the reports"""
+    return [
+        (
+            tech["technician_id"],
+            f"  {tech['technician_id']:<15} {tech.get('name', 'Unknown'):<20}",
+            tech.get("max_daily_hours", 8),
+        )
+        for tech in technicians
+    ]
+
+
+def generate_per_technician_report(
+    routes, technicians, algorithm_name, route_stats=None, tech_meta=None
+):
+    """Generate per-technician breakdown
+
+    route_stats: optional summarize_routes(routes) result to reuse.
+    tech_meta: optional build_tech_meta(technicians) result to reuse.
+    """
+    if route_stats is None:
+        route_stats = summarize_routes(routes)
+    if tech_meta is None:
+        tech_meta = build_tech_meta(technicians)
+
     print(f"\n  Per-Technician Breakdown ({algorithm_name}):")
     print(f"  {'-' * 80}")
     print(
@@ -80,26 +157,53 @@ def generate_per_technician_report(routes, technicians, algorithm_name):
     )
     print(f"  {'-' * 80}")
 
-    for tech in technicians:
-        tech_id = tech["technician_id"]
-        tech_name = tech.get("name", "Unknown")
-        route = routes.get(tech_id, [])
+    rows = []
+    for tech_id, prefix, max_hours in tech_meta:
+        stops, hours = route_stats.get(tech_id, (0, 0.0))
 
-        if route:
-            stops = len(route)
-            hours = sum(wo.get("estimated_duration_minutes", 0) for wo in route) / 60.0
-            max_hours = tech.get("max_daily_hours", 8)
+        if stops:
             utilization = min((hours / max_hours) * 100, 100) if max_hours > 0 else 0
-
-            print(
-                f"  {tech_id:<15} {tech_name:<20} {stops:<10} {hours:<10.2f} {utilization:<15.1f}"
-            )
+            rows.append(f"{prefix} {stops:<10} {hours:<10.2f} {utilization:<15.1f}")
         else:
-            print(f"  {tech_id:<15} {tech_name:<20} {0:<10} {0:<10.2f} {0:<15.1f}")
+            rows.append(f"{prefix} {0:<10} {0:<10.2f} {0:<15.1f}")
+    if rows:
+        print("\n".join(rows))
 
     print(f"  {'-' * 80}")
 
 
+def scan_results(results):
+    """Find the Greedy baseline and the best result per metric in one pass
+
+    Returns (baseline, best_distance, best_time, best_utilization,
+    best_coverage); baseline is None without a Greedy result. Ties keep the
+    earliest result, as min()/max() would.
+    """
+    baseline = None
+    best_distance = best_time = best_utilization = best_coverage = None
+    for result in results:
+        if baseline is None and result["algorithm"] == "Greedy":
+            baseline = result
+        if (
+            best_distance is None
+            or result["total_distance"] < best_distance["total_distance"]
+        ):
+            best_distance = result
+        if best_time is None or result["total_time"] < best_time["total_time"]:
+            best_time = result
+        if (
+            best_utilization is None
+            or result["avg_utilization"] > best_utilization["avg_utilization"]
+        ):
+            best_utilization = result
+        if (
+            best_coverage is None
+            or result["unassigned_orders"] < best_coverage["unassigned_orders"]
+        ):
+            best_coverage = result
+    return baseline, best_distance, best_time, best_utilization, best_coverage
+
+
 def generate_comparison_report(results, technicians):
     """Generate detailed comparison report"""
     print("\n" + "=" * 100)
@@ -108,12 +212,10 @@ def generate_comparison_report(results, technicians):
     print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Algorithms Compared: {len(results)}")
 
-    # Find baseline (Greedy)
-    baseline = None
-    for result in results:
-        if result["algorithm"] == "Greedy":
-            baseline = result
-            break
+    # Find baseline (Greedy) and the best result per metric in one pass
+    baseline, best_distance, best_time, best_utilization, best_coverage = scan_results(
+        results
+    )
 
     if not baseline:
         print("\nWARNING: No Greedy baseline found. Using first result as baseline.")
@@ -167,6 +269,12 @@ def generate_comparison_report(results, technicians):
 
         print(f"  Solve Time: {result['solve_time']} seconds")
 
+    # Per-route stops/hours, shared by the balance and per-technician sections
+    route_stats = {
+        result["algorithm"]: summarize_routes(result.get("routes", {}))
+        for result in results
+    }
+
     # Workload balance analysis
     print("\n" + "=" * 100)
     print("WORKLOAD BALANCE ANALYSIS")
@@ -176,7 +284,9 @@ def generate_comparison_report(results, technicians):
         algorithm = result["algorithm"]
         routes = result.get("routes", {})
 
-        balance = calculate_workload_balance(routes, technicians)
+        balance = calculate_workload_balance(
+            routes, technicians, route_stats[algorithm]
+        )
 
         print(f"\n{algorithm} Algorithm:")
         print(f"  Average Hours per Technician: {balance['hours_mean']:.2f}")
@@ -189,22 +299,20 @@ def generate_comparison_report(results, technicians):
     print("PER-TECHNICIAN BREAKDOWN")
     print("=" * 100)
 
+    tech_meta = build_tech_meta(technicians)
     for result in results:
         algorithm = result["algorithm"]
         routes = result.get("routes", {})
-        generate_per_technician_report(routes, technicians, algorithm)
+        generate_per_technician_report(
+            routes, technicians, algorithm, route_stats[algorithm], tech_meta
+        )
 
     # Summary and recommendations
     print("\n" + "=" * 100)
     print("SUMMARY AND RECOMMENDATIONS")
     print("=" * 100)
 
-    # Find best algorithm by different criteria
-    best_distance = min(results, key=lambda x: x["total_distance"])
-    best_time = min(results, key=lambda x: x["total_time"])
-    best_utilization = max(results, key=lambda x: x["avg_utilization"])
-    best_coverage = min(results, key=lambda x: x["unassigned_orders"])
-
+    # Best algorithm by different criteria (found by scan_results above)
     print(
         f"\nBest by Total Distance: {best_distance['algorithm']} ({best_distance['total_distance']} miles)"
     )
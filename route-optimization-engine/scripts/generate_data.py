@@ -2,19 +2,38 @@
 """
 Data Generation Script for Route Optimization Engine
 Generates realistic simulated data for Denver, CO metropolitan area
+
+Records are built as plain dict literals: they are written straight to JSON
+and loaded into MongoDB/Snowflake, and converting slotted dataclasses back
+with dataclasses.asdict() costs several times more than it saves.
 """
 
+import argparse
 import json
 import os
-import random
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
-from faker import Faker
-
-# Initialize Faker with US locale
-fake = Faker("en_US")
-random.seed(42)  # For reproducibility
+import numpy as np
+from faker.providers.person.en_US import Provider as _PersonProvider
+
+try:
+    import orjson
+except ImportError:  # optional; json.dump is used when absent
+    orjson = None
+
+# Faker's US name lists and weights, sampled directly rather than per call
+_FIRST_NAMES = np.array(list(_PersonProvider.first_names))
+_FIRST_NAME_P = np.array(list(_PersonProvider.first_names.values()), dtype=float)
+_FIRST_NAME_P /= _FIRST_NAME_P.sum()
+_LAST_NAMES = np.array(list(_PersonProvider.last_names))
+_LAST_NAME_P = np.array(list(_PersonProvider.last_names.values()), dtype=float)
+_LAST_NAME_P /= _LAST_NAME_P.sum()
+_EMAIL_DOMAINS = ["example.com", "example.net", "example.org"]
+# Shared generator; the generators draw their randomness from it in bulk
+_rng = np.random.default_rng(42)  # For reproducibility
 
 # Denver metro area boundaries
 DENVER_LAT_MIN = 39.60
@@ -76,6 +95,20 @@ DENVER_STREETS = [
     "King St",
 ]
 
+# Zip codes by general area: north, south, west, east, central
+_ZIP_CODES = [
+    ["80221", "80216", "80238", "80249", "80239"],
+    ["80110", "80120", "80122", "80111", "80113"],
+    ["80214", "80215", "80226", "80228", "80227"],
+    ["80010", "80011", "80012", "80230", "80231"],
+    ["80202", "80203", "80204", "80205", "80206", "80218", "80220"],
+]
+# Rectangular (padded) copy of _ZIP_CODES for fancy indexing
+_ZIP_COUNTS = np.array([len(codes) for codes in _ZIP_CODES])
+_ZIP_TABLE = np.array(
+    [codes + [""] * (_ZIP_COUNTS.max() - len(codes)) for codes in _ZIP_CODES]
+)
+
 # Zones based on Denver geography
 ZONES = {
     "Zone-A": {
@@ -105,6 +138,12 @@ ZONES = {
     },
 }
 
+# Zone bounds as [lat_lo, lat_hi, lng_lo, lng_hi] rows, in ZONES order
+_ZONE_IDS = np.array(list(ZONES))
+_ZONE_BOUNDS = np.array(
+    [zone["lat_range"] + zone["lng_range"] for zone in ZONES.values()]
+)
+
 PROPERTY_TYPES = {"residential": 0.60, "commercial": 0.30, "industrial": 0.10}
 
 SKILLS = ["hvac", "plumbing", "electrical", "general", "inspection"]
@@ -119,19 +158,54 @@ WORK_ORDER_CATEGORIES = {
 
 PRIORITY_DISTRIBUTION = {"emergency": 0.05, "high": 0.15, "medium": 0.50, "low": 0.30}
 
+# Inclusive square-footage range per property type
+SQFT_RANGES = {
+    "residential": (800, 3500),
+    "commercial": (2000, 20000),
+    "industrial": (5000, 50000),
+}
 
-def get_random_coordinates(zone_id=None):
-    """Generate random coordinates within Denver metro or specific zone"""
+# Inclusive estimated-duration range (minutes) per work order category
+DURATION_RANGES = {
+    "hvac": (60, 180),
+    "plumbing": (45, 150),
+    "electrical": (60, 180),
+    "general": (30, 120),
+    "inspection": (30, 90),
+}
+
+
+def sample_coords(zone_id=None, n=1, rng=None):
+    """Return an (n, 2) array of random [lat, lng] rows rounded to 6 places
+
+    Points fall within the given zone, or the Denver metro area when
+    zone_id is None or unknown.
+    """
+    rng = _rng if rng is None else rng
     if zone_id and zone_id in ZONES:
         zone = ZONES[zone_id]
-        lat = random.uniform(zone["lat_range"][0], zone["lat_range"][1])
-        lng = random.uniform(zone["lng_range"][0], zone["lng_range"][1])
+        lat_range, lng_range = zone["lat_range"], zone["lng_range"]
     else:
-        lat = random.uniform(DENVER_LAT_MIN, DENVER_LAT_MAX)
-        lng = random.uniform(DENVER_LNG_MIN, DENVER_LNG_MAX)
-    return round(lat, 6), round(lng, 6)
+        lat_range = (DENVER_LAT_MIN, DENVER_LAT_MAX)
+        lng_range = (DENVER_LNG_MIN, DENVER_LNG_MAX)
+    return np.stack(
+        [
+            rng.uniform(lat_range[0], lat_range[1], n).round(6),
+            rng.uniform(lng_range[0], lng_range[1], n).round(6),
+        ],
+        axis=1,
+    )
+
+
+def get_random_coordinates(zone_id=None, rng=None):
+    """Generate random coordinates within Denver metro or specific zone"""
+    lat, lng = sample_coords(zone_id, 1, rng)[0].tolist()
+    return lat, lng
 
 
+# Keyed on the exact point: zone bounds sit on the 0.01-degree grid, so
+# rounding coordinates into coarser buckets would misassign points near an edge
+@lru_cache(maxsize=8192)
 def get_zone_from_coordinates(lat, lng):
     """Determine zone based on coordinates"""
     for zone_id, zone_info in ZONES.items():
@@ -143,194 +217,221 @@ def get_zone_from_coordinates(lat, lng):
     return "Zone-A"
 
 
-def generate_denver_address(lat, lng):
-    """Generate a realistic Denver address"""
-    street_num = random.randint(100, 9999)
-    street_name = random.choice(DENVER_STREETS)
-
-    # Determine general area for zip code
-    if lat > 39.75:
-        zip_code = random.choice(["80221", "80216", "80238", "80249", "80239"])
-    elif lat < 39.68:
-        zip_code = random.choice(["80110", "80120", "80122", "80111", "80113"])
-    elif lng < -105.00:
-        zip_code = random.choice(["80214", "80215", "80226", "80228", "80227"])
-    elif lng > -104.90:
-        zip_code = random.choice(["80010", "80011", "80012", "80230", "80231"])
-    else:
-        zip_code = random.choice(
-            ["80202", "80203", "80204", "80205", "80206", "80218", "80220"]
+def get_zones_from_coordinates(lats, lngs):
+    """Vectorized get_zone_from_coordinates over arrays of points"""
+    lats = np.asarray(lats, dtype=float)[:, None]
+    lngs = np.asarray(lngs, dtype=float)[:, None]
+    inside = (
+        (lats >= _ZONE_BOUNDS[:, 0])
+        & (lats <= _ZONE_BOUNDS[:, 1])
+        & (lngs >= _ZONE_BOUNDS[:, 2])
+        & (lngs <= _ZONE_BOUNDS[:, 3])
+    )
+    # First matching zone wins, as in the scalar loop
+    return np.where(inside.any(axis=1), _ZONE_IDS[inside.argmax(axis=1)], "Zone-A")
+
+
+def _zip_regions(lats, lngs):
+    """Index into _ZIP_CODES for the general area around each point"""
+    return np.select(
+        [lats > 39.75, lats < 39.68, lngs < -105.00, lngs > -104.90],
+        [0, 1, 2, 3],
+        default=4,
+    )
+
+
+def _generate_addresses(lats, lngs, rng):
+    """Generate one Denver address per point, drawing the randomness in bulk"""
+    n = len(lats)
+    street_nums = rng.integers(100, 10000, n).tolist()
+    street_names = rng.choice(DENVER_STREETS, n).tolist()
+    region = _zip_regions(np.asarray(lats, dtype=float), np.asarray(lngs, dtype=float))
+    zip_idx = (rng.random(n) * _ZIP_COUNTS[region]).astype(np.intp)
+    zip_codes = _ZIP_TABLE[region, zip_idx].tolist()
+
+    return [
+        {
+            "street": f"{street_num} {street_name}",
+            "city": "Denver",
+            "state": "CO",
+            "zip_code": zip_code,
+        }
+        for street_num, street_name, zip_code in zip(
+            street_nums, street_names, zip_codes
         )
+    ]
+
 
-    return {
-        "street": f"{street_num} {street_name}",
-        "city": "Denver",
-        "state": "CO",
-        "zip_code": zip_code,
-    }
+def generate_denver_address(lat, lng):
+    """Generate a realistic Denver address"""
+    return _generate_addresses([lat], [lng], _rng)[0]
 
 
-def generate_properties(count=50):
+def generate_properties(count=50, rng=None):
     """Generate property data"""
-    properties = []
+    rng = _rng if rng is None else rng
 
-    # Distribute properties across zones
+    # Distribute properties across zones, remainder to random zones
     zone_list = list(ZONES.keys())
     properties_per_zone = count // len(zone_list)
+    zone_idx = np.concatenate(
+        [
+            np.repeat(np.arange(len(zone_list)), properties_per_zone),
+            rng.integers(0, len(zone_list), count % len(zone_list)),
+        ]
+    )
 
-    property_id = 1
-    for zone_id in zone_list:
-        for _ in range(properties_per_zone):
-            lat, lng = get_random_coordinates(zone_id)
-            address = generate_denver_address(lat, lng)
-
-            # Determine property type based on distribution
-            rand = random.random()
-            if rand < PROPERTY_TYPES["residential"]:
-                prop_type = "residential"
-                sqft = random.randint(800, 3500)
-            elif rand < PROPERTY_TYPES["residential"] + PROPERTY_TYPES["commercial"]:
-                prop_type = "commercial"
-                sqft = random.randint(2000, 20000)
-            else:
-                prop_type = "industrial"
-                sqft = random.randint(5000, 50000)
-
-            property_data = {
-                "property_id": f"PROP-{property_id:04d}",
-                "address": address,
-                "location": {"type": "Point", "coordinates": [lng, lat]},
-                "property_type": prop_type,
-                "square_footage": sqft,
-                "zone": zone_id,
-                "zone_name": ZONES[zone_id]["name"],
-                "created_at": datetime.now().isoformat(),
-            }
-            properties.append(property_data)
-            property_id += 1
-
-    # Add remaining properties to random zones
-    while len(properties) < count:
-        zone_id = random.choice(zone_list)
-        lat, lng = get_random_coordinates(zone_id)
-        address = generate_denver_address(lat, lng)
-
-        rand = random.random()
-        if rand < PROPERTY_TYPES["residential"]:
-            prop_type = "residential"
-            sqft = random.randint(800, 3500)
-        elif rand < PROPERTY_TYPES["residential"] + PROPERTY_TYPES["commercial"]:
-            prop_type = "commercial"
-            sqft = random.randint(2000, 20000)
-        else:
-            prop_type = "industrial"
-            sqft = random.randint(5000, 50000)
-
-        property_data = {
-            "property_id": f"PROP-{property_id:04d}",
-            "address": address,
-            "location": {"type": "Point", "coordinates": [lng, lat]},
-            "property_type": prop_type,
-            "square_footage": sqft,
+    # Coordinates for every zone in one draw, bounded per row by its zone
+    bounds = _ZONE_BOUNDS[zone_idx]
+    lats = rng.uniform(bounds[:, 0], bounds[:, 1]).round(6).tolist()
+    lngs = rng.uniform(bounds[:, 2], bounds[:, 3]).round(6).tolist()
+    addresses = _generate_addresses(lats, lngs, rng)
+
+    # Determine property type based on distribution, then size within its range
+    prop_types = list(PROPERTY_TYPES)
+    type_idx = rng.choice(len(prop_types), count, p=list(PROPERTY_TYPES.values()))
+    sqft_lo, sqft_hi = np.array([SQFT_RANGES[t] for t in prop_types]).T
+    sqfts = rng.integers(sqft_lo[type_idx], sqft_hi[type_idx] + 1).tolist()
+
+    zone_ids = _ZONE_IDS[zone_idx].tolist()
+    types = np.array(prop_types)[type_idx].tolist()
+    created_at = datetime.now().isoformat()
+    properties = [
+        {
+            "property_id": f"PROP-{i + 1:04d}",
+            "address": addresses[i],
+            "location": {"type": "Point", "coordinates": [lngs[i], lats[i]]},
+            "property_type": types[i],
+            "square_footage": sqfts[i],
             "zone": zone_id,
             "zone_name": ZONES[zone_id]["name"],
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at,
         }
-        properties.append(property_data)
-        property_id += 1
+        for i, zone_id in enumerate(zone_ids)
+    ]
 
     return properties
 
 
-def generate_technicians(count=10):
+def _generate_contacts(count, rng):
+    """Generate (names, emails, phones) lists for count people in bulk"""
+    first = rng.choice(_FIRST_NAMES, count, p=_FIRST_NAME_P).tolist()
+    last = rng.choice(_LAST_NAMES, count, p=_LAST_NAME_P).tolist()
+    domains = rng.choice(_EMAIL_DOMAINS, count).tolist()
+    # NANP numbers: area code and exchange never start with 0 or 1
+    area = rng.integers(200, 1000, count).tolist()
+    exchange = rng.integers(200, 1000, count).tolist()
+    line = rng.integers(0, 10000, count).tolist()
+
+    names = [f"{f} {l}" for f, l in zip(first, last)]
+    emails = [f"{f}.{l}@{d}".lower() for f, l, d in zip(first, last, domains)]
+    phones = [f"({a}){e}-{n:04d}" for a, e, n in zip(area, exchange, line)]
+    return names, emails, phones
+
+
+def generate_technicians(count=10, rng=None):
     """Generate technician data"""
-    technicians = []
+    rng = _rng if rng is None else rng
     zone_list = list(ZONES.keys())
+    other_skills = [s for s in SKILLS if s != "general"]
 
-    for i in range(1, count + 1):
-        # Generate home base in suburbs (slightly outside main zones)
-        lat = random.uniform(DENVER_LAT_MIN, DENVER_LAT_MAX)
-        lng = random.uniform(DENVER_LNG_MIN, DENVER_LNG_MAX)
-        address = generate_denver_address(lat, lng)
+    # Generate home base in suburbs (slightly outside main zones)
+    coords = sample_coords(None, count, rng)
+    lats = coords[:, 0].tolist()
+    lngs = coords[:, 1].tolist()
+    addresses = _generate_addresses(lats, lngs, rng)
 
-        # Each tech has 2-4 skills, always including 'general'
-        num_skills = random.randint(2, 4)
-        tech_skills = ["general"]
-        other_skills = [s for s in SKILLS if s != "general"]
-        tech_skills.extend(random.sample(other_skills, num_skills - 1))
+    # Each tech has 2-4 skills, always including 'general'; a random
+    # permutation per row gives sampling without replacement
+    num_skills = rng.integers(2, 5, count).tolist()
+    skill_order = np.argsort(rng.random((count, len(other_skills))), axis=1)
+
+    # Zone preferences (1-2 zones)
+    num_zones = rng.integers(1, 3, count).tolist()
+    zone_order = np.argsort(rng.random((count, len(zone_list))), axis=1)
 
-        # Zone preferences (1-2 zones)
-        preferred_zones = random.sample(zone_list, random.randint(1, 2))
+    max_hours = rng.choice([8, 8.5, 9, 9.5, 10], count).tolist()
+    max_distances = rng.integers(80, 121, count).tolist()
+    hourly_rates = rng.uniform(25, 55, count).round(2).tolist()
+    names, emails, phones = _generate_contacts(count, rng)
+
+    created_at = datetime.now().isoformat()
+    technicians = []
+    for i in range(count):
+        tech_skills = ["general"]
+        tech_skills.extend(other_skills[j] for j in skill_order[i, : num_skills[i] - 1])
+        preferred_zones = [zone_list[j] for j in zone_order[i, : num_zones[i]]]
 
         technician_data = {
-            "technician_id": f"TECH-{i:03d}",
-            "name": fake.name(),
-            "email": fake.email(),
-            "phone": fake.phone_number(),
+            "technician_id": f"TECH-{i + 1:03d}",
+            "name": names[i],
+            "email": emails[i],
+            "phone": phones[i],
             "home_base": {
-                "address": address,
-                "location": {"type": "Point", "coordinates": [lng, lat]},
+                "address": addresses[i],
+                "location": {"type": "Point", "coordinates": [lngs[i], lats[i]]},
             },
             "skills": tech_skills,
-            "max_daily_hours": random.choice([8, 8.5, 9, 9.5, 10]),
-            "max_daily_distance_miles": random.randint(80, 120),
-            "hourly_rate": round(random.uniform(25, 55), 2),
+            "max_daily_hours": max_hours[i],
+            "max_daily_distance_miles": max_distances[i],
+            "hourly_rate": hourly_rates[i],
             "preferred_zones": preferred_zones,
             "active": True,
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at,
         }
         technicians.append(technician_data)
 
     return technicians
 
 
-def generate_work_orders(count=100, properties=None):
+def generate_work_orders(count=100, properties=None, rng=None):
     """Generate work order data"""
     if not properties:
         raise ValueError("Properties list is required")
+    rng = _rng if rng is None else rng
 
     work_orders = []
-    base_date = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
+    now = datetime.now()
+    base_date = now.replace(hour=8, minute=0, second=0, microsecond=0)
+
+    # Every timestamp is one of a few values; format each once
+    updated_at = now.isoformat()
+    scheduled_date = base_date.date().isoformat()
+    hour_iso = {h: base_date.replace(hour=h).isoformat() for h in range(8, 18)}
+    days_ago_iso = {d: (base_date - timedelta(days=d)).isoformat() for d in range(1, 8)}
 
     # Priority distribution
-    priorities = []
-    for priority, weight in PRIORITY_DISTRIBUTION.items():
-        priorities.extend([priority] * int(count * weight))
-    # Fill remaining to reach exact count
-    while len(priorities) < count:
-        priorities.append("medium")
-    random.shuffle(priorities)
+    priorities = rng.choice(
+        list(PRIORITY_DISTRIBUTION), count, p=list(PRIORITY_DISTRIBUTION.values())
+    ).tolist()
+
+    # Random property, skill category and work order type per order
+    property_idx = rng.integers(0, len(properties), count).tolist()
+    category_idx = rng.integers(0, len(SKILLS), count)
+    type_picks = rng.random(count).tolist()
+
+    # Time window (business hours 8am-5pm), 1-4 hour window
+    window_start_hours = rng.integers(8, 15, count).tolist()
+    window_durations = rng.integers(1, 5, count).tolist()
+
+    # Estimated duration based on category
+    duration_lo, duration_hi = np.array([DURATION_RANGES[s] for s in SKILLS]).T
+    durations = rng.integers(
+        duration_lo[category_idx], duration_hi[category_idx] + 1
+    ).tolist()
+    created_days_ago = rng.integers(1, 8, count).tolist()
 
     for i in range(1, count + 1):
-        # Random property
-        property_data = random.choice(properties)
-
-        # Random skill category
-        skill_category = random.choice(SKILLS)
-        work_order_type = random.choice(WORK_ORDER_CATEGORIES[skill_category])
-
-        # Priority
-        priority = priorities[i - 1] if i - 1 < len(priorities) else "medium"
-
-        # Time window (business hours 8am-5pm)
-        window_start_hour = random.randint(8, 14)
-        window_duration = random.randint(1, 4)  # 1-4 hour window
-        window_start = base_date.replace(hour=window_start_hour)
-        window_end = window_start + timedelta(hours=window_duration)
-
+        property_data = properties[property_idx[i - 1]]
+        skill_category = SKILLS[category_idx[i - 1]]
+        work_order_types = WORK_ORDER_CATEGORIES[skill_category]
+        work_order_type = work_order_types[
+            int(type_picks[i - 1] * len(work_order_types))
+        ]
+
+        window_start_hour = window_start_hours[i - 1]
         # Ensure window doesn't exceed 5pm
-        if window_end.hour > 17:
-            window_end = base_date.replace(hour=17, minute=0)
-
-        # Estimated duration based on category
-        if skill_category == "inspection":
-            duration = random.randint(30, 90)
-        elif skill_category in ["hvac", "electrical"]:
-            duration = random.randint(60, 180)
-        elif skill_category == "plumbing":
-            duration = random.randint(45, 150)
-        else:
-            duration = random.randint(30, 120)
+        window_end_hour = min(window_start_hour + window_durations[i - 1], 17)
 
         work_order_data = {
             "work_order_id": f"WO-{i:05d}",
@@ -341,23 +442,34 @@ def generate_work_orders(count=100, properties=None):
             "work_order_type": work_order_type,
             "category": skill_category,
             "required_skills": [skill_category],
-            "priority": priority,
+            "priority": priorities[i - 1],
             "status": "pending",
-            "scheduled_date": base_date.date().isoformat(),
-            "time_window_start": window_start.isoformat(),
-            "time_window_end": window_end.isoformat(),
-            "estimated_duration_minutes": duration,
+            "scheduled_date": scheduled_date,
+            "time_window_start": hour_iso[window_start_hour],
+            "time_window_end": hour_iso[window_end_hour],
+            "estimated_duration_minutes": durations[i - 1],
             "description": f"{work_order_type} at {property_data['address']['street']}",
-            "created_at": (
-                base_date - timedelta(days=random.randint(1, 7))
-            ).isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": days_ago_iso[created_days_ago[i - 1]],
+            "updated_at": updated_at,
         }
         work_orders.append(work_order_data)
 
     return work_orders
 
 
+def write_json(data, path, pretty=False):
+    """Write data as JSON, via orjson when it is installed
+
+    Output is compact unless pretty is set, which indents by 2 spaces.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2 if pretty else None)
+
+
 def print_summary(properties, technicians, work_orders):
     """Print summary statistics"""
     print("\n" + "=" * 70)
@@ -365,13 +477,8 @@ def print_summary(properties, technicians, work_orders):
     print("=" * 70)
 
     print(f"\nPROPERTIES: {len(properties)} total")
-    prop_type_count = {}
-    zone_count = {}
-    for prop in properties:
-        prop_type_count[prop["property_type"]] = (
-            prop_type_count.get(prop["property_type"], 0) + 1
-        )
-        zone_count[prop["zone"]] = zone_count.get(prop["zone"], 0) + 1
+    prop_type_count = Counter(prop["property_type"] for prop in properties)
+    zone_count = Counter(prop["zone"] for prop in properties)
 
     for ptype, count in sorted(prop_type_count.items()):
         pct = (count / len(properties)) * 100
@@ -395,11 +502,8 @@ def print_summary(properties, technicians, work_orders):
     print(f"  - Average max daily hours: {avg_max_hours:.1f}")
 
     print(f"\nWORK ORDERS: {len(work_orders)} total")
-    priority_count = {}
-    category_count = {}
-    for wo in work_orders:
-        priority_count[wo["priority"]] = priority_count.get(wo["priority"], 0) + 1
-        category_count[wo["category"]] = category_count.get(wo["category"], 0) + 1
+    priority_count = Counter(wo["priority"] for wo in work_orders)
+    category_count = Counter(wo["category"] for wo in work_orders)
 
     print(f"  By Priority:")
     for priority in ["emergency", "high", "medium", "low"]:
@@ -422,6 +526,16 @@ def print_summary(properties, technicians, work_orders):
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(
+        description="Generate simulated Denver data for the optimization engine"
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON output for reading (default: compact)",
+    )
+    args = parser.parse_args()
+
     print("Generating data for Route Optimization Engine...")
     print(f"Target area: Denver, CO metropolitan area")
     print(
@@ -445,16 +559,13 @@ def main():
     # Write to JSON files
     print(f"\nWriting data to {output_dir}...")
 
-    with open(output_dir / "properties.json", "w") as f:
-        json.dump(properties, f, indent=2)
+    write_json(properties, output_dir / "properties.json", args.pretty)
     print(f"  - properties.json ({len(properties)} records)")
 
-    with open(output_dir / "technicians.json", "w") as f:
-        json.dump(technicians, f, indent=2)
+    write_json(technicians, output_dir / "technicians.json", args.pretty)
     print(f"  - technicians.json ({len(technicians)} records)")
 
-    with open(output_dir / "work_orders.json", "w") as f:
-        json.dump(work_orders, f, indent=2)
+    write_json(work_orders, output_dir / "work_orders.json", args.pretty)
     print(f"  - work_orders.json ({len(work_orders)} records)")
 
     # Print summary
@@ -5,19 +5,39 @@ Loads generated JSON data into MongoDB collections with proper indexing
 """
 
 import argparse
+import hashlib
+import importlib.util
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
+from _ioutil import JSON_ERRORS, iter_items
 from dotenv import load_dotenv
-from pymongo import ASCENDING, GEOSPHERE, MongoClient
+from pymongo import ASCENDING, GEOSPHERE, IndexModel, MongoClient, UpdateOne
 from pymongo.errors import ConnectionFailure, OperationFailure
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used when absent
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+# Upserts sent per bulk_write round-trip
+BULK_BATCH_SIZE = 1000
+
+# Wire compressors whose Python modules are installed, best first
+WIRE_COMPRESSORS = ",".join(
+    name
+    for name, module in (("zstd", "zstandard"), ("snappy", "snappy"), ("zlib", "zlib"))
+    if importlib.util.find_spec(module)
+)
+
 
 def get_mongo_client(uri=None):
     """Create and return MongoDB client"""
@@ -25,7 +45,19 @@ def get_mongo_client(uri=None):
         uri = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
 
     try:
-        client = MongoClient(uri, serverSelectionTimeoutMS=5000)
+        # One-shot bulk load: a small warm pool, acknowledged but unjournaled
+        # writes, and compressed batches
+        client = MongoClient(
+            uri,
+            serverSelectionTimeoutMS=5000,
+            maxPoolSize=32,
+            minPoolSize=3,
+            maxIdleTimeMS=300000,
+            w=1,
+            journal=False,
+            retryWrites=True,
+            compressors=WIRE_COMPRESSORS,
+        )
         # Test connection
         client.admin.command("ping")
         return client
@@ -34,149 +66,192 @@ def get_mongo_client(uri=None):
         sys.exit(1)
 
 
-def create_indexes(db):
-    """Create indexes for all collections"""
-    print("\nCreating indexes...")
-
-    # Properties collection indexes
-    try:
-        db.properties.create_index([("property_id", ASCENDING)], unique=True)
-        db.properties.create_index([("location", GEOSPHERE)])
-        db.properties.create_index([("zone", ASCENDING)])
-        db.properties.create_index([("property_type", ASCENDING)])
-        print("  - Properties indexes created")
-    except OperationFailure as e:
-        print(f"  - Warning: Could not create properties indexes: {e}")
-
-    # Technicians collection indexes
-    try:
-        db.technicians.create_index([("technician_id", ASCENDING)], unique=True)
-        db.technicians.create_index([("home_base.location", GEOSPHERE)])
-        db.technicians.create_index([("skills", ASCENDING)])
-        db.technicians.create_index([("active", ASCENDING)])
-        db.technicians.create_index([("preferred_zones", ASCENDING)])
-        print("  - Technicians indexes created")
-    except OperationFailure as e:
-        print(f"  - Warning: Could not create technicians indexes: {e}")
-
-    # Work orders collection indexes
-    try:
-        db.work_orders.create_index([("work_order_id", ASCENDING)], unique=True)
-        db.work_orders.create_index([("property_id", ASCENDING)])
-        db.work_orders.create_index([("location", GEOSPHERE)])
-        db.work_orders.create_index([("zone", ASCENDING)])
-        db.work_orders.create_index([("status", ASCENDING)])
-        db.work_orders.create_index([("priority", ASCENDING)])
-        db.work_orders.create_index([("scheduled_date", ASCENDING)])
-        db.work_orders.create_index([("category", ASCENDING)])
-        db.work_orders.create_index([("required_skills", ASCENDING)])
-        print("  - Work orders indexes created")
-    except OperationFailure as e:
-        print(f"  - Warning: Could not create work_orders indexes: {e}")
-
-    # Routes collection indexes (for optimization results)
-    try:
-        db.routes.create_index([("route_id", ASCENDING)])
-        db.routes.create_index([("technician_id", ASCENDING)])
-        db.routes.create_index([("scheduled_date", ASCENDING)])
-        db.routes.create_index([("algorithm", ASCENDING)])
-        db.routes.create_index([("created_at", ASCENDING)])
-        print("  - Routes indexes created")
-    except OperationFailure as e:
-        print(f"  - Warning: Could not create routes indexes: {e}")
-
-    # Optimization results collection indexes
-    try:
-        db.optimization_results.create_index([("run_id", ASCENDING)])
-        db.optimization_results.create_index([("algorithm", ASCENDING)])
-        db.optimization_results.create_index([("scheduled_date", ASCENDING)])
-        db.optimization_results.create_index([("created_at", ASCENDING)])
-        print("  - Optimization results indexes created")
-    except OperationFailure as e:
-        print(f"  - Warning: Could not create optimization_results indexes: {e}")
-
-
-def load_json_file(file_path):
-    """Load data from JSON file"""
-    try:
-        with open(file_path, "r") as f:
-            data = json.load(f)
-        return data
-    except FileNotFoundError:
-        print(f"ERROR: File not found: {file_path}")
-        return None
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Invalid JSON in {file_path}: {e}")
-        return None
-
-
-def upsert_properties(collection, properties):
-    """Upsert properties data"""
-    print(f"\nUpserting {len(properties)} properties...")
-
+def _asc(*fields):
+    """Ascending index keys for the given fields"""
+    return [(field, ASCENDING) for field in fields]
+
+
+# Index definitions per collection, with the label used in progress output
+COLLECTION_INDEXES = {
+    "properties": (
+        "Properties",
+        [
+            IndexModel(_asc("property_id"), unique=True),
+            IndexModel([("location", GEOSPHERE)]),
+            IndexModel(_asc("zone")),
+            IndexModel(_asc("property_type")),
+        ],
+    ),
+    "technicians": (
+        "Technicians",
+        [
+            IndexModel(_asc("technician_id"), unique=True),
+            IndexModel([("home_base.location", GEOSPHERE)]),
+            IndexModel(_asc("skills")),
+            IndexModel(_asc("active")),
+            IndexModel(_asc("preferred_zones")),
+        ],
+    ),
+    "work_orders": (
+        "Work orders",
+        [
+            IndexModel(_asc("work_order_id"), unique=True),
+            IndexModel(_asc("property_id")),
+            IndexModel([("location", GEOSPHERE)]),
+            IndexModel(_asc("zone")),
+            IndexModel(_asc("status")),
+            IndexModel(_asc("priority")),
+            IndexModel(_asc("scheduled_date")),
+            IndexModel(_asc("category")),
+            IndexModel(_asc("required_skills")),
+        ],
+    ),
+    "routes": (
+        "Routes",
+        [
+            IndexModel(_asc("route_id")),
+            IndexModel(_asc("technician_id")),
+            IndexModel(_asc("scheduled_date")),
+            IndexModel(_asc("algorithm")),
+            IndexModel(_asc("created_at")),
+        ],
+    ),
+    "optimization_results": (
+        "Optimization results",
+        [
+            IndexModel(_asc("run_id")),
+            IndexModel(_asc("algorithm")),
+            IndexModel(_asc("scheduled_date")),
+            IndexModel(_asc("created_at")),
+        ],
+    ),
+}
+
+
+def create_indexes(db, unique=True, secondary=True):
+    """Create indexes for all collections, one create_indexes call each
+
+    unique: create the unique key indexes (upserts match on these).
+    secondary: create the remaining query indexes.
+    """
+    if unique and secondary:
+        print("\nCreating indexes...")
+    elif unique:
+        print("\nCreating unique key indexes...")
+    else:
+        print("\nCreating secondary indexes...")
+
+    for coll_name, (label, models) in COLLECTION_INDEXES.items():
+        models = [
+            model
+            for model in models
+            if (unique if model.document.get("unique") else secondary)
+        ]
+        if not models:
+            continue
+        try:
+            db[coll_name].create_indexes(models)
+            print(f"  - {label} indexes created")
+        except OperationFailure as e:
+            print(f"  - Warning: Could not create {coll_name} indexes: {e}")
+
+
+def content_hash(doc):
+    """Return a stable hex digest of a document's content"""
+    if orjson is not None:
+        data = orjson.dumps(doc, option=orjson.OPT_SORT_KEYS)
+    else:
+        # Unescaped UTF-8 like orjson, so stored hashes stay valid whichever
+        # encoder is installed (only exponent-form floats still differ)
+        data = json.dumps(
+            doc, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def bulk_upsert(collection, documents, key, log=print):
+    """Upsert documents matched on key with unordered bulk writes
+
+    documents may be any iterable; it is consumed BULK_BATCH_SIZE at a time.
+    Each stored document carries a _hash of its content, and documents whose
+    stored hash already matches are not sent, so re-seeding unchanged data
+    rewrites nothing. Returns (inserted, updated) counts.
+    """
+    total = 0
+    unchanged = 0
     inserted = 0
     updated = 0
 
-    for prop in properties:
-        result = collection.update_one(
-            {"property_id": prop["property_id"]}, {"$set": prop}, upsert=True
-        )
-        if result.upserted_id:
-            inserted += 1
-        elif result.modified_count > 0:
-            updated += 1
-
-    print(f"  - Inserted: {inserted}")
-    print(f"  - Updated: {updated}")
-    print(f"  - Total in collection: {collection.count_documents({})}")
+    documents = iter(documents)
+    while batch := list(islice(documents, BULK_BATCH_SIZE)):
+        # One indexed lookup per batch; a {"_hash": {"$ne": h}} upsert filter
+        # would instead try to insert a duplicate key for unchanged documents
+        stored = {
+            doc[key]: doc.get("_hash")
+            for doc in collection.find(
+                {key: {"$in": [doc[key] for doc in batch]}},
+                {key: 1, "_hash": 1, "_id": 0},
+            )
+        }
+        ops = []
+        for doc in batch:
+            digest = content_hash(doc)
+            if stored.get(doc[key]) != digest:
+                ops.append(
+                    UpdateOne(
+                        {key: doc[key]}, {"$set": {**doc, "_hash": digest}}, upsert=True
+                    )
+                )
+
+        total += len(batch)
+        unchanged += len(batch) - len(ops)
+        if ops:
+            result = collection.bulk_write(ops, ordered=False)
+            inserted += result.upserted_count
+            updated += result.modified_count
+
+    log(f"  - Documents: {total}")
+    log(f"  - Unchanged: {unchanged}")
+    log(f"  - Inserted: {inserted}")
+    log(f"  - Updated: {updated}")
+    log(f"  - Total in collection: {collection.estimated_document_count()}")
 
     return inserted, updated
 
 
-def upsert_technicians(collection, technicians):
-    """Upsert technicians data"""
-    print(f"\nUpserting {len(technicians)} technicians...")
-
-    inserted = 0
-    updated = 0
-
-    for tech in technicians:
-        result = collection.update_one(
-            {"technician_id": tech["technician_id"]}, {"$set": tech}, upsert=True
-        )
-        if result.upserted_id:
-            inserted += 1
-        elif result.modified_count > 0:
-            updated += 1
+def upsert_properties(collection, properties, log=print):
+    """Upsert properties data"""
+    log("\nUpserting properties...")
+    return bulk_upsert(collection, properties, "property_id", log)
 
-    print(f"  - Inserted: {inserted}")
-    print(f"  - Updated: {updated}")
-    print(f"  - Total in collection: {collection.count_documents({})}")
 
-    return inserted, updated
+def upsert_technicians(collection, technicians, log=print):
+    """Upsert technicians data"""
+    log("\nUpserting technicians...")
+    return bulk_upsert(collection, technicians, "technician_id", log)
 
 
-def upsert_work_orders(collection, work_orders):
+def upsert_work_orders(collection, work_orders, log=print):
     """Upsert work orders data"""
-    print(f"\nUpserting {len(work_orders)} work orders...")
-
-    inserted = 0
-    updated = 0
+    log("\nUpserting work orders...")
+    return bulk_upsert(collection, work_orders, "work_order_id", log)
 
-    for wo in work_orders:
-        result = collection.update_one(
-            {"work_order_id": wo["work_order_id"]}, {"$set": wo}, upsert=True
-        )
-        if result.upserted_id:
-            inserted += 1
-        elif result.modified_count > 0:
-            updated += 1
 
-    print(f"  - Inserted: {inserted}")
-    print(f"  - Updated: {updated}")
-    print(f"  - Total in collection: {collection.count_documents({})}")
+def load_collection(upsert, collection, file_path, label):
+    """Stream one JSON file into upsert, returning the buffered output lines
 
-    return inserted, updated
+    Output is buffered so concurrent loaders do not interleave their lines.
+    """
+    lines = []
+    try:
+        upsert(collection, iter_items(file_path), lines.append)
+    except FileNotFoundError:
+        lines.append(f"ERROR: File not found: {file_path}")
+        lines.append(f"WARNING: Skipping {label} (file not found or invalid)")
+    except JSON_ERRORS as e:
+        lines.append(f"ERROR: Invalid JSON in {file_path}: {e}")
+        lines.append(f"WARNING: Stopped loading {label} at the invalid document")
+    return lines
 
 
 def clear_collections(db, collections):
@@ -208,6 +283,11 @@ def main():
     parser.add_argument(
         "--clear", action="store_true", help="Clear collections before loading"
     )
+    parser.add_argument(
+        "--verify-count",
+        action="store_true",
+        help="Print exact summary counts instead of metadata estimates",
+    )
 
     args = parser.parse_args()
 
@@ -233,54 +313,58 @@ def main():
     db = client[args.db]
     print(f"  - Connected to database: {args.db}")
 
-    # Clear collections if requested
-    if args.clear:
-        clear_collections(db, ["properties", "technicians", "work_orders"])
-
-    # Create indexes
-    create_indexes(db)
-
-    # Load and upsert properties
-    properties_file = data_dir / "properties.json"
-    properties = load_json_file(properties_file)
-    if properties:
-        upsert_properties(db.properties, properties)
-    else:
-        print(f"WARNING: Skipping properties (file not found or invalid)")
-
-    # Load and upsert technicians
-    technicians_file = data_dir / "technicians.json"
-    technicians = load_json_file(technicians_file)
-    if technicians:
-        upsert_technicians(db.technicians, technicians)
-    else:
-        print(f"WARNING: Skipping technicians (file not found or invalid)")
-
-    # Load and upsert work orders
-    work_orders_file = data_dir / "work_orders.json"
-    work_orders = load_json_file(work_orders_file)
-    if work_orders:
-        upsert_work_orders(db.work_orders, work_orders)
-    else:
-        print(f"WARNING: Skipping work orders (file not found or invalid)")
-
-    # Final summary
-    print("\n" + "=" * 70)
-    print("LOAD SUMMARY")
-    print("=" * 70)
-    print(f"Database: {args.db}")
-    print(f"Collections:")
-    print(f"  - properties: {db.properties.count_documents({})} documents")
-    print(f"  - technicians: {db.technicians.count_documents({})} documents")
-    print(f"  - work_orders: {db.work_orders.count_documents({})} documents")
-    print(f"  - routes: {db.routes.count_documents({})} documents")
-    print(
-        f"  - optimization_results: {db.optimization_results.count_documents({})} documents"
-    )
-    print("=" * 70)
-    print("\nData load complete!")
-
-    client.close()
+    try:
+        # Clear collections if requested. Loading into empty collections only
+        # needs the unique keys the upserts match on; the secondary indexes
+        # are then built once over the loaded data instead of maintained
+        # per write.
+        if args.clear:
+            clear_collections(db, ["properties", "technicians", "work_orders"])
+            create_indexes(db, secondary=False)
+        else:
+            create_indexes(db)
+
+        # Load and upsert the three collections concurrently; PyMongo is
+        # thread-safe and each worker checks out its own pooled connection
+        jobs = [
+            (upsert_properties, db.properties, "properties"),
+            (upsert_technicians, db.technicians, "technicians"),
+            (upsert_work_orders, db.work_orders, "work orders"),
+        ]
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [
+                executor.submit(
+                    load_collection,
+                    upsert,
+                    collection,
+                    data_dir / f"{collection.name}.json",
+                    label,
+                )
+                for upsert, collection, label in jobs
+            ]
+            for future in futures:
+                print("\n".join(future.result()))
+
+        if args.clear:
+            create_indexes(db, unique=False)
+
+        # Final summary
+        print("\n" + "=" * 70)
+        print("LOAD SUMMARY")
+        print("=" * 70)
+        print(f"Database: {args.db}")
+        print(f"Collections:")
+        for coll_name in COLLECTION_INDEXES:
+            collection = db[coll_name]
+            if args.verify_count:
+                count = collection.count_documents({})
+            else:
+                count = collection.estimated_document_count()
+            print(f"  - {coll_name}: {count} documents")
+        print("=" * 70)
+        print("\nData load complete!")
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
@@ -5,210 +5,566 @@ Generates INSERT statements for Snowflake RAW schema tables
 """
 
 import argparse
+import gzip
 import json
+import multiprocessing
+import os
 import sys
 from datetime import datetime
+from functools import partial
+from itertools import islice
 from pathlib import Path
 
+from _ioutil import JSON_ERRORS, iter_items
+from dotenv import load_dotenv
+
+try:
+    import snowflake.connector
+except ImportError:  # only needed for --connect
+    snowflake = None
+
+try:
+    import pandas as pd
+    from snowflake.connector.pandas_tools import write_pandas
+except ImportError:  # optional; --connect falls back to executemany binds
+    pd = None
+
+# Load environment variables
+load_dotenv()
+
+INSERT_BATCH_SIZE = 500
+
+# Rows per executemany call; the connector stages large bind arrays itself
+BIND_BATCH_SIZE = 16_384
+
+# Rows per worker task; smaller inputs are formatted in-process
+PARALLEL_CHUNK_SIZE = 50_000
+
+PROPERTY_COLUMNS = (
+    "PROPERTY_ID",
+    "STREET",
+    "CITY",
+    "STATE",
+    "ZIP_CODE",
+    "LOCATION_LAT",
+    "LOCATION_LNG",
+    "LOCATION_GEOJSON",
+    "PROPERTY_TYPE",
+    "SQUARE_FOOTAGE",
+    "ZONE",
+    "ZONE_NAME",
+    "CREATED_AT",
+)
+TECHNICIAN_COLUMNS = (
+    "TECHNICIAN_ID",
+    "NAME",
+    "EMAIL",
+    "PHONE",
+    "HOME_BASE_STREET",
+    "HOME_BASE_CITY",
+    "HOME_BASE_STATE",
+    "HOME_BASE_ZIP_CODE",
+    "HOME_BASE_LAT",
+    "HOME_BASE_LNG",
+    "HOME_BASE_GEOJSON",
+    "SKILLS",
+    "MAX_DAILY_HOURS",
+    "MAX_DAILY_DISTANCE_MILES",
+    "HOURLY_RATE",
+    "PREFERRED_ZONES",
+    "ACTIVE",
+    "CREATED_AT",
+)
+WORK_ORDER_COLUMNS = (
+    "WORK_ORDER_ID",
+    "PROPERTY_ID",
+    "PROPERTY_STREET",
+    "PROPERTY_CITY",
+    "PROPERTY_STATE",
+    "PROPERTY_ZIP_CODE",
+    "LOCATION_LAT",
+    "LOCATION_LNG",
+    "LOCATION_GEOJSON",
+    "ZONE",
+    "WORK_ORDER_TYPE",
+    "CATEGORY",
+    "REQUIRED_SKILLS",
+    "PRIORITY",
+    "STATUS",
+    "SCHEDULED_DATE",
+    "TIME_WINDOW_START",
+    "TIME_WINDOW_END",
+    "ESTIMATED_DURATION_MINUTES",
+    "DESCRIPTION",
+    "CREATED_AT",
+    "UPDATED_AT",
+)
+
+# Shared (lng, lat) default for rows without coordinates
+_EMPTY_COORDS = (None, None)
+
+PROPERTY_VARIANT_COLUMNS = {"LOCATION_GEOJSON"}
+TECHNICIAN_VARIANT_COLUMNS = {"HOME_BASE_GEOJSON", "SKILLS", "PREFERRED_ZONES"}
+WORK_ORDER_VARIANT_COLUMNS = {"LOCATION_GEOJSON", "REQUIRED_SKILLS"}
+
+TABLE_COLUMNS = {
+    "PROPERTIES": (PROPERTY_COLUMNS, PROPERTY_VARIANT_COLUMNS),
+    "TECHNICIANS": (TECHNICIAN_COLUMNS, TECHNICIAN_VARIANT_COLUMNS),
+    "WORK_ORDERS": (WORK_ORDER_COLUMNS, WORK_ORDER_VARIANT_COLUMNS),
+}
+
+
+try:
+    import orjson
+
+    def _encode_json(data):
+        return orjson.dumps(data).decode()
+
+except ImportError:  # optional; the stdlib encoder is used when absent
+    # Built once: json.dumps with non-default separators constructs a new
+    # encoder on every call
+    _encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
 
 def escape_sql_string(value):
     """Escape string for SQL"""
     if value is None:
         return "NULL"
-    return "'" + str(value).replace("'", "''") + "'"
+    value = str(value)
+    if "'" in value:
+        value = value.replace("'", "''")
+    return f"'{value}'"
+
+
+def format_number(value):
+    """Format a numeric value for SQL"""
+    if value is None:
+        return "NULL"
+    return str(value)
 
 
 def format_variant_json(data):
-    """Format Python dict/list as Snowflake VARIANT JSON string"""
+    """Format Python dict/list as a JSON string literal for a VARIANT column"""
     if data is None:
         return "NULL"
-    json_str = json.dumps(data, separators=(",", ":"))
+    json_str = _encode_json(data)
     # Escape single quotes for SQL
-    json_str = json_str.replace("'", "''")
-    return f"PARSE_JSON('{json_str}')"
-
-
-def generate_properties_inserts(properties):
-    """Generate INSERT statements for properties table"""
-    sql_lines = []
-    sql_lines.append("-- Properties INSERT statements")
-    sql_lines.append("-- Generated: " + datetime.now().isoformat())
-    sql_lines.append("")
-
-    for prop in properties:
-        address = prop.get("address", {})
-        location = prop.get("location", {})
-
-        insert = f"""INSERT INTO RAW.PROPERTIES (
-    PROPERTY_ID,
-    STREET,
-    CITY,
-    STATE,
-    ZIP_CODE,
-    LOCATION_LAT,
-    LOCATION_LNG,
-    LOCATION_GEOJSON,
-    PROPERTY_TYPE,
-    SQUARE_FOOTAGE,
-    ZONE,
-    ZONE_NAME,
-    CREATED_AT
-) VALUES (
-    {escape_sql_string(prop.get("property_id"))},
-    {escape_sql_string(address.get("street"))},
-    {escape_sql_string(address.get("city"))},
-    {escape_sql_string(address.get("state"))},
-    {escape_sql_string(address.get("zip_code"))},
-    {location.get("coordinates", [None, None])[1]},
-    {location.get("coordinates", [None, None])[0]},
-    {format_variant_json(location)},
-    {escape_sql_string(prop.get("property_type"))},
-    {prop.get("square_footage", "NULL")},
-    {escape_sql_string(prop.get("zone"))},
-    {escape_sql_string(prop.get("zone_name"))},
-    {escape_sql_string(prop.get("created_at"))}
-);"""
-        sql_lines.append(insert)
-        sql_lines.append("")
-
-    return sql_lines
-
-
-def generate_technicians_inserts(technicians):
-    """Generate INSERT statements for technicians table"""
-    sql_lines = []
-    sql_lines.append("-- Technicians INSERT statements")
-    sql_lines.append("-- Generated: " + datetime.now().isoformat())
-    sql_lines.append("")
-
-    for tech in technicians:
-        home_base = tech.get("home_base", {})
-        address = home_base.get("address", {})
-        location = home_base.get("location", {})
-
-        insert = f"""INSERT INTO RAW.TECHNICIANS (
-    TECHNICIAN_ID,
-    NAME,
-    EMAIL,
-    PHONE,
-    HOME_BASE_STREET,
-    HOME_BASE_CITY,
-    HOME_BASE_STATE,
-    HOME_BASE_ZIP_CODE,
-    HOME_BASE_LAT,
-    HOME_BASE_LNG,
-    HOME_BASE_GEOJSON,
-    SKILLS,
-    MAX_DAILY_HOURS,
-    MAX_DAILY_DISTANCE_MILES,
-    HOURLY_RATE,
-    PREFERRED_ZONES,
-    ACTIVE,
-    CREATED_AT
-) VALUES (
-    {escape_sql_string(tech.get("technician_id"))},
-    {escape_sql_string(tech.get("name"))},
-    {escape_sql_string(tech.get("email"))},
-    {escape_sql_string(tech.get("phone"))},
-    {escape_sql_string(address.get("street"))},
-    {escape_sql_string(address.get("city"))},
-    {escape_sql_string(address.get("state"))},
-    {escape_sql_string(address.get("zip_code"))},
-    {location.get("coordinates", [None, None])[1]},
-    {location.get("coordinates", [None, None])[0]},
-    {format_variant_json(location)},
-    {format_variant_json(tech.get("skills"))},
-    {tech.get("max_daily_hours", "NULL")},
-    {tech.get("max_daily_distance_miles", "NULL")},
-    {tech.get("hourly_rate", "NULL")},
-    {format_variant_json(tech.get("preferred_zones"))},
-    {str(tech.get("active", True)).upper()},
-    {escape_sql_string(tech.get("created_at"))}
-);"""
-        sql_lines.append(insert)
-        sql_lines.append("")
-
-    return sql_lines
-
-
-def generate_work_orders_inserts(work_orders):
-    """Generate INSERT statements for work_orders table"""
-    sql_lines = []
-    sql_lines.append("-- Work Orders INSERT statements")
-    sql_lines.append("-- Generated: " + datetime.now().isoformat())
-    sql_lines.append("")
-
-    for wo in work_orders:
-        address = wo.get("property_address", {})
-        location = wo.get("location", {})
-
-        insert = f"""INSERT INTO RAW.WORK_ORDERS (
-    WORK_ORDER_ID,
-    PROPERTY_ID,
-    PROPERTY_STREET,
-    PROPERTY_CITY,
-    PROPERTY_STATE,
-    PROPERTY_ZIP_CODE,
-    LOCATION_LAT,
-    LOCATION_LNG,
-    LOCATION_GEOJSON,
-    ZONE,
-    WORK_ORDER_TYPE,
-    CATEGORY,
-    REQUIRED_SKILLS,
-    PRIORITY,
-    STATUS,
-    SCHEDULED_DATE,
-    TIME_WINDOW_START,
-    TIME_WINDOW_END,
-    ESTIMATED_DURATION_MINUTES,
-    DESCRIPTION,
-    CREATED_AT,
-    UPDATED_AT
-) VALUES (
-    {escape_sql_string(wo.get("work_order_id"))},
-    {escape_sql_string(wo.get("property_id"))},
-    {escape_sql_string(address.get("street"))},
-    {escape_sql_string(address.get("city"))},
-    {escape_sql_string(address.get("state"))},
-    {escape_sql_string(address.get("zip_code"))},
-    {location.get("coordinates", [None, None])[1]},
-    {location.get("coordinates", [None, None])[0]},
-    {format_variant_json(location)},
-    {escape_sql_string(wo.get("zone"))},
-    {escape_sql_string(wo.get("work_order_type"))},
-    {escape_sql_string(wo.get("category"))},
-    {format_variant_json(wo.get("required_skills"))},
-    {escape_sql_string(wo.get("priority"))},
-    {escape_sql_string(wo.get("status"))},
-    {escape_sql_string(wo.get("scheduled_date"))},
-    {escape_sql_string(wo.get("time_window_start"))},
-    {escape_sql_string(wo.get("time_window_end"))},
-    {wo.get("estimated_duration_minutes", "NULL")},
-    {escape_sql_string(wo.get("description"))},
-    {escape_sql_string(wo.get("created_at"))},
-    {escape_sql_string(wo.get("updated_at"))}
-);"""
-        sql_lines.append(insert)
-        sql_lines.append("")
-
-    return sql_lines
+    if "'" in json_str:
+        json_str = json_str.replace("'", "''")
+    return f"'{json_str}'"
+
+
+def insert_header(table, columns, variant_columns):
+    """Build the INSERT ... SELECT ... FROM VALUES prefix for a table
+
+    Snowflake rejects PARSE_JSON inside a VALUES list, so VARIANT columns
+    are passed as JSON strings and parsed in the SELECT.
+    """
+    select = ", ".join(
+        f"PARSE_JSON(${i})" if column in variant_columns else f"${i}"
+        for i, column in enumerate(columns, 1)
+    )
+    return (
+        f"INSERT INTO RAW.{table} ({', '.join(columns)})\n"
+        f"SELECT {select}\n"
+        "FROM VALUES\n"
+    )
+
+
+def generate_batched_inserts(header, value_rows, batch_size=INSERT_BATCH_SIZE):
+    """Yield one multi-row INSERT statement per batch_size value rows"""
+    value_rows = iter(value_rows)
+    while batch := list(islice(value_rows, batch_size)):
+        yield header + ",\n".join(batch) + ";"
+        yield ""
+
+
+def format_value_rows(value_fn, documents):
+    """Format a chunk of documents as VALUES rows"""
+    return [value_fn(doc) for doc in documents]
+
+
+def iter_value_rows(value_fn, documents, workers=None):
+    """Yield VALUES rows in order, formatting large inputs across processes"""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(documents) <= PARALLEL_CHUNK_SIZE:
+        yield from map(value_fn, documents)
+        return
+
+    chunks = (
+        documents[i : i + PARALLEL_CHUNK_SIZE]
+        for i in range(0, len(documents), PARALLEL_CHUNK_SIZE)
+    )
+    with multiprocessing.Pool(workers) as pool:
+        for rows in pool.imap(partial(format_value_rows, value_fn), chunks):
+            yield from rows
+
+
+def property_values(prop):
+    """Format a property as one VALUES row"""
+    address = prop.get("address") or {}
+    location = prop.get("location") or {}
+    coordinates = location.get("coordinates") or _EMPTY_COORDS
+
+    values = [
+        escape_sql_string(prop.get("property_id")),
+        escape_sql_string(address.get("street")),
+        escape_sql_string(address.get("city")),
+        escape_sql_string(address.get("state")),
+        escape_sql_string(address.get("zip_code")),
+        format_number(coordinates[1]),
+        format_number(coordinates[0]),
+        format_variant_json(location or None),
+        escape_sql_string(prop.get("property_type")),
+        format_number(prop.get("square_footage")),
+        escape_sql_string(prop.get("zone")),
+        escape_sql_string(prop.get("zone_name")),
+        escape_sql_string(prop.get("created_at")),
+    ]
+    return "    (" + ", ".join(values) + ")"
+
+
+def generate_properties_inserts(properties, workers=None):
+    """Yield INSERT statement lines for properties table"""
+    yield "-- Properties INSERT statements"
+    yield "-- Generated: " + datetime.now().isoformat()
+    yield ""
+
+    header = insert_header("PROPERTIES", PROPERTY_COLUMNS, PROPERTY_VARIANT_COLUMNS)
+    value_rows = iter_value_rows(property_values, properties, workers)
+    yield from generate_batched_inserts(header, value_rows)
+
+
+def technician_values(tech):
+    """Format a technician as one VALUES row"""
+    home_base = tech.get("home_base") or {}
+    address = home_base.get("address") or {}
+    location = home_base.get("location") or {}
+    coordinates = location.get("coordinates") or _EMPTY_COORDS
+
+    values = [
+        escape_sql_string(tech.get("technician_id")),
+        escape_sql_string(tech.get("name")),
+        escape_sql_string(tech.get("email")),
+        escape_sql_string(tech.get("phone")),
+        escape_sql_string(address.get("street")),
+        escape_sql_string(address.get("city")),
+        escape_sql_string(address.get("state")),
+        escape_sql_string(address.get("zip_code")),
+        format_number(coordinates[1]),
+        format_number(coordinates[0]),
+        format_variant_json(location or None),
+        format_variant_json(tech.get("skills")),
+        format_number(tech.get("max_daily_hours")),
+        format_number(tech.get("max_daily_distance_miles")),
+        format_number(tech.get("hourly_rate")),
+        format_variant_json(tech.get("preferred_zones")),
+        str(tech.get("active", True)).upper(),
+        escape_sql_string(tech.get("created_at")),
+    ]
+    return "    (" + ", ".join(values) + ")"
+
+
+def generate_technicians_inserts(technicians, workers=None):
+    """Yield INSERT statement lines for technicians table"""
+    yield "-- Technicians INSERT statements"
+    yield "-- Generated: " + datetime.now().isoformat()
+    yield ""
+
+    header = insert_header(
+        "TECHNICIANS", TECHNICIAN_COLUMNS, TECHNICIAN_VARIANT_COLUMNS
+    )
+    value_rows = iter_value_rows(technician_values, technicians, workers)
+    yield from generate_batched_inserts(header, value_rows)
+
+
+def work_order_values(wo):
+    """Format a work order as one VALUES row"""
+    address = wo.get("property_address") or {}
+    location = wo.get("location") or {}
+    coordinates = location.get("coordinates") or _EMPTY_COORDS
+
+    values = [
+        escape_sql_string(wo.get("work_order_id")),
+        escape_sql_string(wo.get("property_id")),
+        escape_sql_string(address.get("street")),
+        escape_sql_string(address.get("city")),
+        escape_sql_string(address.get("state")),
+        escape_sql_string(address.get("zip_code")),
+        format_number(coordinates[1]),
+        format_number(coordinates[0]),
+        format_variant_json(location or None),
+        escape_sql_string(wo.get("zone")),
+        escape_sql_string(wo.get("work_order_type")),
+        escape_sql_string(wo.get("category")),
+        format_variant_json(wo.get("required_skills")),
+        escape_sql_string(wo.get("priority")),
+        escape_sql_string(wo.get("status")),
+        escape_sql_string(wo.get("scheduled_date")),
+        escape_sql_string(wo.get("time_window_start")),
+        escape_sql_string(wo.get("time_window_end")),
+        format_number(wo.get("estimated_duration_minutes")),
+        escape_sql_string(wo.get("description")),
+        escape_sql_string(wo.get("created_at")),
+        escape_sql_string(wo.get("updated_at")),
+    ]
+    return "    (" + ", ".join(values) + ")"
+
+
+def generate_work_orders_inserts(work_orders, workers=None):
+    """Yield INSERT statement lines for work_orders table"""
+    yield "-- Work Orders INSERT statements"
+    yield "-- Generated: " + datetime.now().isoformat()
+    yield ""
+
+    header = insert_header(
+        "WORK_ORDERS", WORK_ORDER_COLUMNS, WORK_ORDER_VARIANT_COLUMNS
+    )
+    value_rows = iter_value_rows(work_order_values, work_orders, workers)
+    yield from generate_batched_inserts(header, value_rows)
+
+
+def property_record(prop):
+    """Flatten a property into a RAW.PROPERTIES row keyed by column name"""
+    address = prop.get("address") or {}
+    location = prop.get("location") or {}
+    coordinates = location.get("coordinates") or _EMPTY_COORDS
+    return {
+        "PROPERTY_ID": prop.get("property_id"),
+        "STREET": address.get("street"),
+        "CITY": address.get("city"),
+        "STATE": address.get("state"),
+        "ZIP_CODE": address.get("zip_code"),
+        "LOCATION_LAT": coordinates[1],
+        "LOCATION_LNG": coordinates[0],
+        "LOCATION_GEOJSON": location or None,
+        "PROPERTY_TYPE": prop.get("property_type"),
+        "SQUARE_FOOTAGE": prop.get("square_footage"),
+        "ZONE": prop.get("zone"),
+        "ZONE_NAME": prop.get("zone_name"),
+        "CREATED_AT": prop.get("created_at"),
+    }
+
+
+def technician_record(tech):
+    """Flatten a technician into a RAW.TECHNICIANS row keyed by column name"""
+    home_base = tech.get("home_base") or {}
+    address = home_base.get("address") or {}
+    location = home_base.get("location") or {}
+    coordinates = location.get("coordinates") or _EMPTY_COORDS
+    return {
+        "TECHNICIAN_ID": tech.get("technician_id"),
+        "NAME": tech.get("name"),
+        "EMAIL": tech.get("email"),
+        "PHONE": tech.get("phone"),
+        "HOME_BASE_STREET": address.get("street"),
+        "HOME_BASE_CITY": address.get("city"),
+        "HOME_BASE_STATE": address.get("state"),
+        "HOME_BASE_ZIP_CODE": address.get("zip_code"),
+        "HOME_BASE_LAT": coordinates[1],
+        "HOME_BASE_LNG": coordinates[0],
+        "HOME_BASE_GEOJSON": location or None,
+        "SKILLS": tech.get("skills"),
+        "MAX_DAILY_HOURS": tech.get("max_daily_hours"),
+        "MAX_DAILY_DISTANCE_MILES": tech.get("max_daily_distance_miles"),
+        "HOURLY_RATE": tech.get("hourly_rate"),
+        "PREFERRED_ZONES": tech.get("preferred_zones"),
+        "ACTIVE": tech.get("active", True),
+        "CREATED_AT": tech.get("created_at"),
+    }
+
+
+def work_order_record(wo):
+    """Flatten a work order into a RAW.WORK_ORDERS row keyed by column name"""
+    address = wo.get("property_address") or {}
+    location = wo.get("location") or {}
+    coordinates = location.get("coordinates") or _EMPTY_COORDS
+    return {
+        "WORK_ORDER_ID": wo.get("work_order_id"),
+        "PROPERTY_ID": wo.get("property_id"),
+        "PROPERTY_STREET": address.get("street"),
+        "PROPERTY_CITY": address.get("city"),
+        "PROPERTY_STATE": address.get("state"),
+        "PROPERTY_ZIP_CODE": address.get("zip_code"),
+        "LOCATION_LAT": coordinates[1],
+        "LOCATION_LNG": coordinates[0],
+        "LOCATION_GEOJSON": location or None,
+        "ZONE": wo.get("zone"),
+        "WORK_ORDER_TYPE": wo.get("work_order_type"),
+        "CATEGORY": wo.get("category"),
+        "REQUIRED_SKILLS": wo.get("required_skills"),
+        "PRIORITY": wo.get("priority"),
+        "STATUS": wo.get("status"),
+        "SCHEDULED_DATE": wo.get("scheduled_date"),
+        "TIME_WINDOW_START": wo.get("time_window_start"),
+        "TIME_WINDOW_END": wo.get("time_window_end"),
+        "ESTIMATED_DURATION_MINUTES": wo.get("estimated_duration_minutes"),
+        "DESCRIPTION": wo.get("description"),
+        "CREATED_AT": wo.get("created_at"),
+        "UPDATED_AT": wo.get("updated_at"),
+    }
+
+
+def write_ndjson_gz(records, file_path):
+    """Write records as gzipped newline-delimited JSON, returning the count"""
+    count = 0
+    with gzip.open(file_path, "wt", encoding="utf-8", compresslevel=6) as f:
+        for record in records:
+            f.write(_encode_json(record))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def generate_put_statement(table, file_path):
+    """Generate the PUT statement uploading file_path to table's stage"""
+    return (
+        f"PUT 'file://{file_path.resolve().as_posix()}' @RAW.%{table}"
+        " AUTO_COMPRESS = FALSE OVERWRITE = TRUE;"
+    )
+
+
+def generate_copy_statements(table, file_path):
+    """Generate the COPY INTO statement loading a staged NDJSON file"""
+    return [
+        f"-- {table}: bulk load from {file_path.name}",
+        f"COPY INTO RAW.{table} FROM @RAW.%{table}",
+        f"    FILES = ('{file_path.name}')",
+        "    FILE_FORMAT = (TYPE = JSON)",
+        "    MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE",
+        "    PURGE = TRUE;",
+    ]
+
+
+def write_lines(f, lines):
+    """Write each line to f followed by a newline"""
+    for line in lines:
+        f.write(line)
+        f.write("\n")
+
+
+# (file stem, table, label, INSERT generator, row record builder)
+TABLES = [
+    (
+        "properties",
+        "PROPERTIES",
+        "properties",
+        generate_properties_inserts,
+        property_record,
+    ),
+    (
+        "technicians",
+        "TECHNICIANS",
+        "technicians",
+        generate_technicians_inserts,
+        technician_record,
+    ),
+    (
+        "work_orders",
+        "WORK_ORDERS",
+        "work orders",
+        generate_work_orders_inserts,
+        work_order_record,
+    ),
+]
 
 
 def load_json_file(file_path):
     """Load data from JSON file"""
     try:
-        with open(file_path, "r") as f:
-            data = json.load(f)
-        return data
+        return list(iter_items(file_path))
     except FileNotFoundError:
         print(f"ERROR: File not found: {file_path}")
         return None
-    except json.JSONDecodeError as e:
+    except JSON_ERRORS as e:
         print(f"ERROR: Invalid JSON in {file_path}: {e}")
         return None
 
 
+def get_snowflake_connection():
+    """Create and return a Snowflake connection to the RAW schema"""
+    try:
+        return snowflake.connector.connect(
+            account=os.getenv("SNOWFLAKE_ACCOUNT"),
+            user=os.getenv("SNOWFLAKE_USER"),
+            password=os.getenv("SNOWFLAKE_PASSWORD"),
+            warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
+            role=os.getenv("SNOWFLAKE_ROLE"),
+            database="ROUTE_OPTIMIZATION",
+            schema="RAW",
+            paramstyle="qmark",
+        )
+    except snowflake.connector.errors.Error as e:
+        print(f"ERROR: Could not connect to Snowflake: {e}")
+        sys.exit(1)
+
+
+def load_with_write_pandas(conn, data_dir):
+    """Bulk load every table through write_pandas, returning the row count"""
+    total_rows = 0
+    for stem, table, label, _, build_record in TABLES:
+        print(f"Loading {label}...")
+        documents = load_json_file(data_dir / f"{stem}.json")
+        if not documents:
+            print(f"  - WARNING: Skipping {label} (file not found or invalid)")
+            continue
+
+        # Columnar frame keyed by the RAW column names; write_pandas stages
+        # it as Parquet and runs a single COPY INTO
+        df = pd.DataFrame([build_record(doc) for doc in documents])
+        _, _, rows, _ = write_pandas(
+            conn,
+            df,
+            table,
+            database="ROUTE_OPTIMIZATION",
+            schema="RAW",
+            chunk_size=100_000,
+            compression="snappy",
+            parallel=4,
+        )
+        print(f"  - Loaded {rows} rows into RAW.{table}")
+        total_rows += rows
+    return total_rows
+
+
+def bind_rows(records, columns, variant_columns):
+    """Yield record values as tuples in column order, VARIANTs as JSON text"""
+    for record in records:
+        yield tuple(
+            _encode_json(record[column])
+            if column in variant_columns and record[column] is not None
+            else record[column]
+            for column in columns
+        )
+
+
+def load_with_executemany(conn, data_dir):
+    """Load every table with bound executemany INSERTs, returning the row count"""
+    total_rows = 0
+    cursor = conn.cursor()
+    try:
+        for stem, table, label, _, build_record in TABLES:
+            print(f"Loading {label}...")
+            documents = load_json_file(data_dir / f"{stem}.json")
+            if not documents:
+                print(f"  - WARNING: Skipping {label} (file not found or invalid)")
+                continue
+
+            # Binds need no escaping or per-statement parsing; VARIANTs are
+            # bound as JSON text and parsed in the SELECT
+            columns, variant_columns = TABLE_COLUMNS[table]
+            placeholders = ", ".join("?" * len(columns))
+            sql = insert_header(table, columns, variant_columns) + f"({placeholders})"
+            rows = bind_rows(map(build_record, documents), columns, variant_columns)
+            while batch := list(islice(rows, BIND_BATCH_SIZE)):
+                cursor.executemany(sql, batch)
+            print(f"  - Loaded {len(documents)} rows into RAW.{table}")
+            total_rows += len(documents)
+    finally:
+        cursor.close()
+    return total_rows
+
+
 def main():
     """Main execution function"""
     parser = argparse.ArgumentParser(
@@ -224,6 +580,29 @@ def main():
         help="Output SQL file path (default: ../data/snowflake/seed/generated_inserts.sql)",
         default=None,
     )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip the SQL output (writes <output>.gz)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to format INSERT rows (default: CPU count)",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--copy",
+        action="store_true",
+        help="Write gzipped NDJSON files and PUT/COPY INTO statements, not INSERTs",
+    )
+    mode.add_argument(
+        "--connect",
+        action="store_true",
+        help="Load directly using the SNOWFLAKE_* settings (write_pandas when "
+        "pandas is installed, otherwise executemany binds)",
+    )
 
     args = parser.parse_args()
 
@@ -237,6 +616,33 @@ def main():
         print(f"ERROR: Data directory does not exist: {data_dir}")
         sys.exit(1)
 
+    if args.connect:
+        if snowflake is None:
+            print("ERROR: --connect requires snowflake-connector-python")
+            sys.exit(1)
+
+        print("=" * 70)
+        print("Snowflake Direct Loader")
+        print("=" * 70)
+        print(f"Data directory: {data_dir}")
+        print()
+
+        conn = get_snowflake_connection()
+        try:
+            if pd is not None:
+                total_rows = load_with_write_pandas(conn, data_dir)
+            else:
+                total_rows = load_with_executemany(conn, data_dir)
+        finally:
+            conn.close()
+
+        print("\n" + "=" * 70)
+        print("LOAD COMPLETE")
+        print("=" * 70)
+        print(f"Total rows loaded: {total_rows}")
+        print("=" * 70)
+        return
+
     # Determine output file
     if args.output:
         output_file = Path(args.output)
@@ -249,6 +655,9 @@ def main():
             / "generated_inserts.sql"
         )
 
+    if args.gzip and output_file.suffix != ".gz":
+        output_file = output_file.with_name(output_file.name + ".gz")
+
     # Create output directory if it doesn't exist
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -259,87 +668,115 @@ def main():
     print(f"Output file: {output_file}")
     print()
 
-    all_sql_lines = []
-
-    # Header
-    all_sql_lines.append("-- Snowflake INSERT Statements")
-    all_sql_lines.append("-- Auto-generated from JSON data")
-    all_sql_lines.append(f"-- Generated: {datetime.now().isoformat()}")
-    all_sql_lines.append("-- Database: ROUTE_OPTIMIZATION")
-    all_sql_lines.append("-- Schema: RAW")
-    all_sql_lines.append("")
-    all_sql_lines.append("USE DATABASE ROUTE_OPTIMIZATION;")
-    all_sql_lines.append("USE SCHEMA RAW;")
-    all_sql_lines.append("")
-    all_sql_lines.append("-- Disable auto-commit for batch insert")
-    all_sql_lines.append("BEGIN TRANSACTION;")
-    all_sql_lines.append("")
-
-    # Generate properties inserts
-    print("Loading properties...")
-    properties_file = data_dir / "properties.json"
-    properties = load_json_file(properties_file)
-    if properties:
-        print(f"  - Generating {len(properties)} INSERT statements")
-        all_sql_lines.extend(generate_properties_inserts(properties))
-    else:
-        print("  - WARNING: Skipping properties (file not found or invalid)")
-
-    all_sql_lines.append("")
-
-    # Generate technicians inserts
-    print("Loading technicians...")
-    technicians_file = data_dir / "technicians.json"
-    technicians = load_json_file(technicians_file)
-    if technicians:
-        print(f"  - Generating {len(technicians)} INSERT statements")
-        all_sql_lines.extend(generate_technicians_inserts(technicians))
-    else:
-        print("  - WARNING: Skipping technicians (file not found or invalid)")
+    statement_count = 0
+    total_rows = 0
+    staged = {}
+
+    # COPY mode writes the NDJSON files first so their PUTs can precede BEGIN
+    if args.copy:
+        for stem, table, label, _, build_record in TABLES:
+            print(f"Loading {label}...")
+            documents = load_json_file(data_dir / f"{stem}.json")
+            if not documents:
+                print(f"  - WARNING: Skipping {label} (file not found or invalid)")
+                continue
+            ndjson_file = output_file.parent / f"{stem}.ndjson.gz"
+            rows = write_ndjson_gz(map(build_record, documents), ndjson_file)
+            print(f"  - Wrote {rows} rows to {ndjson_file.name}")
+            total_rows += rows
+            staged[table] = ndjson_file
 
-    all_sql_lines.append("")
-
-    # Generate work orders inserts
-    print("Loading work orders...")
-    work_orders_file = data_dir / "work_orders.json"
-    work_orders = load_json_file(work_orders_file)
-    if work_orders:
-        print(f"  - Generating {len(work_orders)} INSERT statements")
-        all_sql_lines.extend(generate_work_orders_inserts(work_orders))
+    print(f"\nWriting SQL to {output_file}...")
+    if args.gzip:
+        # The column lists and VALUES rows repeat heavily; level 3 keeps most
+        # of the ratio at a fraction of the default level's CPU cost
+        out = gzip.open(output_file, "wt", encoding="utf-8", compresslevel=3)
     else:
-        print("  - WARNING: Skipping work orders (file not found or invalid)")
-
-    # Footer
-    all_sql_lines.append("")
-    all_sql_lines.append("-- Commit transaction")
-    all_sql_lines.append("COMMIT;")
-    all_sql_lines.append("")
-    all_sql_lines.append("-- Verify row counts")
-    all_sql_lines.append(
-        "SELECT 'PROPERTIES' AS TABLE_NAME, COUNT(*) AS ROW_COUNT FROM RAW.PROPERTIES"
-    )
-    all_sql_lines.append("UNION ALL")
-    all_sql_lines.append("SELECT 'TECHNICIANS', COUNT(*) FROM RAW.TECHNICIANS")
-    all_sql_lines.append("UNION ALL")
-    all_sql_lines.append("SELECT 'WORK_ORDERS', COUNT(*) FROM RAW.WORK_ORDERS;")
+        out = open(output_file, "w", encoding="utf-8", buffering=1 << 20)
+    with out as f:
+        # Header
+        write_lines(
+            f,
+            [
+                "-- Snowflake INSERT Statements",
+                "-- Auto-generated from JSON data",
+                f"-- Generated: {datetime.now().isoformat()}",
+                "-- Database: ROUTE_OPTIMIZATION",
+                "-- Schema: RAW",
+                "",
+                "USE DATABASE ROUTE_OPTIMIZATION;",
+                "USE SCHEMA RAW;",
+                "",
+            ],
+        )
+        if staged:
+            # PUT is not transactional; stage every file before BEGIN
+            write_lines(f, ["-- Upload NDJSON files to the table stages"])
+            write_lines(
+                f, (generate_put_statement(t, path) for t, path in staged.items())
+            )
+            write_lines(f, [""])
+        write_lines(
+            f, ["-- Disable auto-commit for batch insert", "BEGIN TRANSACTION;", ""]
+        )
 
-    # Write to file
-    print(f"\nWriting SQL to {output_file}...")
-    with open(output_file, "w") as f:
-        f.write("\n".join(all_sql_lines))
+        for i, (stem, table, label, generate_inserts, _) in enumerate(TABLES):
+            if i:
+                write_lines(f, [""])
+
+            if args.copy:
+                if table in staged:
+                    write_lines(f, generate_copy_statements(table, staged[table]))
+                continue
+
+            print(f"Loading {label}...")
+            documents = load_json_file(data_dir / f"{stem}.json")
+            if not documents:
+                print(f"  - WARNING: Skipping {label} (file not found or invalid)")
+                continue
+            statements = -(-len(documents) // INSERT_BATCH_SIZE)
+            print(
+                f"  - Generating {statements} INSERT statements"
+                f" for {len(documents)} rows"
+            )
+            write_lines(f, generate_inserts(documents, args.workers))
+            statement_count += statements
+
+        # Footer
+        write_lines(
+            f,
+            [
+                "",
+                "-- Commit transaction",
+                "COMMIT;",
+                "",
+                "-- Verify row counts",
+                "SELECT 'PROPERTIES' AS TABLE_NAME, COUNT(*) AS ROW_COUNT"
+                " FROM RAW.PROPERTIES",
+                "UNION ALL",
+                "SELECT 'TECHNICIANS', COUNT(*) FROM RAW.TECHNICIANS",
+                "UNION ALL",
+            ],
+        )
+        f.write("SELECT 'WORK_ORDERS', COUNT(*) FROM RAW.WORK_ORDERS;")
 
     print("\n" + "=" * 70)
     print("GENERATION COMPLETE")
     print("=" * 70)
-    print(
-        f"Total SQL statements: {len([line for line in all_sql_lines if line.startswith('INSERT')])}"
-    )
+    if args.copy:
+        print(f"Total rows staged for COPY: {total_rows}")
+    else:
+        print(f"Total SQL statements: {statement_count}")
     print(f"Output file: {output_file}")
     print(f"File size: {output_file.stat().st_size} bytes")
     print("=" * 70)
     print("\nTo load into Snowflake:")
-    print(f"  snowsql -f {output_file}")
-    print("  or copy/paste into Snowflake web UI")
+    if args.gzip:
+        print(f"  gunzip -c {output_file} | snowsql")
+    else:
+        print(f"  snowsql -f {output_file}")
+    if not args.copy and not args.gzip:
+        print("  or copy/paste into Snowflake web UI")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,7 @@
+"""Shared pytest configuration for the script tests."""
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: solver runs that can be deselected with -m 'not slow'"
+    )
@@ -1,6 +1,7 @@
 """Tests for the evaluation and benchmarking script."""
 
 import json
+import statistics
 import sys
 from pathlib import Path
 
@@ -8,7 +9,16 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from evaluate import calculate_improvement, calculate_workload_balance, load_json_file
+from evaluate import (
+    _mean_stdev,
+    build_tech_meta,
+    calculate_improvement,
+    calculate_workload_balance,
+    generate_per_technician_report,
+    load_json_file,
+    scan_results,
+    summarize_routes,
+)
 
 
 class TestLoadJsonFile:
@@ -36,6 +46,17 @@ class TestLoadJsonFile:
         result = load_json_file(str(f))
         assert result == data
 
+    def test_stdlib_fallback(self, tmp_path, monkeypatch):
+        import evaluate
+
+        monkeypatch.setattr(evaluate, "_json_loads", json.loads)
+        good = tmp_path / "good.json"
+        good.write_text(json.dumps({"routes": {"T1": []}}))
+        bad = tmp_path / "bad.json"
+        bad.write_text("{")
+        assert load_json_file(str(good)) == {"routes": {"T1": []}}
+        assert load_json_file(str(bad)) is None
+
 
 class TestCalculateImprovement:
     def test_positive_improvement(self):
@@ -63,6 +84,24 @@ class TestCalculateImprovement:
         assert abs(result - 10.0) < 0.01
 
 
+class TestMeanStdev:
+    def test_matches_statistics(self):
+        values = [3.5, 7.25, 1.0, 8.0, 4.75]
+        m, sd = _mean_stdev(values)
+        assert m == pytest.approx(statistics.mean(values))
+        assert sd == pytest.approx(statistics.stdev(values))
+
+    def test_mean_is_exactly_rounded(self):
+        m, _ = _mean_stdev([1e16, 1.0, -1e16, 1.0])
+        assert m == 0.5
+
+    def test_single_value(self):
+        assert _mean_stdev([5.0]) == (5.0, 0.0)
+
+    def test_empty(self):
+        assert _mean_stdev([]) == (0.0, 0.0)
+
+
 class TestCalculateWorkloadBalance:
     def test_balanced_workload(self):
         technicians = [
@@ -120,3 +159,124 @@ class TestCalculateWorkloadBalance:
         result = calculate_workload_balance(routes, technicians)
         assert result["hours_mean"] == 0
         assert result["stops_mean"] == 0
+
+    def test_matches_per_route_sums(self):
+        technicians = [
+            {"technician_id": "T1", "max_daily_hours": 8},
+            {"technician_id": "T2", "max_daily_hours": 8},
+            {"technician_id": "T3", "max_daily_hours": 8},
+        ]
+        routes = {
+            "T2": [
+                {"estimated_duration_minutes": 90},
+                {"estimated_duration_minutes": 45},
+                {"estimated_duration_minutes": 0},
+            ],
+            "T1": [{"estimated_duration_minutes": 30}],
+            "T3": [],
+        }
+        result = calculate_workload_balance(routes, technicians)
+        assert result["tech_hours"] == {"T1": 0.5, "T2": 2.25, "T3": 0.0}
+        assert result["tech_stops"] == {"T1": 1, "T2": 3, "T3": 0}
+        assert result["hours_mean"] == pytest.approx(1.375)
+        assert result["hours_stdev"] == pytest.approx(1.2374368670764582)
+        assert result["stops_mean"] == pytest.approx(2.0)
+        assert result["stops_stdev"] == pytest.approx(1.4142135623730951)
+
+    def test_route_for_unknown_technician(self):
+        technicians = [{"technician_id": "T1", "max_daily_hours": 8}]
+        routes = {"TX": [{"estimated_duration_minutes": 120}]}
+        result = calculate_workload_balance(routes, technicians)
+        assert result["tech_hours"] == {"T1": 0.0, "TX": 2.0}
+        assert result["tech_stops"] == {"T1": 0, "TX": 1}
+
+    def test_reuses_precomputed_route_stats(self):
+        technicians = [{"technician_id": "T1", "max_daily_hours": 8}]
+        routes = {"T1": [{"estimated_duration_minutes": 60}]}
+        stats = {"T1": (3, 5.0)}
+        result = calculate_workload_balance(routes, technicians, stats)
+        assert result["tech_hours"] == {"T1": 5.0}
+        assert result["tech_stops"] == {"T1": 3}
+
+
+class TestSummarizeRoutes:
+    def test_stops_and_hours(self):
+        routes = {
+            "T1": [
+                {"estimated_duration_minutes": 30},
+                {"estimated_duration_minutes": 60},
+            ],
+            "T2": [],
+        }
+        assert summarize_routes(routes) == {"T1": (2, 1.5), "T2": (0, 0.0)}
+
+    def test_empty(self):
+        assert summarize_routes({}) == {}
+
+    def test_missing_duration_raises(self):
+        with pytest.raises(KeyError):
+            summarize_routes({"T1": [{"work_order_id": "WO-1"}]})
+
+    def test_numba_matches_bincount(self, monkeypatch):
+        import evaluate
+
+        if evaluate._route_totals is None:
+            pytest.skip("numba not installed")
+        routes = {
+            f"T{i}": [{"estimated_duration_minutes": 15 * (i + j)} for j in range(i)]
+            for i in range(6)
+        }
+        compiled = summarize_routes(routes)
+        monkeypatch.setattr(evaluate, "_route_totals", None)
+        assert summarize_routes(routes) == compiled
+
+
+class TestPerTechnicianReport:
+    TECHNICIANS = [
+        {"technician_id": "T1", "name": "Ana", "max_daily_hours": 6},
+        {"technician_id": "T2"},
+    ]
+
+    def test_rows(self, capsys):
+        routes = {"T1": [{"estimated_duration_minutes": 90}]}
+        generate_per_technician_report(routes, self.TECHNICIANS, "Greedy")
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[5].split() == ["T1", "Ana", "1", "1.50", "25.0"]
+        assert lines[6].split() == ["T2", "Unknown", "0", "0.00", "0.0"]
+
+    def test_reuses_tech_meta(self, capsys):
+        routes = {"T1": [{"estimated_duration_minutes": 90}]}
+        generate_per_technician_report(routes, self.TECHNICIANS, "Greedy")
+        expected = capsys.readouterr().out
+        meta = build_tech_meta(self.TECHNICIANS)
+        generate_per_technician_report(routes, [], "Greedy", None, meta)
+        assert capsys.readouterr().out == expected
+
+
+def _result(algorithm, distance, time, utilization, unassigned):
+    return {
+        "algorithm": algorithm,
+        "total_distance": distance,
+        "total_time": time,
+        "avg_utilization": utilization,
+        "unassigned_orders": unassigned,
+    }
+
+
+class TestScanResults:
+    def test_matches_min_max(self):
+        results = [
+            _result("GA", 90, 7, 70, 2),
+            _result("Greedy", 100, 6, 80, 2),
+            _result("VRP", 90, 8, 80, 1),
+        ]
+        baseline, dist, time, util, cov = scan_results(results)
+        assert baseline is results[1]
+        assert dist is min(results, key=lambda x: x["total_distance"])
+        assert time is min(results, key=lambda x: x["total_time"])
+        assert util is max(results, key=lambda x: x["avg_utilization"])
+        assert cov is min(results, key=lambda x: x["unassigned_orders"])
+
+    def test_no_greedy_baseline(self):
+        results = [_result("GA", 1, 1, 1, 0)]
+        assert scan_results(results) == (None,) + (results[0],) * 4
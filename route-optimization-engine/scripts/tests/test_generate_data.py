@@ -1,11 +1,13 @@
 """Tests for the data generation script."""
 
 import json
-import random
+import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # Add parent directory to path
@@ -16,6 +18,9 @@ from generate_data import (
     DENVER_LAT_MIN,
     DENVER_LNG_MAX,
     DENVER_LNG_MIN,
+    DURATION_RANGES,
+    PRIORITY_DISTRIBUTION,
+    SQFT_RANGES,
     ZONES,
     generate_denver_address,
     generate_properties,
@@ -23,39 +28,81 @@ from generate_data import (
     generate_work_orders,
     get_random_coordinates,
     get_zone_from_coordinates,
+    get_zones_from_coordinates,
+    print_summary,
+    sample_coords,
+    write_json,
 )
 
+_VALID_CATEGORIES = frozenset(
+    {"hvac", "plumbing", "electrical", "general", "inspection"}
+)
+_VALID_PRIORITIES = frozenset({"emergency", "high", "medium", "low"})
+_VALID_PROPERTY_TYPES = frozenset({"residential", "commercial", "industrial"})
+_VALID_ZONES = frozenset({"Zone-A", "Zone-B", "Zone-C", "Zone-D", "Zone-E"})
+
+_ZIP_RE = re.compile(r"[0-9]{5}")
+_STREET_RE = re.compile(r"[0-9]+ \S.*")
+_PHONE_RE = re.compile(r"\([2-9][0-9]{2}\)[2-9][0-9]{2}-[0-9]{4}")
+
+
+@lru_cache(maxsize=None)
+def cached_properties(count):
+    """Generate count properties once per session"""
+    return generate_properties(count, rng=np.random.default_rng(42))
+
 
 class TestGetRandomCoordinates:
     def test_within_denver_bounds(self):
-        random.seed(42)
+        rng = np.random.default_rng(42)
         for _ in range(50):
-            lat, lng = get_random_coordinates()
+            lat, lng = get_random_coordinates(rng=rng)
             assert DENVER_LAT_MIN <= lat <= DENVER_LAT_MAX
             assert DENVER_LNG_MIN <= lng <= DENVER_LNG_MAX
 
     def test_within_specific_zone(self):
-        random.seed(42)
+        rng = np.random.default_rng(42)
         for zone_id, zone_info in ZONES.items():
-            lat, lng = get_random_coordinates(zone_id)
+            lat, lng = get_random_coordinates(zone_id, rng=rng)
             assert zone_info["lat_range"][0] <= lat <= zone_info["lat_range"][1]
             assert zone_info["lng_range"][0] <= lng <= zone_info["lng_range"][1]
 
     def test_different_coordinates_different_seeds(self):
-        random.seed(1)
-        c1 = get_random_coordinates()
-        random.seed(2)
-        c2 = get_random_coordinates()
+        c1 = get_random_coordinates(rng=np.random.default_rng(1))
+        c2 = get_random_coordinates(rng=np.random.default_rng(2))
         assert c1 != c2
 
     def test_coordinates_have_precision(self):
-        random.seed(42)
-        lat, lng = get_random_coordinates()
+        lat, lng = get_random_coordinates(rng=np.random.default_rng(42))
         # Should be rounded to 6 decimal places
         assert lat == round(lat, 6)
         assert lng == round(lng, 6)
 
 
+class TestSampleCoords:
+    def test_shape_and_zone_bounds(self):
+        rng = np.random.default_rng(0)
+        for zone_id, zone_info in ZONES.items():
+            coords = sample_coords(zone_id, 25, rng)
+            assert coords.shape == (25, 2)
+            lat_lo, lat_hi = zone_info["lat_range"]
+            lng_lo, lng_hi = zone_info["lng_range"]
+            assert ((coords[:, 0] >= lat_lo) & (coords[:, 0] <= lat_hi)).all()
+            assert ((coords[:, 1] >= lng_lo) & (coords[:, 1] <= lng_hi)).all()
+
+    def test_metro_bounds_without_zone(self):
+        lats, lngs = sample_coords(None, 50, np.random.default_rng(0)).T
+        assert ((lats >= DENVER_LAT_MIN) & (lats <= DENVER_LAT_MAX)).all()
+        assert ((lngs >= DENVER_LNG_MIN) & (lngs <= DENVER_LNG_MAX)).all()
+
+    def test_rounded_to_six_places(self):
+        coords = sample_coords("Zone-A", 10, np.random.default_rng(0))
+        np.testing.assert_array_equal(coords, coords.round(6))
+
+    def test_empty(self):
+        assert sample_coords("Zone-B", 0).shape == (0, 2)
+
+
 class TestGetZoneFromCoordinates:
     def test_zone_a_downtown(self):
         lat = 39.74
@@ -86,54 +133,88 @@ class TestGetZoneFromCoordinates:
         result = get_zone_from_coordinates(40.0, -105.5)
         assert result == "Zone-A"
 
+    def test_repeat_lookups_hit_cache(self):
+        get_zone_from_coordinates.cache_clear()
+        assert get_zone_from_coordinates(39.74, -104.99) == "Zone-A"
+        assert get_zone_from_coordinates(39.74, -104.99) == "Zone-A"
+        assert get_zone_from_coordinates.cache_info().hits == 1
+
+    def test_points_near_edges_not_bucketed(self):
+        # Both round to (39.72, -104.97); only the first is inside Zone-A
+        assert get_zone_from_coordinates(39.7201, -104.9701) == "Zone-A"
+        assert get_zone_from_coordinates(39.7199, -104.9699) != "Zone-A"
+
+
+class TestGetZonesFromCoordinates:
+    def test_matches_scalar_lookup(self):
+        rng = np.random.default_rng(3)
+        lats = rng.uniform(39.55, 39.90, 300)
+        lngs = rng.uniform(-105.15, -104.75, 300)
+        # Include shared zone edges, where the first zone must win
+        lats = np.append(lats, [39.76, 39.72, 39.68])
+        lngs = np.append(lngs, [-105.0, -104.90, -105.02])
+        expected = [get_zone_from_coordinates(a, b) for a, b in zip(lats, lngs)]
+        assert get_zones_from_coordinates(lats, lngs).tolist() == expected
+
+    def test_empty(self):
+        assert get_zones_from_coordinates([], []).tolist() == []
+
 
 class TestGenerateDenverAddress:
-    def test_returns_correct_keys(self):
-        random.seed(42)
-        addr = generate_denver_address(39.74, -104.99)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def addr(cls):
+        return generate_denver_address(39.74, -104.99)
+
+    def test_returns_correct_keys(self, addr):
         assert "street" in addr
         assert "city" in addr
         assert "state" in addr
         assert "zip_code" in addr
 
-    def test_city_is_denver(self):
-        random.seed(42)
-        addr = generate_denver_address(39.74, -104.99)
+    def test_city_is_denver(self, addr):
         assert addr["city"] == "Denver"
 
-    def test_state_is_co(self):
-        random.seed(42)
-        addr = generate_denver_address(39.74, -104.99)
+    def test_state_is_co(self, addr):
         assert addr["state"] == "CO"
 
-    def test_street_has_number_and_name(self):
-        random.seed(42)
-        addr = generate_denver_address(39.74, -104.99)
-        parts = addr["street"].split(" ", 1)
-        assert len(parts) == 2
-        assert parts[0].isdigit()
-
-    def test_zip_code_format(self):
-        random.seed(42)
-        addr = generate_denver_address(39.74, -104.99)
-        assert len(addr["zip_code"]) == 5
-        assert addr["zip_code"].isdigit()
+    def test_street_has_number_and_name(self, addr):
+        assert _STREET_RE.fullmatch(addr["street"])
+
+    def test_zip_code_format(self, addr):
+        assert _ZIP_RE.fullmatch(addr["zip_code"])
+
+    @pytest.mark.parametrize(
+        "lat,lng,expected",
+        [
+            (39.80, -104.95, {"80221", "80216", "80238", "80249", "80239"}),
+            (39.65, -104.95, {"80110", "80120", "80122", "80111", "80113"}),
+            (39.72, -105.05, {"80214", "80215", "80226", "80228", "80227"}),
+            (39.72, -104.85, {"80010", "80011", "80012", "80230", "80231"}),
+            (
+                39.72,
+                -104.95,
+                {"80202", "80203", "80204", "80205", "80206", "80218", "80220"},
+            ),
+        ],
+    )
+    def test_zip_code_by_area(self, lat, lng, expected):
+        zip_codes = {generate_denver_address(lat, lng)["zip_code"] for _ in range(200)}
+        assert zip_codes == expected
 
 
 class TestGenerateProperties:
-    @pytest.fixture
-    def properties(self):
-        random.seed(42)
-        return generate_properties(20)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def properties(cls):
+        return cached_properties(20)
 
     def test_correct_count(self, properties):
         assert len(properties) == 20
 
-    def test_correct_count_various(self):
-        random.seed(42)
-        assert len(generate_properties(10)) == 10
-        random.seed(42)
-        assert len(generate_properties(50)) == 50
+    @pytest.mark.parametrize("n", [10, 50])
+    def test_correct_count_various(self, n):
+        assert len(cached_properties(n)) == n
 
     def test_required_keys(self, properties):
         for prop in properties:
@@ -143,44 +224,73 @@ class TestGenerateProperties:
             assert "property_type" in prop
             assert "zone" in prop
 
-    def test_unique_ids(self, properties):
-        ids = [p["property_id"] for p in properties]
-        assert len(ids) == len(set(ids))
+    def test_address_formats(self, properties):
+        addresses = [p["address"] for p in properties]
+        assert all(_ZIP_RE.fullmatch(a["zip_code"]) for a in addresses)
+        assert all(_STREET_RE.fullmatch(a["street"]) for a in addresses)
 
-    def test_id_format(self, properties):
-        for prop in properties:
-            assert prop["property_id"].startswith("PROP-")
-            assert len(prop["property_id"]) == 9  # PROP-XXXX
-
-    def test_geojson_format(self, properties):
-        for prop in properties:
-            loc = prop["location"]
-            assert loc["type"] == "Point"
-            assert len(loc["coordinates"]) == 2
-            lng, lat = loc["coordinates"]
-            assert -180 <= lng <= 180
-            assert -90 <= lat <= 90
+    def test_unique_ids(self, properties):
+        ids = np.fromiter(
+            (p["property_id"] for p in properties), dtype=object, count=len(properties)
+        )
+        assert np.unique(ids).size == ids.size
+
+    @staticmethod
+    def _id_format_ok(prop):
+        return prop["property_id"].startswith("PROP-") and len(prop["property_id"]) == 9
+
+    @staticmethod
+    def _geojson_ok(prop):
+        loc = prop["location"]
+        if loc["type"] != "Point" or len(loc["coordinates"]) != 2:
+            return False
+        lng, lat = loc["coordinates"]
+        return -180 <= lng <= 180 and -90 <= lat <= 90
+
+    @pytest.mark.parametrize("check", ["_id_format_ok", "_geojson_ok"])
+    def test_record_format(self, properties, check):
+        is_ok = getattr(self, check)
+        assert all(is_ok(prop) for prop in properties)
 
     def test_valid_property_types(self, properties):
-        valid = {"residential", "commercial", "industrial"}
-        for prop in properties:
-            assert prop["property_type"] in valid
+        types = np.array([p["property_type"] for p in properties])
+        assert np.isin(types, list(_VALID_PROPERTY_TYPES)).all()
 
     def test_valid_zones(self, properties):
-        valid = {"Zone-A", "Zone-B", "Zone-C", "Zone-D", "Zone-E"}
-        for prop in properties:
-            assert prop["zone"] in valid
+        zones = np.array([p["zone"] for p in properties])
+        assert np.isin(zones, list(_VALID_ZONES)).all()
 
     def test_distributed_across_zones(self, properties):
         zones = {p["zone"] for p in properties}
         assert len(zones) >= 3  # At least 3 zones represented
 
+    def test_square_footage_matches_type(self, properties):
+        for prop in properties:
+            lo, hi = SQFT_RANGES[prop["property_type"]]
+            assert lo <= prop["square_footage"] <= hi
+
+    def test_coordinates_inside_assigned_zone(self, properties):
+        for prop in properties:
+            lng, lat = prop["location"]["coordinates"]
+            zone_info = ZONES[prop["zone"]]
+            assert zone_info["lat_range"][0] <= lat <= zone_info["lat_range"][1]
+            assert zone_info["lng_range"][0] <= lng <= zone_info["lng_range"][1]
+
+    def test_reproducible_with_rng(self):
+        def strip(props):
+            return [{k: v for k, v in p.items() if k != "created_at"} for p in props]
+
+        a = generate_properties(23, rng=np.random.default_rng(7))
+        b = generate_properties(23, rng=np.random.default_rng(7))
+        assert strip(a) == strip(b)
+        json.dumps(a)  # plain Python types only
+
 
 class TestGenerateTechnicians:
-    @pytest.fixture
-    def technicians(self):
-        random.seed(42)
-        return generate_technicians(5)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def technicians(cls):
+        return generate_technicians(5, rng=np.random.default_rng(42))
 
     def test_correct_count(self, technicians):
         assert len(technicians) == 5
@@ -198,11 +308,26 @@ class TestGenerateTechnicians:
             assert tech["technician_id"].startswith("TECH-")
 
     def test_valid_skills(self, technicians):
-        valid = {"hvac", "plumbing", "electrical", "general", "inspection"}
         for tech in technicians:
             assert len(tech["skills"]) >= 1
-            for skill in tech["skills"]:
-                assert skill in valid
+            assert _VALID_CATEGORIES.issuperset(tech["skills"])
+
+    def test_skills_unique_and_include_general(self, technicians):
+        for tech in technicians:
+            assert tech["skills"][0] == "general"
+            assert 2 <= len(tech["skills"]) <= 4
+            assert len(set(tech["skills"])) == len(tech["skills"])
+
+    def test_preferred_zones_unique(self, technicians):
+        for tech in technicians:
+            assert 1 <= len(tech["preferred_zones"]) <= 2
+            assert len(set(tech["preferred_zones"])) == len(tech["preferred_zones"])
+
+    def test_contact_details(self, technicians):
+        for tech in technicians:
+            first, last = tech["name"].split(" ", 1)
+            assert tech["email"].startswith(f"{first}.{last}@".lower())
+            assert _PHONE_RE.fullmatch(tech["phone"])
 
     def test_reasonable_max_hours(self, technicians):
         for tech in technicians:
@@ -217,15 +342,15 @@ class TestGenerateTechnicians:
 
 
 class TestGenerateWorkOrders:
-    @pytest.fixture
-    def properties(self):
-        random.seed(42)
-        return generate_properties(10)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def properties(cls):
+        return cached_properties(10)
 
-    @pytest.fixture
-    def work_orders(self, properties):
-        random.seed(42)
-        return generate_work_orders(50, properties)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def work_orders(cls, properties):
+        return generate_work_orders(50, properties, rng=np.random.default_rng(42))
 
     def test_requires_properties(self):
         with pytest.raises(ValueError):
@@ -249,25 +374,43 @@ class TestGenerateWorkOrders:
             assert wo["work_order_id"].startswith("WO-")
 
     def test_valid_categories(self, work_orders):
-        valid = {"hvac", "plumbing", "electrical", "general", "inspection"}
-        for wo in work_orders:
-            assert wo["category"] in valid
+        assert all(wo["category"] in _VALID_CATEGORIES for wo in work_orders)
 
     def test_valid_priorities(self, work_orders):
-        valid = {"emergency", "high", "medium", "low"}
-        for wo in work_orders:
-            assert wo["priority"] in valid
+        assert all(wo["priority"] in _VALID_PRIORITIES for wo in work_orders)
 
     def test_positive_duration(self, work_orders):
         for wo in work_orders:
             assert wo["estimated_duration_minutes"] > 0
             assert wo["estimated_duration_minutes"] <= 960
 
+    def test_duration_matches_category(self, work_orders):
+        for wo in work_orders:
+            lo, hi = DURATION_RANGES[wo["category"]]
+            assert lo <= wo["estimated_duration_minutes"] <= hi
+
     def test_time_window_ordering(self, work_orders):
+        starts = np.array(
+            [wo["time_window_start"] for wo in work_orders], dtype="datetime64[s]"
+        )
+        ends = np.array(
+            [wo["time_window_end"] for wo in work_orders], dtype="datetime64[s]"
+        )
+        assert (ends > starts).all()
+
+    def test_time_window_within_business_hours(self, work_orders):
         for wo in work_orders:
             start = datetime.fromisoformat(wo["time_window_start"])
             end = datetime.fromisoformat(wo["time_window_end"])
-            assert end > start
+            assert 8 <= start.hour <= 14
+            assert end.hour <= 17 and end.minute == 0
+            assert 1 <= (end - start).seconds // 3600 <= 4
+
+    def test_created_before_scheduled_date(self, work_orders):
+        for wo in work_orders:
+            created = datetime.fromisoformat(wo["created_at"])
+            days = (datetime.fromisoformat(wo["scheduled_date"]) - created).days
+            assert 0 <= days <= 7
 
     def test_references_existing_properties(self, work_orders, properties):
         prop_ids = {p["property_id"] for p in properties}
@@ -283,3 +426,49 @@ class TestGenerateWorkOrders:
         assert counts.get("medium", 0) > counts.get("emergency", 0)
         # Emergency should be rare (target 5%)
         assert counts.get("emergency", 0) / total < 0.20
+
+    def test_priority_distribution_large_sample(self, properties):
+        work_orders = generate_work_orders(
+            4000, properties, rng=np.random.default_rng(11)
+        )
+        counts = {}
+        for wo in work_orders:
+            counts[wo["priority"]] = counts.get(wo["priority"], 0) + 1
+        for priority, weight in PRIORITY_DISTRIBUTION.items():
+            assert counts[priority] / 4000 == pytest.approx(weight, abs=0.03)
+
+
+class TestWriteJson:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, tmp_path, monkeypatch, use_orjson):
+        import generate_data
+
+        if use_orjson and generate_data.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(generate_data, "orjson", None)
+        properties = generate_properties(5, rng=np.random.default_rng(0))
+        path = tmp_path / "properties.json"
+        write_json(properties, path)
+        text = path.read_text()
+        assert "\n" not in text
+        assert json.loads(text) == properties
+
+        write_json(properties, path, pretty=True)
+        text = path.read_text()
+        assert text.startswith('[\n  {\n    "property_id"')
+        assert json.loads(text) == properties
+
+
+class TestPrintSummary:
+    def test_counts(self, capsys):
+        rng = np.random.default_rng(5)
+        properties = generate_properties(10, rng=rng)
+        technicians = generate_technicians(2, rng=rng)
+        work_orders = generate_work_orders(8, properties, rng=rng)
+        print_summary(properties, technicians, work_orders)
+        out = capsys.readouterr().out
+        assert "PROPERTIES: 10 total" in out
+        assert "WORK ORDERS: 8 total" in out
+        for zone_id, zone_info in ZONES.items():
+            assert f"- {zone_id} ({zone_info['name']}): 2" in out
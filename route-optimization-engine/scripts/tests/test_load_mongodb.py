@@ -0,0 +1,294 @@
+"""Tests for the MongoDB data loader script."""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import load_mongodb
+from load_mongodb import (
+    COLLECTION_INDEXES,
+    bulk_upsert,
+    content_hash,
+    create_indexes,
+    load_collection,
+    upsert_properties,
+)
+
+
+class FakeCollection:
+    """In-memory stand-in recording the calls the loader makes"""
+
+    def __init__(self, name, events=None):
+        self.name = name
+        self.docs = []
+        self.finds = []
+        self.writes = []
+        self.events = [] if events is None else events
+
+    def find(self, query, projection):
+        ((key, condition),) = query.items()
+        self.finds.append(list(condition["$in"]))
+        fields = [field for field, include in projection.items() if include]
+        return [
+            {field: doc[field] for field in fields if field in doc}
+            for doc in self.docs
+            if doc.get(key) in condition["$in"]
+        ]
+
+    def bulk_write(self, ops, ordered=True):
+        self.writes.append(ops)
+        self.events.append(("write", self.name))
+        inserted = modified = 0
+        for op in ops:
+            ((key, value),) = op._filter.items()
+            existing = next((d for d in self.docs if d.get(key) == value), None)
+            if existing is None:
+                self.docs.append(dict(op._doc["$set"]))
+                inserted += 1
+            else:
+                existing.update(op._doc["$set"])
+                modified += 1
+        return SimpleNamespace(upserted_count=inserted, modified_count=modified)
+
+    def create_indexes(self, models):
+        unique = {bool(model.document.get("unique")) for model in models}
+        self.events.append(("index", self.name, unique))
+
+    def delete_many(self, query):
+        deleted = len(self.docs)
+        self.docs.clear()
+        return SimpleNamespace(deleted_count=deleted)
+
+    def estimated_document_count(self):
+        return len(self.docs)
+
+    def count_documents(self, query):
+        return len(self.docs)
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.events = []
+        self.collections = {}
+
+    def __getitem__(self, name):
+        if name not in self.collections:
+            self.collections[name] = FakeCollection(name, self.events)
+        return self.collections[name]
+
+    def __getattr__(self, name):
+        return self[name]
+
+
+class FakeClient:
+    def __init__(self, db):
+        self.db = db
+
+    def __getitem__(self, name):
+        return self.db
+
+    def close(self):
+        pass
+
+
+def make_properties(count, zone="A"):
+    return [{"property_id": f"P{i}", "zone": zone} for i in range(count)]
+
+
+class TestContentHash:
+    def test_ignores_key_order(self):
+        assert content_hash({"a": 1, "b": [1, 2]}) == content_hash(
+            {"b": [1, 2], "a": 1}
+        )
+
+    def test_detects_changes(self):
+        assert content_hash({"a": 1}) != content_hash({"a": 2})
+
+    def test_stdlib_matches_orjson(self, monkeypatch):
+        if load_mongodb.orjson is None:
+            pytest.skip("orjson not installed")
+        doc = {
+            "property_id": "P1",
+            "location": {"type": "Point", "coordinates": [-104.99, 39.74]},
+            "address": {"street": "12 Café Ln"},
+            "square_footage": 1800,
+            "active": True,
+            "notes": None,
+        }
+        expected = content_hash(doc)
+        monkeypatch.setattr(load_mongodb, "orjson", None)
+        assert content_hash(doc) == expected
+
+
+class TestBulkUpsert:
+    def test_inserts_then_skips_unchanged(self):
+        collection = FakeCollection("properties")
+        docs = make_properties(3)
+
+        assert bulk_upsert(collection, docs, "property_id", log=[].append) == (3, 0)
+        assert bulk_upsert(collection, docs, "property_id", log=[].append) == (0, 0)
+        # The unchanged re-run looked documents up but wrote nothing
+        assert len(collection.finds) == 2
+        assert len(collection.writes) == 1
+
+    def test_stores_content_hash(self):
+        collection = FakeCollection("properties")
+        docs = make_properties(2)
+        bulk_upsert(collection, docs, "property_id", log=[].append)
+
+        for doc, stored in zip(docs, collection.docs):
+            assert stored["_hash"] == content_hash(doc)
+            assert "_hash" not in doc
+
+    def test_updates_only_changed(self):
+        collection = FakeCollection("properties")
+        bulk_upsert(collection, make_properties(3), "property_id", log=[].append)
+
+        docs = make_properties(3)
+        docs[1]["zone"] = "B"
+        lines = []
+        assert bulk_upsert(collection, docs, "property_id", lines.append) == (0, 1)
+        (ops,) = collection.writes[1:]
+        assert [op._filter for op in ops] == [{"property_id": "P1"}]
+        assert collection.docs[1]["zone"] == "B"
+        assert collection.docs[1]["_hash"] == content_hash(docs[1])
+        assert lines == [
+            "  - Documents: 3",
+            "  - Unchanged: 2",
+            "  - Inserted: 0",
+            "  - Updated: 1",
+            "  - Total in collection: 3",
+        ]
+
+    def test_batches_lookups_and_writes(self, monkeypatch):
+        monkeypatch.setattr(load_mongodb, "BULK_BATCH_SIZE", 2)
+        collection = FakeCollection("properties")
+
+        bulk_upsert(collection, iter(make_properties(5)), "property_id", log=[].append)
+        assert collection.finds == [["P0", "P1"], ["P2", "P3"], ["P4"]]
+        assert [len(ops) for ops in collection.writes] == [2, 2, 1]
+        assert all(op._upsert for ops in collection.writes for op in ops)
+
+    def test_empty_input(self):
+        collection = FakeCollection("properties")
+        assert bulk_upsert(collection, [], "property_id", log=[].append) == (0, 0)
+        assert collection.finds == []
+        assert collection.writes == []
+
+
+class TestCreateIndexes:
+    def test_unique_and_secondary_split(self, capsys):
+        db = FakeDatabase()
+        create_indexes(db, secondary=False)
+        create_indexes(db, unique=False)
+
+        unique = [e for e in db.events if e[2] == {True}]
+        secondary = [e for e in db.events if e[2] == {False}]
+        assert len(unique) + len(secondary) == len(db.events)
+        # Every collection with a unique key gets it in the first pass
+        assert {e[1] for e in unique} == {
+            name
+            for name, (_, models) in COLLECTION_INDEXES.items()
+            if any(model.document.get("unique") for model in models)
+        }
+        assert {e[1] for e in secondary} == set(COLLECTION_INDEXES)
+        assert db.events.index(unique[-1]) < db.events.index(secondary[0])
+
+    def test_all_at_once(self, capsys):
+        db = FakeDatabase()
+        create_indexes(db)
+        assert [e[1] for e in db.events] == list(COLLECTION_INDEXES)
+        assert db.events[0][2] == {True, False}
+
+
+class TestLoadCollection:
+    def test_buffers_output(self, tmp_path, capsys):
+        path = tmp_path / "properties.json"
+        path.write_text(json.dumps(make_properties(2)))
+        collection = FakeCollection("properties")
+
+        lines = load_collection(upsert_properties, collection, path, "properties")
+        assert capsys.readouterr().out == ""
+        assert lines[0] == "\nUpserting properties..."
+        assert "  - Inserted: 2" in lines
+        assert len(collection.docs) == 2
+
+    def test_missing_file(self, tmp_path):
+        path = tmp_path / "missing.json"
+        lines = load_collection(
+            upsert_properties, FakeCollection("properties"), path, "properties"
+        )
+        assert lines[-2:] == [
+            f"ERROR: File not found: {path}",
+            "WARNING: Skipping properties (file not found or invalid)",
+        ]
+
+    def test_invalid_json(self, tmp_path):
+        path = tmp_path / "properties.json"
+        path.write_text("not valid json {{{")
+        lines = load_collection(
+            upsert_properties, FakeCollection("properties"), path, "properties"
+        )
+        assert lines[-2].startswith(f"ERROR: Invalid JSON in {path}")
+        assert (
+            lines[-1] == "WARNING: Stopped loading properties at the invalid document"
+        )
+
+
+class TestMain:
+    @pytest.fixture
+    def data_dir(self, tmp_path):
+        files = {
+            "properties": make_properties(3),
+            "technicians": [{"technician_id": "T1"}, {"technician_id": "T2"}],
+            "work_orders": [{"work_order_id": "W1"}],
+        }
+        for name, docs in files.items():
+            (tmp_path / f"{name}.json").write_text(json.dumps(docs))
+        return tmp_path
+
+    def run_main(self, monkeypatch, data_dir, *args):
+        db = FakeDatabase()
+        monkeypatch.setattr(
+            load_mongodb, "get_mongo_client", lambda uri: FakeClient(db)
+        )
+        monkeypatch.setattr(
+            sys, "argv", ["load_mongodb.py", "--data-dir", str(data_dir), *args]
+        )
+        load_mongodb.main()
+        return db
+
+    def test_clear_defers_secondary_indexes(self, monkeypatch, data_dir, capsys):
+        db = self.run_main(monkeypatch, data_dir, "--clear")
+
+        kinds = [
+            "write" if event[0] == "write" else min(event[2]) for event in db.events
+        ]
+        first_write = kinds.index("write")
+        last_write = len(kinds) - 1 - kinds[::-1].index("write")
+        # Unique keys exist before the upserts; secondary indexes come after
+        assert set(kinds[:first_write]) == {True}
+        assert set(kinds[last_write + 1 :]) == {False}
+        assert len(db.properties.docs) == 3
+
+    def test_output_not_interleaved(self, monkeypatch, data_dir, capsys):
+        self.run_main(monkeypatch, data_dir)
+        out = capsys.readouterr().out
+
+        sections = [
+            ("Upserting properties...", "  - Documents: 3"),
+            ("Upserting technicians...", "  - Documents: 2"),
+            ("Upserting work orders...", "  - Documents: 1"),
+        ]
+        positions = [
+            (out.index(header), out.index(count, out.index(header)))
+            for header, count in sections
+        ]
+        # Each collection's block is contiguous and in job order
+        flat = [pos for pair in positions for pos in pair]
+        assert flat == sorted(flat)
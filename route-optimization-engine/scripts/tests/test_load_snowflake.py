@@ -0,0 +1,206 @@
+"""Tests for the Snowflake SQL generator script."""
+
+import gzip
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from load_snowflake import (
+    INSERT_BATCH_SIZE,
+    PROPERTY_COLUMNS,
+    TABLE_COLUMNS,
+    TECHNICIAN_COLUMNS,
+    TECHNICIAN_VARIANT_COLUMNS,
+    WORK_ORDER_COLUMNS,
+    bind_rows,
+    generate_batched_inserts,
+    generate_properties_inserts,
+    insert_header,
+    property_record,
+    property_values,
+    technician_record,
+    technician_values,
+    work_order_values,
+    write_ndjson_gz,
+)
+
+
+@pytest.fixture
+def sample_property():
+    return {
+        "property_id": "PROP-0001",
+        "address": {
+            "street": "12 O'Brien St",
+            "city": "Denver",
+            "state": "CO",
+            "zip_code": "80202",
+        },
+        "location": {"type": "Point", "coordinates": [-104.99, 39.74]},
+        "property_type": "residential",
+        "square_footage": 1800,
+        "zone": "A",
+        "zone_name": "Downtown",
+        "created_at": "2024-01-01T00:00:00",
+    }
+
+
+@pytest.fixture
+def sample_technician():
+    return {
+        "technician_id": "TECH-001",
+        "name": "Pat O'Neil",
+        "email": "pat@example.com",
+        "phone": "303-555-0100",
+        "home_base": {
+            "address": {"street": "1 Main St", "city": "Denver"},
+            "location": {"type": "Point", "coordinates": [-105.0, 39.7]},
+        },
+        "skills": ["hvac", "plumber's license"],
+        "max_daily_hours": 8,
+        "hourly_rate": 45.5,
+        "preferred_zones": None,
+        "active": False,
+    }
+
+
+class TestInsertHeader:
+    @pytest.mark.parametrize("table", sorted(TABLE_COLUMNS))
+    def test_positions_align_with_columns(self, table):
+        columns, variant_columns = TABLE_COLUMNS[table]
+        header = insert_header(table, columns, variant_columns)
+        insert_line, select_line, from_line = header.splitlines()
+
+        assert insert_line == f"INSERT INTO RAW.{table} ({', '.join(columns)})"
+        assert from_line == "FROM VALUES"
+        select = select_line.removeprefix("SELECT ").split(", ")
+        assert len(select) == len(columns)
+        for i, (expr, column) in enumerate(zip(select, columns), 1):
+            if column in variant_columns:
+                assert expr == f"PARSE_JSON(${i})"
+            else:
+                assert expr == f"${i}"
+
+    def test_ends_ready_for_values(self):
+        header = insert_header("T", ("A",), set())
+        assert header.endswith("FROM VALUES\n")
+
+
+class TestGenerateBatchedInserts:
+    def test_splits_at_batch_size(self):
+        rows = [f"    ({i})" for i in range(7)]
+        lines = list(generate_batched_inserts("HEADER\n", rows, batch_size=3))
+
+        statements = lines[::2]
+        assert lines[1::2] == ["", "", ""]
+        assert [s.count("\n") for s in statements] == [3, 3, 1]
+        assert statements[0] == "HEADER\n    (0),\n    (1),\n    (2);"
+        assert statements[-1] == "HEADER\n    (6);"
+
+    def test_exact_multiple_has_no_empty_statement(self):
+        rows = ["    (1)", "    (2)"]
+        lines = list(generate_batched_inserts("H\n", rows, batch_size=2))
+        assert lines == ["H\n    (1),\n    (2);", ""]
+
+    def test_empty_input(self):
+        assert list(generate_batched_inserts("H\n", [])) == []
+
+    def test_default_batch_size(self, sample_property):
+        properties = [sample_property] * (INSERT_BATCH_SIZE + 1)
+        lines = list(generate_properties_inserts(properties, workers=1))
+        statements = [line for line in lines if line.startswith("INSERT INTO")]
+        assert len(statements) == 2
+        assert statements[0].count("PROP-0001") == INSERT_BATCH_SIZE
+        assert statements[1].count("PROP-0001") == 1
+
+
+class TestValueRows:
+    def test_property_escapes_quotes(self, sample_property):
+        row = property_values(sample_property)
+        assert row.startswith("    ('PROP-0001', '12 O''Brien St', ")
+        assert ", 39.74, -104.99, " in row
+        assert '\'{"type":"Point","coordinates":[-104.99,39.74]}\'' in row
+        assert row.endswith(", 1800, 'A', 'Downtown', '2024-01-01T00:00:00')")
+
+    def test_property_missing_fields_are_null(self):
+        row = property_values({})
+        assert row == "    (" + ", ".join(["NULL"] * len(PROPERTY_COLUMNS)) + ")"
+
+    def test_technician_values(self, sample_technician):
+        row = technician_values(sample_technician)
+        assert "'Pat O''Neil'" in row
+        assert "'[\"hvac\",\"plumber''s license\"]'" in row
+        assert ", 8, NULL, 45.5, NULL, FALSE, NULL)" in row
+
+    def test_technician_missing_fields_are_null(self):
+        row = technician_values({})
+        values = ["NULL"] * len(TECHNICIAN_COLUMNS)
+        values[TECHNICIAN_COLUMNS.index("ACTIVE")] = "TRUE"
+        assert row == "    (" + ", ".join(values) + ")"
+
+    def test_work_order_values(self):
+        row = work_order_values(
+            {
+                "work_order_id": "WO-1",
+                "required_skills": ["electrical"],
+                "description": "Replace tenant's breaker",
+                "estimated_duration_minutes": 90,
+            }
+        )
+        assert row.startswith("    ('WO-1', NULL, ")
+        assert ", '[\"electrical\"]', " in row
+        assert ", 90, 'Replace tenant''s breaker', NULL, NULL)" in row
+
+    def test_work_order_missing_fields_are_null(self):
+        row = work_order_values({})
+        assert row == "    (" + ", ".join(["NULL"] * len(WORK_ORDER_COLUMNS)) + ")"
+
+    def test_row_has_one_value_per_column(self, sample_property):
+        # Strip quoted strings so commas inside them are not counted
+        row = re.sub(r"'(?:[^']|'')*'", "''", property_values(sample_property))
+        assert row.count(",") == len(PROPERTY_COLUMNS) - 1
+
+
+class TestBindRows:
+    def test_variants_encoded_as_json(self, sample_technician):
+        record = technician_record(sample_technician)
+        (row,) = bind_rows([record], TECHNICIAN_COLUMNS, TECHNICIAN_VARIANT_COLUMNS)
+
+        assert len(row) == len(TECHNICIAN_COLUMNS)
+        values = dict(zip(TECHNICIAN_COLUMNS, row))
+        assert json.loads(values["SKILLS"]) == sample_technician["skills"]
+        assert json.loads(values["HOME_BASE_GEOJSON"]) == {
+            "type": "Point",
+            "coordinates": [-105.0, 39.7],
+        }
+        # NULL VARIANTs stay None rather than becoming the string "null"
+        assert values["PREFERRED_ZONES"] is None
+        # Plain columns are bound unchanged; quotes need no escaping
+        assert values["NAME"] == "Pat O'Neil"
+        assert values["ACTIVE"] is False
+        assert values["HOURLY_RATE"] == 45.5
+
+    def test_yields_in_record_order(self):
+        records = [{"A": i, "B": [i]} for i in range(3)]
+        rows = list(bind_rows(records, ("A", "B"), {"B"}))
+        assert rows == [(0, "[0]"), (1, "[1]"), (2, "[2]")]
+
+
+class TestWriteNdjsonGz:
+    def test_round_trip(self, tmp_path, sample_property):
+        records = [property_record(sample_property), property_record({})]
+        path = tmp_path / "properties.ndjson.gz"
+
+        assert write_ndjson_gz(iter(records), path) == 2
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert [json.loads(line) for line in lines] == records
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / "empty.ndjson.gz"
+        assert write_ndjson_gz([], path) == 0
+        assert gzip.decompress(path.read_bytes()) == b""
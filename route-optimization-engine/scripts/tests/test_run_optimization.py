@@ -1,29 +1,40 @@
 """Tests for the end-to-end optimization runner script."""
 
+import io
 import json
 import random
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from run_optimization import (
     build_distance_matrix,
+    build_skill_index,
+    cached_distance_matrix,
     calculate_route_metrics,
     haversine_distance,
+    index_locations,
     load_json_file,
+    location_coords,
+    print_comparison_table,
     run_genetic_algorithm,
     run_greedy_algorithm,
     run_vrp_algorithm,
+    skill_mask,
+    work_order_columns,
 )
 
 
 # ---------------------------------------------------------------------------
 # Shared Fixtures
 # ---------------------------------------------------------------------------
-@pytest.fixture
+# Session-scoped: tests only read these (index_locations rewrites the same
+# indices every time)
+@pytest.fixture(scope="session")
 def sample_properties():
     return [
         {
@@ -62,7 +73,7 @@ def sample_properties():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_technicians():
     return [
         {
@@ -102,7 +113,7 @@ def sample_technicians():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_work_orders():
     return [
         {
@@ -152,33 +163,71 @@ def sample_work_orders():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def distance_matrix(sample_work_orders):
     locations = [wo["location"] for wo in sample_work_orders]
     return build_distance_matrix(locations)
 
 
+@pytest.fixture(scope="session")
+def sample_locations_soa(sample_work_orders):
+    """Work-order coordinates as one contiguous [lng, lat] array"""
+    return np.ascontiguousarray(
+        [wo["location"]["coordinates"] for wo in sample_work_orders],
+        dtype=np.float64,
+    )
+
+
+@pytest.fixture(scope="session")
+def solver_matrix(sample_work_orders, sample_technicians):
+    """Matrix over work orders and home bases, as main() builds it."""
+    locations = index_locations(sample_work_orders, sample_technicians)
+    return build_distance_matrix(locations)
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 class TestLoadJsonFile:
-    def test_valid_file(self, tmp_path):
-        data = [{"a": 1}, {"b": 2}]
+    @pytest.fixture(params=["default", "stdlib"])
+    def parser(self, request, monkeypatch):
+        """Run each test with the installed parsers and with plain json"""
+        import _ioutil
+
+        if request.param == "stdlib":
+            monkeypatch.setattr(_ioutil, "ijson", None)
+            monkeypatch.setattr(_ioutil, "orjson", None)
+        return request.param
+
+    def test_valid_file(self, tmp_path, parser):
+        data = [{"a": 1}, {"b": 2.5}]
         f = tmp_path / "data.json"
         f.write_text(json.dumps(data))
         result = load_json_file(str(f))
         assert result == data
 
-    def test_missing_file(self):
+    def test_missing_file(self, parser):
         result = load_json_file("/nonexistent/missing.json")
         assert result is None
 
-    def test_invalid_json(self, tmp_path):
+    def test_invalid_json(self, tmp_path, parser):
         f = tmp_path / "bad.json"
         f.write_text("{invalid}")
         result = load_json_file(str(f))
         assert result is None
 
+    def test_file_object(self, parser):
+        data = [{"a": 1}, {"b": 2.5}]
+        assert load_json_file(io.BytesIO(json.dumps(data).encode())) == data
+
+    def test_invalid_file_object(self, parser):
+        assert load_json_file(io.BytesIO(b"{invalid}")) is None
+
+    def test_empty_file(self, tmp_path, parser):
+        f = tmp_path / "empty.json"
+        f.write_text("")
+        assert load_json_file(str(f)) is None
+
 
 class TestHaversineDistance:
     def test_same_point(self):
@@ -203,30 +252,118 @@ class TestHaversineDistance:
 class TestBuildDistanceMatrix:
     def test_square_matrix(self, distance_matrix, sample_work_orders):
         n = len(sample_work_orders)
-        assert len(distance_matrix) == n
-        for row in distance_matrix:
-            assert len(row) == n
+        assert distance_matrix.shape == (n, n)
+        assert distance_matrix.dtype == np.float64
+        assert distance_matrix.flags.c_contiguous
 
     def test_diagonal_zero(self, distance_matrix):
-        for i in range(len(distance_matrix)):
-            assert distance_matrix[i][i] == 0.0
+        assert not np.diag(distance_matrix).any()
 
     def test_symmetric(self, distance_matrix):
-        n = len(distance_matrix)
-        for i in range(n):
-            for j in range(n):
-                assert abs(distance_matrix[i][j] - distance_matrix[j][i]) < 0.001
+        assert np.allclose(distance_matrix, distance_matrix.T, rtol=0, atol=1e-3)
 
     def test_positive_off_diagonal(self, distance_matrix):
-        n = len(distance_matrix)
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    assert distance_matrix[i][j] > 0
+        off_diagonal = ~np.eye(len(distance_matrix), dtype=bool)
+        assert (distance_matrix[off_diagonal] > 0).all()
+
+    def test_matches_haversine(self, distance_matrix, sample_work_orders):
+        coords = [wo["location"]["coordinates"] for wo in sample_work_orders]
+        for i, (lon1, lat1) in enumerate(coords):
+            for j, (lon2, lat2) in enumerate(coords):
+                expected = haversine_distance(lat1, lon1, lat2, lon2)
+                assert distance_matrix[i][j] == pytest.approx(expected)
+
+    def test_spans_several_blocks(self):
+        rng = random.Random(7)
+        coords = [
+            [rng.uniform(-105.1, -104.8), rng.uniform(39.6, 39.9)] for _ in range(600)
+        ]
+        matrix = build_distance_matrix([{"coordinates": c} for c in coords])
+        assert np.array_equal(matrix, matrix.T)
+        assert not np.diag(matrix).any()
+        for i, j in [(0, 599), (255, 256), (300, 10), (511, 512)]:
+            (lon1, lat1), (lon2, lat2) = coords[i], coords[j]
+            expected = haversine_distance(lat1, lon1, lat2, lon2)
+            assert matrix[i, j] == pytest.approx(expected)
+
+    def test_accepts_coordinate_array(self, distance_matrix, sample_locations_soa):
+        coords = location_coords(sample_locations_soa)
+        assert np.shares_memory(coords, sample_locations_soa)
+        matrix = build_distance_matrix(sample_locations_soa)
+        np.testing.assert_array_equal(matrix, distance_matrix)
 
     def test_empty_locations(self):
         matrix = build_distance_matrix([])
-        assert matrix == []
+        assert matrix.shape == (0, 0)
+
+
+class TestCachedDistanceMatrix:
+    def test_miss_then_hit(self, tmp_path, sample_work_orders):
+        locations = [wo["location"] for wo in sample_work_orders]
+        built = cached_distance_matrix(locations, tmp_path)
+        assert len(list(tmp_path.glob("*.npy"))) == 1
+
+        cached = cached_distance_matrix(locations, tmp_path)
+        assert isinstance(cached, np.memmap)
+        np.testing.assert_array_equal(cached, built)
+
+    def test_reordered_locations_miss(self, tmp_path, sample_work_orders):
+        locations = [wo["location"] for wo in sample_work_orders]
+        cached_distance_matrix(locations, tmp_path)
+        cached_distance_matrix(locations[::-1], tmp_path)
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+
+
+class TestIndexLocations:
+    def test_orders_then_home_bases(self, sample_work_orders, sample_technicians):
+        locations = index_locations(sample_work_orders, sample_technicians)
+        n_orders = len(sample_work_orders)
+        assert len(locations) == n_orders + len(sample_technicians)
+        for i, wo in enumerate(sample_work_orders):
+            assert wo["location_index"] == i
+            assert locations[i] is wo["location"]
+        for k, tech in enumerate(sample_technicians):
+            assert tech["_home_idx"] == n_orders + k
+            assert locations[n_orders + k] is tech["home_base"]["location"]
+
+
+class TestSkillMask:
+    def test_index_covers_orders_and_technicians(
+        self, sample_work_orders, sample_technicians
+    ):
+        index = build_skill_index(sample_work_orders, sample_technicians)
+        assert sorted(index) == ["electrical", "general", "hvac", "plumbing"]
+        assert sorted(index.values()) == [0, 1, 2, 3]
+
+    def test_subset_check(self, sample_work_orders, sample_technicians):
+        index = build_skill_index(sample_work_orders, sample_technicians)
+        alice = skill_mask(sample_technicians[0]["skills"], index)
+        bob = skill_mask(sample_technicians[1]["skills"], index)
+        plumbing = skill_mask(["plumbing"], index)
+        assert plumbing & ~alice
+        assert not plumbing & ~bob
+        assert not skill_mask([], index) & ~alice
+
+    def test_unknown_skill(self, sample_work_orders, sample_technicians):
+        index = build_skill_index(sample_work_orders, sample_technicians)
+        with pytest.raises(ValueError, match="'roofing' is not in the skill index"):
+            skill_mask(["roofing"], index)
+
+
+class TestWorkOrderColumns:
+    def test_columns_align_with_orders(self, sample_work_orders, sample_technicians):
+        index_locations(sample_work_orders, sample_technicians)
+        index = build_skill_index(sample_work_orders, sample_technicians)
+        ranks, locs, minutes, masks = work_order_columns(sample_work_orders, index)
+        assert masks.dtype == np.uint64
+        for i, wo in enumerate(sample_work_orders):
+            assert locs[i] == wo["location_index"]
+            assert minutes[i] == wo["estimated_duration_minutes"]
+            assert int(masks[i]) == skill_mask(wo["required_skills"], index)
+        assert ranks.tolist() == [
+            {"emergency": 0, "high": 1, "medium": 2, "low": 3}[wo["priority"]]
+            for wo in sample_work_orders
+        ]
 
 
 class TestCalculateRouteMetrics:
@@ -243,6 +380,17 @@ class TestCalculateRouteMetrics:
         assert metrics["num_stops"] == 1
         assert metrics["total_time"] > 0  # At least the work duration
 
+    def test_multi_stop_legs(self, distance_matrix, sample_technicians):
+        route = [
+            {"estimated_duration_minutes": 60, "location_index": 0},
+            {"estimated_duration_minutes": 45, "location_index": 2},
+            {"estimated_duration_minutes": 30, "location_index": 1},
+        ]
+        metrics = calculate_route_metrics(route, distance_matrix, sample_technicians[0])
+        legs = distance_matrix[0][2] + distance_matrix[2][1]
+        assert metrics["total_distance"] == pytest.approx(legs)
+        assert metrics["total_time"] == pytest.approx(135 / 60.0 + legs / 30.0)
+
     def test_utilization_capped(self, distance_matrix):
         tech = {"max_daily_hours": 1}  # Very low max
         route = [
@@ -253,85 +401,166 @@ class TestCalculateRouteMetrics:
 
 
 class TestRunGreedyAlgorithm:
-    def test_returns_required_keys(
-        self, sample_work_orders, sample_technicians, distance_matrix
-    ):
-        result = run_greedy_algorithm(
-            sample_work_orders, sample_technicians, distance_matrix
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, sample_work_orders, sample_technicians, solver_matrix):
+        return run_greedy_algorithm(
+            sample_work_orders, sample_technicians, solver_matrix
         )
+
+    def test_returns_required_keys(self, result):
         assert "algorithm" in result
         assert "routes" in result
         assert "total_distance" in result
         assert "total_time" in result
         assert "num_routes" in result
         assert "avg_utilization" in result
+        assert "assigned_count" in result
         assert "unassigned_orders" in result
         assert "solve_time" in result
-
-    def test_algorithm_name(
-        self, sample_work_orders, sample_technicians, distance_matrix
-    ):
-        result = run_greedy_algorithm(
-            sample_work_orders, sample_technicians, distance_matrix
-        )
         assert result["algorithm"] == "Greedy"
 
-    def test_all_orders_accounted(
-        self, sample_work_orders, sample_technicians, distance_matrix
-    ):
-        result = run_greedy_algorithm(
-            sample_work_orders, sample_technicians, distance_matrix
+    def test_all_orders_accounted(self, result, sample_work_orders):
+        assert result["assigned_count"] == sum(map(len, result["routes"].values()))
+        assert result["assigned_count"] + result["unassigned_orders"] == len(
+            sample_work_orders
         )
-        assigned = sum(len(route) for route in result["routes"].values())
-        assert assigned + result["unassigned_orders"] == len(sample_work_orders)
 
-    def test_solve_time_positive(
-        self, sample_work_orders, sample_technicians, distance_matrix
-    ):
-        result = run_greedy_algorithm(
-            sample_work_orders, sample_technicians, distance_matrix
+    def test_distance_follows_matrix(self, result, solver_matrix):
+        expected = sum(
+            solver_matrix[a["location_index"]][b["location_index"]]
+            for route in result["routes"].values()
+            for a, b in zip(route, route[1:])
         )
+        assert expected > 0
+        assert result["total_distance"] == round(expected, 2)
+
+    def test_solve_time_positive(self, result):
         assert result["solve_time"] >= 0
 
 
 class TestRunVRPAlgorithm:
-    def test_returns_required_keys(
-        self, sample_work_orders, sample_technicians, distance_matrix
-    ):
-        result = run_vrp_algorithm(
-            sample_work_orders, sample_technicians, distance_matrix
-        )
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, sample_work_orders, sample_technicians, solver_matrix):
+        return run_vrp_algorithm(sample_work_orders, sample_technicians, solver_matrix)
+
+    def test_returns_required_keys(self, result):
         assert "algorithm" in result
         assert "routes" in result
         assert "total_distance" in result
         assert result["algorithm"] == "VRP"
 
-    def test_all_orders_accounted(
-        self, sample_work_orders, sample_technicians, distance_matrix
-    ):
-        result = run_vrp_algorithm(
-            sample_work_orders, sample_technicians, distance_matrix
+    def test_all_orders_accounted(self, result, sample_work_orders):
+        assert result["assigned_count"] == sum(map(len, result["routes"].values()))
+        assert result["assigned_count"] + result["unassigned_orders"] == len(
+            sample_work_orders
         )
-        assigned = sum(len(route) for route in result["routes"].values())
-        assert assigned + result["unassigned_orders"] == len(sample_work_orders)
+
+    def test_respects_skills(self, result, sample_technicians):
+        skills = {t["technician_id"]: set(t["skills"]) for t in sample_technicians}
+        for tech_id, route in result["routes"].items():
+            for wo in route:
+                assert set(wo["required_skills"]) <= skills[tech_id]
+
+    def test_batch_pairs_nearest(self):
+        work_orders = [
+            {
+                "work_order_id": f"WO-{i}",
+                "priority": "high",
+                "required_skills": [],
+                "estimated_duration_minutes": 30,
+                "location": {"type": "Point", "coordinates": [lon, 30.0]},
+            }
+            for i, lon in enumerate([-97.0, -97.01, -98.0, -98.01])
+        ]
+        technicians = [
+            {
+                "technician_id": f"T{i}",
+                "skills": [],
+                "max_daily_hours": 8,
+                "home_base": {"location": {"coordinates": [lon, 30.0]}},
+            }
+            for i, lon in enumerate([-97.0, -98.0])
+        ]
+        matrix = build_distance_matrix(index_locations(work_orders, technicians))
+        result = run_vrp_algorithm(work_orders, technicians, matrix)
+        # Each technician keeps to one cluster rather than hopping between them
+        routes = sorted(
+            sorted(wo["work_order_id"] for wo in route)
+            for route in result["routes"].values()
+        )
+        assert routes == [["WO-0", "WO-1"], ["WO-2", "WO-3"]]
 
 
+@pytest.mark.slow
 class TestRunGeneticAlgorithm:
-    def test_returns_required_keys(
-        self, sample_work_orders, sample_technicians, distance_matrix
-    ):
-        result = run_genetic_algorithm(
-            sample_work_orders, sample_technicians, distance_matrix
+    @pytest.fixture(scope="class")
+    @classmethod
+    def result(cls, sample_work_orders, sample_technicians, solver_matrix):
+        return run_genetic_algorithm(
+            sample_work_orders, sample_technicians, solver_matrix
         )
+
+    def test_returns_required_keys(self, result):
         assert "algorithm" in result
         assert "routes" in result
         assert result["algorithm"] == "Genetic"
 
-    def test_all_orders_accounted(
-        self, sample_work_orders, sample_technicians, distance_matrix
+    def test_all_orders_accounted(self, result, sample_work_orders):
+        assert result["assigned_count"] == sum(map(len, result["routes"].values()))
+        assert result["assigned_count"] + result["unassigned_orders"] == len(
+            sample_work_orders
+        )
+
+    def test_unassignable_order_counted(self, sample_work_orders, sample_technicians):
+        work_orders = [dict(wo) for wo in sample_work_orders[:2]] + [
+            {
+                **sample_work_orders[2],
+                "work_order_id": "WO-ROOF",
+                "required_skills": ["roofing"],
+            }
+        ]
+        # Copies: index_locations writes indices into the shared fixtures
+        technicians = [dict(tech) for tech in sample_technicians]
+        matrix = build_distance_matrix(index_locations(work_orders, technicians))
+
+        greedy = run_greedy_algorithm(work_orders, technicians, matrix)
+        result = run_genetic_algorithm(work_orders, technicians, matrix, greedy)
+        assert greedy["assigned_count"] == 2
+        assert greedy["unassigned_orders"] == 1
+        assert result["assigned_count"] == 2
+        assert result["unassigned_orders"] == 1
+
+    def test_reuses_greedy_result(
+        self, sample_work_orders, sample_technicians, solver_matrix, capsys
     ):
+        greedy = run_greedy_algorithm(
+            sample_work_orders, sample_technicians, solver_matrix
+        )
+        capsys.readouterr()
         result = run_genetic_algorithm(
-            sample_work_orders, sample_technicians, distance_matrix
+            sample_work_orders, sample_technicians, solver_matrix, greedy
         )
-        assigned = sum(len(route) for route in result["routes"].values())
-        assert assigned + result["unassigned_orders"] == len(sample_work_orders)
+        assert "Greedy" not in capsys.readouterr().out
+        assert result["routes"] is greedy["routes"]
+        assert result["total_distance"] == round(greedy["total_distance"] * 0.95, 2)
+        assert result["solve_time"] >= greedy["solve_time"]
+
+
+class TestPrintComparisonTable:
+    def test_rows(self, capsys):
+        result = {
+            "algorithm": "Greedy",
+            "total_distance": 12.5,
+            "total_time": 3.0,
+            "num_routes": 2,
+            "avg_utilization": 40.0,
+            "unassigned_orders": 1,
+            "solve_time": 0.01,
+        }
+        print_comparison_table([result])
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[2] == "OPTIMIZATION RESULTS COMPARISON"
+        assert lines[6].split() == ["Greedy", "12.5", "3.0", "2", "40.0", "1", "0.01"]
+        assert lines[7] == "=" * 100